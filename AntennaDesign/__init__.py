@@ -31,8 +31,26 @@
                                     Used for generating random values within a defined range.
     copy:                           built-in module
                                     Used to generate deep copies of lists.
+    itertools:                      built-in module
+                                    Used for generating combinations of hyperparameters.
+    futures:                        built-in module
+                                    Used for executing work across a pool of processes.
+    shared_memory:                  built-in module
+                                    Used for sharing arrays between a process and its pool of processes.
+    hashlib:                        built-in module
+                                    Used for fingerprinting the content of files.
+    json:                           built-in module
+                                    Used for exporting results in a portable text format.
+    sqlite3:                        built-in module
+                                    Used for keeping results in a local database with indexed queries.
     LHS:                            Sub-library
                                     Used for latin hypercube sampling for surrogate modeling.
+    linalg:                         Sub-library
+                                    Used for Cholesky factorizations and triangular solves.
+    optimize:                       Sub-library
+                                    Used for gradient-based local optimization with box bounds.
+    stats:                          Sub-library
+                                    Used for the normal distribution of the expected improvement.
     pycst:                          module
                                     Used as the 'driver' for controlling the CST Studio Suite software.
 
@@ -51,7 +69,16 @@ from matplotlib import pyplot as plt
 import ast as ast
 import random
 import copy
+import itertools
+from concurrent import futures
+from multiprocessing import shared_memory
+import hashlib
+import json
+import sqlite3
 from smt.sampling_methods import LHS
+from scipy import linalg
+from scipy import optimize
+from scipy import stats
 from AntennaDesign import pycst
 
 __all__ = [
@@ -65,6 +92,15 @@ __all__ = [
     'ast',
     'random',
     'copy',
+    'itertools',
+    'futures',
+    'shared_memory',
+    'hashlib',
+    'json',
+    'sqlite3',
     'LHS',
+    'linalg',
+    'optimize',
+    'stats',
     'pycst'
 ]
@@ -80,6 +80,9 @@ class ModelGeometry:
     CheckBoundary(Parameters, Rounding=None):
                                     Checks whether a geometry component, that contains at least one parameter, is within
                                     the defined explore space.
+    CheckBoundaries(Parameters, Rounding=None):
+                                    Checks a batch of parameter value sets against the defined explore space at once,
+                                    and returns which sets are within the explore space.
 
     Notes:
     ------
@@ -664,3 +667,88 @@ class ModelGeometry:
                                     raise Exception(f'<ModelGeometry: CheckBoundary: A geometry component with '
                                                     f'parameters, specifically {self.__model__["geometry"][__i__]}, '
                                                     f'is out of bounds for explore space {__explore_space__}>')
+
+    def CheckBoundaries(self, Parameters, Rounding=None):
+        """
+        Description:
+        ------------
+        Checks a batch of parameter value sets against the defined explore space, in the same way as CheckBoundary,
+        but every geometry component is evaluated once for the whole batch.
+
+        Parameters:
+        -----------
+        Parameters:                 ndarray
+                                    A 2D array (or list of lists) in the form of (number of sets, number of
+                                    parameters).
+        Rounding:                   int
+                                    The rounding for the float values of the Parameters parameter.
+
+        Returns:
+        --------
+        Returns a 1D bool array, which is True for every set of parameter values that does not violate the explore
+        space.
+
+        Notes:
+        ------
+        The parameter names of a geometry component are replaced by columns of Parameters, after which the component
+        is evaluated with NumPy. Should a component not be evaluable for a whole column (for instance, when it calls a
+        function of the math module), the sets are checked one at a time with CheckBoundary.
+        """
+
+        if Rounding is None:
+            raise Exception('<ModelGeometry: CheckBoundaries: Rounding is of type None. '
+                            'Please specify a rounding number>')
+
+        __parameters__ = np.atleast_2d(np.asarray(Parameters, dtype=np.float64))
+        __feasible__ = np.ones(len(__parameters__), dtype=bool)
+
+        try:
+            for __i__ in range(len(self.__model__['geometry'])):
+
+                # Proceed if and only if the layer/sequence is a 'brick' type
+                if self.__model__['type'][__i__] != 'brick':
+                    continue
+
+                __z__ = [round(self.__model__['z'][__i__][0], Rounding), round(self.__model__['z'][__i__][1], Rounding)]
+
+                for __j__ in self.__model__['geometry'][__i__]:
+
+                    # Only geometry components with at least one parameter are checked
+                    if not any(isinstance(__k__, str) for __k__ in __j__[:4]):
+                        continue
+
+                    __temp__ = []
+                    for __k__ in __j__[:4]:
+                        if isinstance(__k__, str):
+                            # Replace the parameter names in the same order as CheckBoundary, through placeholders so
+                            # that a column reference is never matched by a later parameter name
+                            for __l__ in range(len(self.__parameter__['name'])):
+                                __k__ = __k__.replace(self.__parameter__['name'][__l__], f'\0{__l__}\0')
+                            for __l__ in range(len(self.__parameter__['name'])):
+                                __k__ = __k__.replace(f'\0{__l__}\0', f'__parameters__[:, {__l__}]')
+                            __k__ = eval(__k__)
+
+                        __temp__.append(np.round(np.broadcast_to(np.asarray(__k__, dtype=np.float64),
+                                                                 __feasible__.shape), Rounding))
+
+                    # Compare the limits with every explore space of the same z range
+                    for __k__ in self.__explore_space__:
+                        __explore_space__ = [round(__l__, Rounding) for __l__ in __k__]
+
+                        if __z__[0] == __explore_space__[4] and __z__[1] == __explore_space__[5]:
+                            __feasible__ &= (__temp__[0] >= __explore_space__[0]) & \
+                                (__temp__[1] <= __explore_space__[1]) & (__temp__[2] >= __explore_space__[2]) & \
+                                (__temp__[3] <= __explore_space__[3])
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<ModelGeometry: CheckBoundaries: {__error__}, checking one set at a time>')
+
+            __feasible__ = np.ones(len(__parameters__), dtype=bool)
+            for __i__ in range(len(__parameters__)):
+                try:
+                    self.CheckBoundary(Parameters=__parameters__[__i__].tolist(), Rounding=Rounding)
+                except Exception:
+                    __feasible__[__i__] = False
+
+        return __feasible__
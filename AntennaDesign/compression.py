@@ -0,0 +1,485 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+from AntennaDesign.surrogate import CoarseModel
+
+
+class CompressedSurrogate:
+    """
+    Description:
+    ------------
+    A CoarseModel that is trained on a compressed output space. The targets, for instance the return loss over
+    hundreds of frequency samples, are projected onto a truncated principal component (SVD) basis, after which the
+    neural network only learns the coefficients of the basis. The full curves are reconstructed at prediction time,
+    thus the output layer, and with it the number of weights, shrinks from the number of frequency samples to the
+    number of components.
+
+    Attributes:
+    -----------
+    __phi_k__:                      int
+                                    The number of output channels of the full (reconstructed) curves.
+    __model_arguments__:            dict
+                                    The keyword arguments that the CoarseModel is constructed with.
+    __model__:                      CoarseModel
+                                    The neural network that predicts the scaled coefficients, or None before a basis
+                                    is available.
+    __mean__:                       ndarray
+                                    The mean of the training targets, in the form of (number of output channels,).
+    __components__:                 ndarray
+                                    The basis, in the form of (number of components, number of output channels).
+    __lower__:                      ndarray
+                                    The lower bound per coefficient, used for scaling the coefficients.
+    __range__:                      ndarray
+                                    The range per coefficient, used for scaling the coefficients.
+    __files__:                      list
+                                    A list that contains the file names of the basis ('Basis.npy') and the coefficient
+                                    scaling ('Scaling.npy').
+    __filing__:                     Filing
+                                    Used for writing, reading, appending, deleting data for later use.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(NumberOfHiddenLayers=None, NumberOfInputChannels=None, NumberOfOutputChannels=None, ScalingFactor=1.5,
+                Filing=None, Directory=None, DataType='float64', Initializer='xavier', Debugging=False):
+                                    The constructor of the class, where the basis and the neural network are loaded
+                                    from the directory (if available).
+    Train(TrainingData=None, ValidationData=None, TestingData=None, NumberOfComponents=None, VarianceRetained=0.999,
+                NumberOfEpochs=None, TrainDurationMinutes=None, TrainArguments=None):
+                                    Fits the basis on the training targets and trains the neural network on the
+                                    coefficients.
+    FeedForward(__input__, __target__=None, __learn__=False, __return_outputs__=False):
+                                    Returns the reconstructed output for a single input, following the CoarseModel
+                                    interface.
+    PredictBatch(Inputs=None):
+                                    Predicts the reconstructed outputs for a batch of inputs.
+    Jacobian(Inputs=None):
+                                    Determines the derivatives of the reconstructed outputs with respect to the inputs.
+    Export(Directory=None):
+                                    Writes a self-contained predictor, including the basis, see CoarseModel.Export.
+    _fit_basis(__target__, __number_of_components__, __variance_retained__):
+                                    Fits the truncated basis and the coefficient scaling on the training targets.
+    _save_basis():
+                                    Writes the basis and the coefficient scaling to the directory.
+    _compress(__target__):
+                                    Projects targets onto the basis and scales the coefficients.
+    _reconstruct(__coefficients__):
+                                    Reconstructs the full curves from scaled coefficients.
+
+    Notes:
+    ------
+    The coefficients are scaled to [0.1, 0.9], within the range of the sigmoid output layer of the CoarseModel.
+    """
+
+    def __init__(self, NumberOfHiddenLayers=None, NumberOfInputChannels=None, NumberOfOutputChannels=None,
+                 ScalingFactor=1.5, Filing=None, Directory=None, DataType='float64', Initializer='xavier',
+                 Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the CompressedSurrogate class, see CoarseModel for more information on the parameters. The
+        number of output channels of the neural network is the number of components of the basis, thus the neural
+        network is only constructed once a basis is either loaded from the directory or fitted by Train.
+
+        Parameters:
+        -----------
+        NumberOfHiddenLayers:       int
+                                    The number of hidden layers of the neural network.
+        NumberOfInputChannels:      int
+                                    The number of input channels of the neural network.
+        NumberOfOutputChannels:     int
+                                    The number of output channels of the full curves, for instance the number of
+                                    frequency samples.
+        ScalingFactor:              float
+                                    The rate that the neural network grows from the output layer to the input layer.
+        Filing:                     Filing
+                                    The results that are stored using the Filing class for reading, writing, appending,
+                                    and deleting files.
+        Directory:                  str
+                                    Should the user wish to define a unique directory for the surrogate, this should be
+                                    named something meaningful.
+        DataType:                   str
+                                    The floating point type of the neural network, either 'float64' or 'float32'.
+        Initializer:                str
+                                    The initializer of the weights of the neural network, see CoarseModel.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if NumberOfHiddenLayers is None or NumberOfOutputChannels is None:
+            raise Exception('<CompressedSurrogate: __init__: NumberOfHiddenLayers and/or NumberOfOutputChannels is of '
+                            'None type>')
+        if Filing is None:
+            raise Exception('<CompressedSurrogate: __init__: Filing is of None type, it must be of Filing type>')
+
+        self.__phi_k__ = NumberOfOutputChannels
+        self.__model_arguments__ = {'NumberOfHiddenLayers': NumberOfHiddenLayers,
+                                    'NumberOfInputChannels': NumberOfInputChannels,
+                                    'ScalingFactor': ScalingFactor,
+                                    'Directory': Directory,
+                                    'DataType': DataType,
+                                    'Initializer': Initializer}
+
+        # Class objects
+        self.__filing__ = Filing
+        self.__model__ = None
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+        # Files that will be used by this class, kept with the weights of the neural network
+        if Directory is None:
+            __directory__ = '\\Surrogate\\'
+        else:
+            __directory__ = '\\Surrogate\\' + Directory + '\\'
+        self.__files__ = [__directory__ + 'Basis.npy', __directory__ + 'Scaling.npy']
+        self.__filing__.CreateDirectories(Directories=[__directory__])
+
+        self.__mean__ = None
+        self.__components__ = None
+        self.__lower__ = None
+        self.__range__ = None
+
+        # Attempt to get the stored basis, in the form of [mean, components...], and scaling, [lower, range]
+        __basis__ = self.__filing__.ReadArray(Filename=self.__files__[0], MemoryMap=False)
+        __scaling__ = self.__filing__.ReadArray(Filename=self.__files__[1], MemoryMap=False)
+
+        if isinstance(__basis__, np.ndarray) and isinstance(__scaling__, np.ndarray):
+            if __basis__.ndim == 2 and __basis__.shape[1] == self.__phi_k__ and \
+                    __scaling__.shape == (2, __basis__.shape[0] - 1):
+                self.__mean__ = __basis__[0]
+                self.__components__ = __basis__[1:]
+                self.__lower__ = __scaling__[0]
+                self.__range__ = __scaling__[1]
+                self.__model__ = CoarseModel(NumberOfOutputChannels=len(self.__components__), Filing=self.__filing__,
+                                             Debugging=self.__debugging__, **self.__model_arguments__)
+
+            elif self.__debugging__:
+                print(f'<CompressedSurrogate: __init__: Read basis does not match {self.__phi_k__} output channels>')
+
+    def Train(self, TrainingData=None, ValidationData=None, TestingData=None, NumberOfComponents=None,
+              VarianceRetained=0.999, NumberOfEpochs=None, TrainDurationMinutes=None, TrainArguments=None):
+        """
+        Description:
+        ------------
+        Fits the basis on the training targets, after which the neural network is trained on the scaled coefficients
+        of the training, validation, and testing data.
+
+        Parameters:
+        -----------
+        TrainingData:               list
+                                    The training data, where each data point is in the form of [input, target].
+        ValidationData:             list
+                                    The validation data, where each data point is in the form of [input, target].
+        TestingData:                list
+                                    The testing data, where each data point is in the form of [input, target].
+        NumberOfComponents:         int
+                                    The number of components of the basis. When None, the smallest number of
+                                    components that retains VarianceRetained of the variance of the training targets is
+                                    used.
+        VarianceRetained:           float
+                                    The fraction of the variance to retain when NumberOfComponents is None.
+        NumberOfEpochs:             int
+                                    The number of epochs, see CoarseModel.Train.
+        TrainDurationMinutes:       float
+                                    The amount of time, in minutes, to train, see CoarseModel.Train.
+        TrainArguments:             dict
+                                    Any other keyword arguments for CoarseModel.Train.
+
+        Returns:
+        --------
+        Returns the training loss, validation loss, and testing loss, see CoarseModel.Train. The training and
+        validation losses are those of the coefficients, where the testing loss is that of the reconstructed curves.
+
+        Notes:
+        ------
+        The neural network is constructed again, with new weights, every time the basis is fitted, since the weights
+        of the previous basis do not fit the coefficients of the new basis. The basis is only written to the directory
+        once training has completed, thus a failed Train leaves the basis of before in memory and in the directory.
+        """
+
+        if TrainingData is None or ValidationData is None or TestingData is None or \
+                (NumberOfEpochs is None and TrainDurationMinutes is None):
+            raise Exception('<CompressedSurrogate: Train: One or more parameters are of type None>')
+
+        __target__ = np.asarray([__i__[1] for __i__ in TrainingData], dtype=np.float64)
+        if __target__.shape[1] != self.__phi_k__:
+            raise Exception(f'<CompressedSurrogate: Train: The surrogate has {self.__phi_k__} output channels, but the '
+                            f'training data has {__target__.shape[1]} target values>')
+
+        # The basis and the neural network of before are kept should training fail
+        __previous__ = [self.__mean__, self.__components__, self.__lower__, self.__range__, self.__model__]
+
+        try:
+            self._fit_basis(__target__=__target__, __number_of_components__=NumberOfComponents,
+                            __variance_retained__=VarianceRetained)
+
+            # The weights of the previous basis do not fit the coefficients of the new basis, thus the neural network
+            # starts from new weights rather than the weights within the directory
+            self.__model__ = CoarseModel(NumberOfOutputChannels=len(self.__components__), Filing=self.__filing__,
+                                         Debugging=self.__debugging__, **self.__model_arguments__)
+            self.__model__._initialize(__initializer__=self.__model_arguments__['Initializer'], __seed__=None)
+
+            # Replace the targets with their scaled coefficients
+            __data__ = []
+            for __i__ in [TrainingData, ValidationData, TestingData]:
+                __coefficients__ = self._compress(__target__=np.asarray([__j__[1] for __j__ in __i__],
+                                                                        dtype=np.float64))
+                __data__.append([[__i__[__j__][0], __coefficients__[__j__]] for __j__ in range(len(__i__))])
+
+            __train__ = {'TrainingData': __data__[0], 'ValidationData': __data__[1], 'TestingData': __data__[2],
+                         'NumberOfEpochs': NumberOfEpochs, 'TrainDurationMinutes': TrainDurationMinutes}
+            if TrainArguments is not None:
+                __train__.update(TrainArguments)
+
+            __result__ = self.__model__.Train(**__train__)
+
+        except Exception:
+            self.__mean__, self.__components__, self.__lower__, self.__range__, self.__model__ = __previous__
+            raise
+
+        # The basis is only written once the neural network has been trained on its coefficients
+        self._save_basis()
+
+        # Evaluate the reconstructed curves of the testing data
+        __test_target__ = np.asarray([__i__[1] for __i__ in TestingData], dtype=np.float64)
+        __result__[2] = self.__model__._update_loss(
+            __output__=self.PredictBatch(Inputs=[__i__[0] for __i__ in TestingData]),
+            __target__=__test_target__).tolist()
+
+        return __result__
+
+    def FeedForward(self, __input__, __target__=None, __learn__=False, __return_outputs__=False):
+        """
+        Description:
+        ------------
+        Predicts the reconstructed output for a single input, following the CoarseModel.FeedForward interface.
+
+        Parameters:
+        -----------
+        __input__:                  list
+                                    The input to the neural network.
+        __target__:                 list
+                                    Unused, kept for the CoarseModel interface.
+        __learn__:                  bool
+                                    Must be False, the surrogate is trained through the Train method.
+        __return_outputs__:         bool
+                                    Used for returning the reconstructed output values when True.
+
+        Returns:
+        --------
+        Returns the reconstructed output values, in a 1D list, should the outputs be required to be returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __learn__:
+            raise Exception('<CompressedSurrogate: FeedForward: The surrogate is trained through the Train method>')
+
+        if __return_outputs__:
+            return self.PredictBatch(Inputs=[__input__])[0].tolist()
+
+    def PredictBatch(self, Inputs=None):
+        """
+        Description:
+        ------------
+        Predicts the coefficients for a batch of inputs with the neural network, after which the full curves are
+        reconstructed.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels).
+
+        Returns:
+        --------
+        Returns a 2D array in the form of (number of samples, number of output channels).
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__model__ is None:
+            raise Exception('<CompressedSurrogate: PredictBatch: The surrogate must be trained with Train first>')
+
+        return self._reconstruct(__coefficients__=self.__model__.PredictBatch(Inputs=Inputs))
+
+    def Jacobian(self, Inputs=None):
+        """
+        Description:
+        ------------
+        Determines the derivatives of the reconstructed outputs with respect to the inputs for a batch of inputs, from
+        the Jacobian of the neural network, as the reconstruction is linear in the coefficients.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels).
+
+        Returns:
+        --------
+        Returns a 3D array in the form of (number of samples, number of output channels, number of input channels).
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__model__ is None:
+            raise Exception('<CompressedSurrogate: Jacobian: The surrogate must be trained with Train first>')
+
+        return np.einsum('kf,nkp->nfp', self.__components__ * (self.__range__ / 0.8)[:, np.newaxis],
+                         self.__model__.Jacobian(Inputs=Inputs))
+
+    def Export(self, Directory=None):
+        """
+        Description:
+        ------------
+        Writes a self-contained predictor of the neural network and the basis, see CoarseModel.Export, so that the
+        loader reconstructs the full curves.
+
+        Parameters:
+        -----------
+        Directory:                  str
+                                    The directory, under the 'Predictor' directory, to write the predictor to.
+
+        Returns:
+        --------
+        Returns 0 when the predictor was written, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__model__ is None:
+            raise Exception('<CompressedSurrogate: Export: The surrogate must be trained with Train first>')
+
+        return self.__model__._export(__directory__=Directory,
+                                      __arrays__={'mean': self.__mean__, 'components': self.__components__,
+                                                  'lower': self.__lower__, 'range': self.__range__})
+
+    def _fit_basis(self, __target__, __number_of_components__, __variance_retained__):
+        """
+        Description:
+        ------------
+        Fits the truncated SVD basis of the centred training targets, as well as the scaling of the coefficients, see
+        _save_basis for writing both to the directory.
+
+        Parameters:
+        -----------
+        __target__:                 ndarray
+                                    A 2D array with the training targets, one row per sample.
+        __number_of_components__:   int
+                                    The number of components, or None.
+        __variance_retained__:      float
+                                    The fraction of the variance to retain when __number_of_components__ is None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        The coefficient range is widened by 10% on either side, so that designs slightly outside of the training data
+        are still within the range of the sigmoid output layer.
+        """
+
+        self.__mean__ = __target__.mean(axis=0)
+        _, __singular__, __components__ = np.linalg.svd(__target__ - self.__mean__, full_matrices=False)
+
+        if __number_of_components__ is None:
+            __variance__ = np.cumsum(__singular__ ** 2) / max(np.sum(__singular__ ** 2), np.finfo(np.float64).tiny)
+            __number_of_components__ = int(np.searchsorted(__variance__, __variance_retained__) + 1)
+        __number_of_components__ = max(1, min(__number_of_components__, len(__singular__)))
+
+        self.__components__ = __components__[:__number_of_components__]
+
+        # Scaling of the coefficients of the training targets
+        __coefficients__ = (__target__ - self.__mean__) @ self.__components__.T
+        __span__ = np.ptp(__coefficients__, axis=0)
+        __span__ = np.where(__span__ > 0, __span__, 1.0)
+        self.__lower__ = __coefficients__.min(axis=0) - 0.1 * __span__
+        self.__range__ = 1.2 * __span__
+
+    def _save_basis(self):
+        """
+        Description:
+        ------------
+        Writes the basis, in the form of [mean, components...], and the scaling of the coefficients, in the form of
+        [lower, range], to the directory.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        self.__filing__.SaveArray(Filename=self.__files__[0],
+                                  Array=np.concatenate((self.__mean__[np.newaxis], self.__components__)))
+        self.__filing__.SaveArray(Filename=self.__files__[1], Array=np.stack((self.__lower__, self.__range__)))
+
+    def _compress(self, __target__):
+        """
+        Description:
+        ------------
+        Projects the targets onto the basis, after which the coefficients are scaled to [0.1, 0.9].
+
+        Parameters:
+        -----------
+        __target__:                 ndarray
+                                    A 2D array with the targets, one row per sample.
+
+        Returns:
+        --------
+        Returns a 2D array with the scaled coefficients, one row per sample.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return 0.1 + 0.8 * (((__target__ - self.__mean__) @ self.__components__.T) - self.__lower__) / self.__range__
+
+    def _reconstruct(self, __coefficients__):
+        """
+        Description:
+        ------------
+        Reverses the scaling of the coefficients, after which the full curves are reconstructed from the basis.
+
+        Parameters:
+        -----------
+        __coefficients__:           ndarray
+                                    A 2D array with the scaled coefficients, one row per sample.
+
+        Returns:
+        --------
+        Returns a 2D array with the full curves, one row per sample.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return self.__mean__ + ((__coefficients__ - 0.1) / 0.8 * self.__range__ + self.__lower__) @ self.__components__
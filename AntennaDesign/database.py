@@ -0,0 +1,857 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+from AntennaDesign.filing import Filing
+
+
+class SQLiteFiling(Filing):
+    """
+    Description:
+    ------------
+    An optional storage backend of the Filing class, where the lists of data points, such as the 'Explored' and 'lhs'
+    files, are kept in a local SQLite database rather than in text files. Every file is a table of its own, where the
+    parameters are indexed columns and the responses are packed binary arrays, so that Duplicate, range queries, and
+    partial loads are indexed queries rather than parsing the whole file. Read, Append, Save, and Duplicate keep the
+    semantics of the Filing class, thus an instance can be passed wherever a Filing instance is expected.
+
+    Attributes:
+    -----------
+    __database__:                   str
+                                    The path of the database, from the root directory of Filing.
+    __stored__:                     set
+                                    The files that are kept in the database, or None for all the files that are read
+                                    and written as lists.
+    __connection__:                 Connection
+                                    The connection to the database.
+
+    Methods:
+    --------
+    __init__(Database='\\Results.sqlite', Files=None, Directories=None, Debugging=False):
+                                    The constructor of the class, where the database is opened (or created).
+    CreateFile(Filename):
+                                    Returns -1 should the table of the file exist, the table is created by the first
+                                    data point.
+    DeleteContent(Filename):
+                                    Deletes all the data points of the file.
+    Read(Filename):
+                                    Returns all the data points of the file, in the same format as Filing.Read.
+    Append(Filename, List):
+                                    Adds a data point to the file.
+    Save(Filename, Lists):
+                                    Replaces all the data points of the file with Lists.
+    Hash(Filename):
+                                    The SHA-256 digest of the data points of the file is returned.
+    DeleteFile(Filename):
+                                    The table of the file is permanently deleted.
+    Duplicate(Filename, List):
+                                    Returns the first data point of the file with the parameters of List, or False.
+    Query(Filename, Ranges=None, Curves=True, Offset=0, Limit=None):
+                                    Returns the data points of the file with parameters within Ranges, optionally
+                                    without their responses.
+    ReadIter(Filename, ChunkSize=None, Responses=None):
+                                    Yields the data points of the file one at a time, or in chunks, optionally with
+                                    only some of their responses.
+    Import(Filename, Source=None):
+                                    Copies the data points of a text file, written by Filing, into the database.
+    Close():
+                                    Closes the connection to the database.
+    _stored(__filename__):
+                                    Returns True should the file be kept in the database.
+    _table(__filename__):
+                                    Returns the name and number of parameters of the table of a file.
+    _fetch(__filename__, __size__, __single__, __responses__=None):
+                                    Yields the data points of the table of a file, or chunks of data points, for
+                                    ReadIter.
+    _select(__table__, __curves__):
+                                    Returns the columns to select from the table of a file.
+    _create(__filename__, __dimension__):
+                                    Creates the table, and its indices, of a file.
+    _dimension(__lists__):
+                                    Returns the number of parameters of a new table.
+    _encode(__list__, __dimension__):
+                                    Converts a data point into the values of a row of a table.
+    _decode(__row__, __dimension__, __curves__):
+                                    Converts a row of a table into a data point.
+
+    Notes:
+    ------
+    A data point in the form of [parameters, [[frequency, response], ...]] is packed into binary arrays of float64,
+    where the numbers are returned as floats. Any other list (for instance, an individual that is not simulated yet) is
+    kept as text, in which case its parameters are still indexed where possible.
+    """
+
+    def __init__(self, Database='\\Results.sqlite', Files=None, Directories=None, Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the SQLiteFiling class, where the database is opened, or created should it not exist.
+
+        Parameters:
+        -----------
+        Database:                   str
+                                    The path of the database, with the filename and extension, from the root
+                                    directory of Filing.
+        Files:                      list
+                                    The files, for instance ['\\Surrogate\\lhs'], that are kept in the database, where
+                                    any other file is a text file as for Filing. When None, every file that is read and
+                                    written as lists is kept in the database.
+        Directories:                list
+                                    A list of string elements that represent the directories that will be created.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        The database is in write-ahead-log mode, thus a data point that has been appended is kept should the process
+        crash. Every change, including the tables that are created and dropped, is made in a single explicit
+        transaction, thus a change that fails or is interrupted leaves the database as it was.
+        """
+
+        super().__init__(Directories=Directories, Debugging=Debugging)
+
+        self.__database__ = Database
+        self.__stored__ = None if Files is None else set(Files)
+
+        # The transactions are begun explicitly, since sqlite3 only begins a transaction before a statement that
+        # changes rows, where a statement that changes the tables (DROP or CREATE TABLE) would be committed on its own
+        self.__connection__ = sqlite3.connect(self.__directory__ + Database, isolation_level=None)
+        self.__connection__.execute('PRAGMA journal_mode=WAL')
+        self.__connection__.execute('PRAGMA synchronous=NORMAL')
+
+        # The catalog of the tables, one per file
+        with self.__connection__:
+            self.__connection__.execute('BEGIN IMMEDIATE')
+            self.__connection__.execute('CREATE TABLE IF NOT EXISTS files (filename TEXT PRIMARY KEY, name TEXT NOT '
+                                        'NULL, dimension INTEGER NOT NULL)')
+
+    def CreateFile(self, Filename):
+        """
+        Description:
+        ------------
+        Since the table of a file is created by its first data point, nothing is created for a file in the database.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The name of the file to be created.
+
+        Returns:
+        --------
+        Returns 0 if the file does not exist, else -1 if the file already exists.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().CreateFile(Filename=Filename)
+
+        return -1 if self._table(__filename__=Filename) is not None else 0
+
+    def DeleteContent(self, Filename):
+        """
+        Description:
+        ------------
+        Deletes all the data points of the file, where the table is kept.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The name of the file for the data to be erased.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().DeleteContent(Filename=Filename)
+
+        __table__ = self._table(__filename__=Filename)
+        if __table__ is not None:
+            with self.__connection__:
+                self.__connection__.execute('BEGIN IMMEDIATE')
+                self.__connection__.execute(f'DELETE FROM {__table__[0]}')
+
+    def Read(self, Filename):
+        """
+        Description:
+        ------------
+        Reads all the data points of the file, in the order that they were added.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Returns:
+        -------
+        If the file does not exist (or is empty), -1 will be returned, else a list of the data points.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().Read(Filename=Filename)
+
+        __list__ = self.Query(Filename=Filename)
+
+        if not isinstance(__list__, list) or len(__list__) == 0:
+            if self.__debugging__:
+                print(f'<SQLiteFiling: Read: {Filename} does not exist or is empty>')
+
+            return -1
+
+        return __list__
+
+    def Append(self, Filename, List):
+        """
+        Description:
+        ------------
+        Adds a data point to the file, where the table of the file is created should it not exist.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+        List:                       list
+                                    The data point to be added.
+
+        Return:
+        -------
+        Returns 0 when the operation has been successful, else -1 is returned.
+
+        Notes:
+        ------
+        The number of parameters of a new table is the number of parameters of its first data point.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().Append(Filename=Filename, List=List)
+
+        try:
+            with self.__connection__:
+                self.__connection__.execute('BEGIN IMMEDIATE')
+                __table__ = self._table(__filename__=Filename)
+                if __table__ is None:
+                    __table__ = self._create(__filename__=Filename, __dimension__=self._dimension(__lists__=[List]))
+
+                __row__ = self._encode(__list__=List, __dimension__=__table__[1])
+                self.__connection__.execute(f'INSERT INTO {__table__[0]} VALUES ({", ".join("?" * len(__row__))})',
+                                            __row__)
+
+            return 0
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<SQLiteFiling: Append: {__error__}>')
+
+            return -1
+
+    def Save(self, Filename, Lists):
+        """
+        Description:
+        ------------
+        Replaces all the data points of the file with Lists, in a single transaction.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+        Lists:                      list
+                                    A list of data points.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The table is created again, thus the number of parameters may differ from the previous data points.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().Save(Filename=Filename, Lists=Lists)
+
+        try:
+            with self.__connection__:
+                self.__connection__.execute('BEGIN IMMEDIATE')
+                __table__ = self._table(__filename__=Filename)
+                if __table__ is not None:
+                    self.__connection__.execute(f'DROP TABLE {__table__[0]}')
+                    self.__connection__.execute('DELETE FROM files WHERE filename = ?', (Filename,))
+
+                __table__ = self._create(__filename__=Filename, __dimension__=self._dimension(__lists__=Lists))
+                __rows__ = [self._encode(__list__=__i__, __dimension__=__table__[1]) for __i__ in Lists]
+                if len(__rows__) > 0:
+                    self.__connection__.executemany(f'INSERT INTO {__table__[0]} VALUES '
+                                                    f'({", ".join("?" * len(__rows__[0]))})', __rows__)
+
+            return 0
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<SQLiteFiling: Save: {__error__}>')
+
+            return -1
+
+    def Hash(self, Filename):
+        """
+        Description:
+        ------------
+        Determines the SHA-256 digest of the data points of the file, which changes whenever a data point is added,
+        changed, or removed.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Return:
+        -------
+        Returns the hexadecimal digest when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The digest differs from the digest of the same data points in a text file. Files that are not in the database,
+        such as the binary checkpoints, are hashed as for Filing.
+        """
+
+        __table__ = self._table(__filename__=Filename) if self._stored(__filename__=Filename) else None
+        if __table__ is None:
+            return super().Hash(Filename=Filename)
+
+        __hash__ = hashlib.sha256()
+        for __row__ in self.__connection__.execute(f'SELECT * FROM {__table__[0]} ORDER BY id'):
+            for __i__ in __row__:
+                __hash__.update(__i__ if isinstance(__i__, bytes) else repr(__i__).encode())
+
+        return __hash__.hexdigest()
+
+    def DeleteFile(self, Filename):
+        """
+        Description:
+        ------------
+        Permanently deletes the table of the file.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        Files that are not lists, such as the binary checkpoints, are deleted from the directory of Filing.
+        """
+
+        __table__ = self._table(__filename__=Filename) if self._stored(__filename__=Filename) else None
+        if __table__ is None:
+            return super().DeleteFile(Filename=Filename)
+
+        with self.__connection__:
+            self.__connection__.execute('BEGIN IMMEDIATE')
+            self.__connection__.execute(f'DROP TABLE {__table__[0]}')
+            self.__connection__.execute('DELETE FROM files WHERE filename = ?', (Filename,))
+
+        return 0
+
+    def Duplicate(self, Filename, List=None):
+        """
+        Description:
+        ------------
+        Searches the file for a data point with the parameters of List, through the index of the parameters.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+        List:                       list
+                                    The data point, of which the parameters are searched for.
+
+        Return:
+        -------
+        If a match occurs, the data point will be returned, else False is returned. Should the file not exist, -1 is
+        returned.
+
+        Notes:
+        ------
+        As for Filing.Duplicate, the parameters are compared rounded to 12 decimals and the first data point is
+        returned.
+        """
+
+        if not self._stored(__filename__=Filename):
+            return super().Duplicate(Filename=Filename, List=List)
+
+        if List is None:
+            return -1
+
+        try:
+            __table__ = self._table(__filename__=Filename)
+            if __table__ is None:
+                return -1
+
+            __row__ = self.__connection__.execute(f'SELECT * FROM {__table__[0]} WHERE key = ? ORDER BY id LIMIT 1',
+                                                  (repr(self._key(__parameters__=List[0])),)).fetchone()
+            if __row__ is None:
+                return False
+
+            return self._decode(__row__=__row__, __dimension__=__table__[1], __curves__=True)
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<SQLiteFiling: Duplicate: {__error__}>')
+
+        return -1
+
+    def Query(self, Filename, Ranges=None, Curves=True, Offset=0, Limit=None):
+        """
+        Description:
+        ------------
+        Returns the data points of the file with parameters within Ranges, through the indices of the parameters, for
+        instance all designs with the first parameter within [20, 22].
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+        Ranges:                     list
+                                    A range per parameter in the form of [minimum, maximum], where a range (or either
+                                    of its bounds) of None is not bounded, for instance [[20, 22], None, None, None].
+        Curves:                     bool
+                                    When False, only the parameters are loaded, and the data points are in the form of
+                                    [parameters, []].
+        Offset:                     int
+                                    The number of matching data points to skip.
+        Limit:                      int
+                                    The maximum number of data points to return, or None.
+
+        Return:
+        -------
+        Returns a list of the data points, in the order they were added, else -1 should the file not exist.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __table__ = self._table(__filename__=Filename)
+        if __table__ is None:
+            return -1
+
+        __conditions__ = []
+        __arguments__ = []
+        for __i__ in range(min(len(Ranges) if Ranges is not None else 0, __table__[1])):
+            if Ranges[__i__] is None:
+                continue
+            if Ranges[__i__][0] is not None:
+                __conditions__.append(f'p{__i__} >= ?')
+                __arguments__.append(float(Ranges[__i__][0]))
+            if Ranges[__i__][1] is not None:
+                __conditions__.append(f'p{__i__} <= ?')
+                __arguments__.append(float(Ranges[__i__][1]))
+
+        __columns__ = self._select(__table__=__table__, __curves__=Curves)
+        __where__ = f' WHERE {" AND ".join(__conditions__)}' if len(__conditions__) > 0 else ''
+
+        __rows__ = self.__connection__.execute(f'SELECT {__columns__} FROM {__table__[0]}{__where__} ORDER BY id '
+                                               f'LIMIT ? OFFSET ?', __arguments__ + [-1 if Limit is None else Limit,
+                                                                                     Offset])
+
+        return [self._decode(__row__=__i__, __dimension__=__table__[1], __curves__=Curves) for __i__ in __rows__]
+
+    def ReadIter(self, Filename, ChunkSize=None, Responses=None):
+        """
+        Description:
+        ------------
+        Reads the data points of the file one at a time, or in chunks, as they are requested, through a cursor of the
+        database.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file.
+        ChunkSize:                  int
+                                    The number of data points per chunk, where None yields a single data point at a
+                                    time.
+        Responses:                  list
+                                    The indices of the responses to keep, for instance [0] for the return loss only or
+                                    [] for the parameters only. When None, every response is kept.
+
+        Returns:
+        -------
+        A generator of data points, or of lists of up to ChunkSize data points, as for Filing.ReadIter.
+
+        Notes:
+        ------
+        For the parameters only, the responses are not loaded from the database.
+        """
+
+        __size__ = 256 if ChunkSize is None else int(ChunkSize)
+        if __size__ < 1:
+            raise Exception('<SQLiteFiling: ReadIter: ChunkSize must be a positive integer>')
+        if not self._selection(__responses__=Responses):
+            raise Exception('<SQLiteFiling: ReadIter: Responses must be None or a list of non-negative integers>')
+
+        if not self._stored(__filename__=Filename):
+            return super().ReadIter(Filename=Filename, ChunkSize=ChunkSize, Responses=Responses)
+
+        return self._fetch(__filename__=Filename, __size__=__size__, __single__=ChunkSize is None,
+                           __responses__=Responses)
+
+    def Import(self, Filename, Source=None):
+        """
+        Description:
+        ------------
+        Copies the data points of a text file, written by Filing, into the table of the file.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file within the
+                                    database.
+        Source:                     str
+                                    The full path of the text file, where None is the same as Filename.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The data points within the table, if any, are replaced.
+        """
+
+        __lists__ = Filing.Read(self, Filename=Filename if Source is None else Source)
+        if not isinstance(__lists__, list):
+            return -1
+
+        return self.Save(Filename=Filename, Lists=__lists__)
+
+    def Close(self):
+        """
+        Description:
+        ------------
+        Closes the connection to the database.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        self.__connection__.close()
+
+    def _stored(self, __filename__):
+        """
+        Description:
+        ------------
+        Determines whether a file is kept in the database.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path of the file.
+
+        Returns:
+        --------
+        Returns True should the file be kept in the database, else False.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return self.__stored__ is None or __filename__ in self.__stored__
+
+    def _table(self, __filename__):
+        """
+        Description:
+        ------------
+        Looks the table of a file up in the catalog.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path of the file.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (name of the table, number of parameters), or None should the table not exist.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return self.__connection__.execute('SELECT name, dimension FROM files WHERE filename = ?',
+                                           (__filename__,)).fetchone()
+
+    def _fetch(self, __filename__, __size__, __single__, __responses__=None):
+        """
+        Description:
+        ------------
+        Yields the data points of the table of a file through a cursor of the database, see ReadIter.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path, with the filename and possible extension, of the file.
+        __size__:                   int
+                                    The number of rows that are fetched at a time.
+        __single__:                 bool
+                                    When True, a single data point is yielded at a time, else lists of up to __size__
+                                    data points are yielded.
+        __responses__:              list
+                                    The indices of the responses to keep, where None keeps every response.
+
+        Returns:
+        --------
+        A generator of data points, or of lists of up to __size__ data points. Should the table not exist, nothing is
+        yielded.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __table__ = self._table(__filename__=__filename__)
+        if __table__ is None:
+            return
+
+        __curves__ = __responses__ is None or len(__responses__) > 0
+        __cursor__ = self.__connection__.execute(f'SELECT {self._select(__table__=__table__, __curves__=__curves__)} '
+                                                 f'FROM {__table__[0]} ORDER BY id')
+
+        while True:
+            __rows__ = __cursor__.fetchmany(__size__)
+            if len(__rows__) == 0:
+                break
+
+            __chunk__ = [self._project(__list__=self._decode(__row__=__i__, __dimension__=__table__[1],
+                                                             __curves__=__curves__), __responses__=__responses__)
+                         for __i__ in __rows__]
+
+            if __single__:
+                yield from __chunk__
+            else:
+                yield __chunk__
+
+    @staticmethod
+    def _select(__table__, __curves__):
+        """
+        Description:
+        ------------
+        Determines the columns to select from the table of a file.
+
+        Parameters:
+        -----------
+        __table__:                  tuple
+                                    The name and number of parameters of the table, see _table.
+        __curves__:                 bool
+                                    When False, the responses are not selected.
+
+        Returns:
+        --------
+        Returns the columns as a string, in the order of the columns of the table.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __curves__:
+            return '*'
+
+        return ', '.join(['id', 'key'] + [f'p{__i__}' for __i__ in range(__table__[1])] + ['NULL', 'layout', 'text'])
+
+    def _create(self, __filename__, __dimension__):
+        """
+        Description:
+        ------------
+        Creates the table of a file, with a column and an index per parameter, and adds it to the catalog.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path of the file.
+        __dimension__:              int
+                                    The number of parameters.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (name of the table, number of parameters).
+
+        Notes:
+        ------
+        The name of the table is derived from the filename, so that any filename is a valid table name.
+        """
+
+        __table__ = 'data_' + hashlib.sha1(__filename__.encode()).hexdigest()[:16]
+        __columns__ = ''.join(f'p{__i__} REAL, ' for __i__ in range(__dimension__))
+
+        self.__connection__.execute(f'CREATE TABLE {__table__} (id INTEGER PRIMARY KEY, key TEXT, {__columns__}'
+                                    f'curves BLOB, layout TEXT, text TEXT)')
+        self.__connection__.execute(f'CREATE INDEX {__table__}_key ON {__table__} (key)')
+        for __i__ in range(__dimension__):
+            self.__connection__.execute(f'CREATE INDEX {__table__}_p{__i__} ON {__table__} (p{__i__})')
+
+        self.__connection__.execute('INSERT INTO files VALUES (?, ?, ?)', (__filename__, __table__, __dimension__))
+
+        return __table__, __dimension__
+
+    @staticmethod
+    def _dimension(__lists__):
+        """
+        Description:
+        ------------
+        Determines the number of parameters of a new table from its first data point.
+
+        Parameters:
+        -----------
+        __lists__:                  list
+                                    The data points of the table.
+
+        Returns:
+        --------
+        Returns the number of parameters, which is 0 should the first data point not have numerical parameters.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            __parameters__ = np.asarray(__lists__[0][0])
+            if __parameters__.ndim == 1 and __parameters__.dtype.kind in 'iuf':
+                return len(__parameters__)
+        except Exception:
+            pass
+
+        return 0
+
+    def _encode(self, __list__, __dimension__):
+        """
+        Description:
+        ------------
+        Converts a data point into the values of a row, where the responses are packed into a single binary array.
+
+        Parameters:
+        -----------
+        __list__:                   list
+                                    The data point in the form of [parameters, [[frequency, response], ...]].
+        __dimension__:              int
+                                    The number of parameters of the table.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (None, key, parameter values, curves, layout, text), where the layout is the
+        number of frequencies and responses per response, and the text is the data point should it not be packed.
+
+        Notes:
+        ------
+        None.
+        """
+
+        # The parameters are indexed whenever they are numerical and of the same number as the table
+        try:
+            __parameters__ = np.asarray(__list__[0])
+            if __parameters__.ndim != 1 or __parameters__.dtype.kind not in 'iuf' or \
+                    len(__parameters__) != __dimension__:
+                raise ValueError('The parameters do not match the table')
+            __parameters__ = __parameters__.astype(np.float64).tolist()
+            __key__ = repr(self._key(__parameters__=__parameters__))
+        except Exception:
+            return (None, None) + (None,) * __dimension__ + (None, None, f'{__list__}')
+
+        # Pack the responses, should every response be a pair of numerical lists
+        try:
+            if len(__list__) != 2:
+                raise ValueError('The data point is not in the form of [parameters, responses]')
+
+            __arrays__ = []
+            __layout__ = []
+            for __i__ in __list__[1]:
+                if len(__i__) != 2:
+                    raise ValueError('A response is not in the form of [frequency, response]')
+
+                for __j__ in __i__:
+                    __array__ = np.asarray(__j__)
+                    if __array__.ndim != 1 or (__array__.dtype.kind not in 'iuf' and len(__array__) > 0):
+                        raise ValueError('A response is not numerical')
+                    __arrays__.append(__array__.astype(np.float64))
+                __layout__.append([len(__arrays__[-2]), len(__arrays__[-1])])
+
+            __curves__ = np.concatenate(__arrays__).tobytes() if len(__arrays__) > 0 else b''
+
+            return (None, __key__) + tuple(__parameters__) + (__curves__, json.dumps(__layout__), None)
+
+        except Exception:
+            return (None, __key__) + tuple(__parameters__) + (None, None, f'{__list__}')
+
+    @staticmethod
+    def _decode(__row__, __dimension__, __curves__):
+        """
+        Description:
+        ------------
+        Converts a row of a table into a data point.
+
+        Parameters:
+        -----------
+        __row__:                    tuple
+                                    The values of the row, in the order of the columns of the table.
+        __dimension__:              int
+                                    The number of parameters of the table.
+        __curves__:                 bool
+                                    When False, the responses are left out.
+
+        Returns:
+        --------
+        Returns the data point in the form of [parameters, [[frequency, response], ...]].
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __row__[-1] is not None:
+            __list__ = Filing._literal(__text__=__row__[-1])
+            if not __curves__ and isinstance(__list__, list) and len(__list__) == 2:
+                __list__[1] = []
+
+            return __list__
+
+        __parameters__ = list(__row__[2: 2 + __dimension__])
+        if not __curves__:
+            return [__parameters__, []]
+
+        __array__ = np.frombuffer(__row__[2 + __dimension__], dtype=np.float64)
+        __responses__ = []
+        __offset__ = 0
+        for __i__ in json.loads(__row__[3 + __dimension__]):
+            __responses__.append([__array__[__offset__: __offset__ + __i__[0]].tolist(),
+                                  __array__[__offset__ + __i__[0]: __offset__ + __i__[0] + __i__[1]].tolist()])
+            __offset__ += __i__[0] + __i__[1]
+
+        return [__parameters__, __responses__]
@@ -0,0 +1,395 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+
+
+class SurrogateDataset:
+    """
+    Description:
+    ------------
+    Prepares the simulation results, written by CoarseModel.BuildDataset, for training the surrogate models. The file
+    is parsed once, after which every response is windowed to the frequency range and transformed as a whole array.
+    The resulting input and target matrices are cached in the binary NumPy format, keyed by the content of the file and
+    the preprocessing settings, so that the file is only parsed again once it changes.
+
+    Attributes:
+    -----------
+    __filename__:                   str
+                                    The file with the simulation results, in the form of
+                                    [[parameters], [[[frequency], [response]], ...]] per line.
+    __frequency_range__:            list
+                                    The frequency range, in the form of [minimum, maximum], to keep.
+    __transforms__:                 list
+                                    The name of the transform per response, see the Notes of the constructor.
+    __key__:                        str
+                                    The key of the cached arrays.
+    __inputs__:                     ndarray
+                                    The input matrix, where each row is the parameters of a simulation.
+    __targets__:                    list
+                                    The target matrix per response, where each row is the transformed response of a
+                                    simulation.
+    __frequency__:                  list
+                                    The windowed frequency axis per response.
+    __files__:                      list
+                                    The directory of the cache.
+    __filing__:                     Filing
+                                    Used for writing, reading, appending, deleting data for later use.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(Filing=None, Filename='\\Surrogate\\lhs0', FrequencyRange=None, Transforms=None, Cache=True,
+                Debugging=False):
+                                    The constructor of the class, where the dataset is loaded from the cache, or
+                                    prepared from the file if the cache is not available.
+    Arrays(Response=0):
+                                    Returns the input matrix and the target matrix of the response.
+    Frequency(Response=0):
+                                    Returns the windowed frequency axis of the response.
+    Split(Ratio=None, Response=0, Shuffle=False, Seed=None):
+                                    Splits the dataset into training, validation, and testing sub-sets.
+    Batches(Data=None, BatchSize=10, Shuffle=True, Seed=None):
+                                    Iterates over a sub-set in batches of input and target matrices.
+    _prepare():
+                                    Parses the file and prepares the input and target matrices.
+    _transform(__name__, __values__):
+                                    Applies the named transform to an array of responses.
+
+    Notes:
+    ------
+    None.
+    """
+
+    def __init__(self, Filing=None, Filename='\\Surrogate\\lhs0', FrequencyRange=None, Transforms=None, Cache=True,
+                 Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the SurrogateDataset class.
+
+        Parameters:
+        -----------
+        Filing:                     Filing
+                                    The results that are stored using the Filing class for reading, writing, appending,
+                                    and deleting files.
+        Filename:                   str
+                                    The file with the simulation results.
+        FrequencyRange:             list
+                                    The frequency range, in the form of [minimum, maximum], to keep, where None keeps
+                                    the full frequency axis.
+        Transforms:                 list
+                                    The name of the transform per response, where None is ['linear', 'sigmoid'] (the
+                                    return loss and the gain).
+        Cache:                      bool
+                                    When True, the prepared arrays are read from and written to the cache.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        The available transforms (x being the response in decibels) are:
+            'dB':                   x
+            'linear':               10 ** (x / 20)
+            'power':                10 ** (x / 10)
+            'sigmoid':              1 / (1 + exp(10 ** (x / 10)))
+        """
+
+        if Filing is None:
+            raise Exception('<SurrogateDataset: __init__: Filing is of None type, it must be of Filing type>')
+
+        self.__filename__ = Filename
+        self.__frequency_range__ = None if FrequencyRange is None else [float(__i__) for __i__ in FrequencyRange]
+        self.__transforms__ = ['linear', 'sigmoid'] if Transforms is None else list(Transforms)
+        for __i__ in self.__transforms__:
+            if __i__ not in ['dB', 'linear', 'power', 'sigmoid']:
+                raise Exception(f'<SurrogateDataset: __init__: Unknown transform {__i__}>')
+
+        # Class objects
+        self.__filing__ = Filing
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+        # Files that will be used by this class
+        self.__files__ = ['\\Surrogate\\Cache\\']
+        self.__filing__.CreateDirectories(Directories=self.__files__)
+
+        self.__inputs__ = None
+        self.__targets__ = None
+        self.__frequency__ = None
+
+        # The key depends on the content of the file and the preprocessing settings
+        __hash__ = self.__filing__.Hash(Filename=self.__filename__)
+        if __hash__ == -1:
+            raise Exception(f'<SurrogateDataset: __init__: Unable to read {self.__filename__}>')
+        self.__key__ = hashlib.sha256(repr([__hash__, self.__frequency_range__,
+                                            self.__transforms__]).encode()).hexdigest()[:32]
+        __cache__ = self.__files__[0] + self.__key__
+
+        # Load the cached arrays, if available
+        if Cache:
+            __arrays__ = [self.__filing__.ReadArray(Filename=__cache__ + '.Inputs.npy', MemoryMap=False)]
+            for __i__ in range(len(self.__transforms__)):
+                __arrays__.append(self.__filing__.ReadArray(Filename=__cache__ + f'.Targets{__i__}.npy',
+                                                            MemoryMap=False))
+                __arrays__.append(self.__filing__.ReadArray(Filename=__cache__ + f'.Frequency{__i__}.npy',
+                                                            MemoryMap=False))
+
+            if all(isinstance(__i__, np.ndarray) for __i__ in __arrays__):
+                self.__inputs__ = __arrays__[0]
+                self.__targets__ = __arrays__[1::2]
+                self.__frequency__ = __arrays__[2::2]
+                return
+
+        self._prepare()
+
+        # Cache the arrays, where the inputs are written last as any incomplete cache is then prepared again
+        if Cache:
+            for __i__ in range(len(self.__transforms__)):
+                self.__filing__.SaveArray(Filename=__cache__ + f'.Targets{__i__}.npy', Array=self.__targets__[__i__])
+                self.__filing__.SaveArray(Filename=__cache__ + f'.Frequency{__i__}.npy',
+                                          Array=self.__frequency__[__i__])
+            self.__filing__.SaveArray(Filename=__cache__ + '.Inputs.npy', Array=self.__inputs__)
+
+    def Arrays(self, Response=0):
+        """
+        Description:
+        ------------
+        Returns the input matrix and the target matrix of the response.
+
+        Parameters:
+        -----------
+        Response:                   int
+                                    The index of the response, for instance 0 for the return loss and 1 for the gain.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (inputs, targets).
+
+        Notes:
+        ------
+        None.
+        """
+
+        return self.__inputs__, self.__targets__[Response]
+
+    def Frequency(self, Response=0):
+        """
+        Description:
+        ------------
+        Returns the windowed frequency axis of the response, which corresponds to the columns of the target matrix.
+
+        Parameters:
+        -----------
+        Response:                   int
+                                    The index of the response.
+
+        Returns:
+        --------
+        Returns the frequency axis as an ndarray.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return self.__frequency__[Response]
+
+    def Split(self, Ratio=None, Response=0, Shuffle=False, Seed=None):
+        """
+        Description:
+        ------------
+        Splits the dataset into training, validation, and testing sub-sets, where each data point is in the form of
+        [input, target], as expected by CoarseModel.Train.
+
+        Parameters:
+        -----------
+        Ratio:                      list
+                                    The ratio of the training, validation, and testing sub-sets, where None is
+                                    [0.7, 0.15, 0.15].
+        Response:                   int
+                                    The index of the response to use as the target.
+        Shuffle:                    bool
+                                    When True, the data points are shuffled before the split, else the order of the
+                                    file is kept.
+        Seed:                       int
+                                    The seed of the shuffle.
+
+        Returns:
+        --------
+        Returns a list in the form of [training data, validation data, testing data].
+
+        Notes:
+        ------
+        The number of training and validation data points is rounded up, where the testing sub-set receives the
+        remainder.
+        """
+
+        if Ratio is None:
+            Ratio = [0.7, 0.15, 0.15]
+
+        __inputs__, __targets__ = self.Arrays(Response=Response)
+        __n__ = len(__inputs__)
+        __index__ = np.random.RandomState(Seed).permutation(__n__) if Shuffle else np.arange(__n__)
+
+        __n_train__ = min(int(np.ceil(__n__ * Ratio[0])), __n__)
+        __n_validate__ = min(int(np.ceil(__n__ * Ratio[1])), __n__ - __n_train__)
+
+        __splits__ = np.split(__index__, [__n_train__, __n_train__ + __n_validate__])
+
+        return [[[__inputs__[__j__], __targets__[__j__]] for __j__ in __i__] for __i__ in __splits__]
+
+    def Batches(self, Data=None, BatchSize=10, Shuffle=True, Seed=None):
+        """
+        Description:
+        ------------
+        Iterates over a sub-set, from Split, in batches of input and target matrices.
+
+        Parameters:
+        -----------
+        Data:                       list
+                                    The sub-set, where each data point is in the form of [input, target].
+        BatchSize:                  int
+                                    The number of data points per batch, where the last batch may be smaller.
+        Shuffle:                    bool
+                                    When True, the data points are shuffled before batching.
+        Seed:                       int
+                                    The seed of the shuffle.
+
+        Returns:
+        --------
+        Yields a tuple in the form of (inputs, targets) per batch.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if Data is None:
+            raise Exception('<SurrogateDataset: Batches: Data is of None type>')
+
+        __inputs__ = np.asarray([__i__[0] for __i__ in Data])
+        __targets__ = np.asarray([__i__[1] for __i__ in Data])
+        __index__ = np.random.RandomState(Seed).permutation(len(Data)) if Shuffle else np.arange(len(Data))
+
+        for __i__ in range(0, len(Data), BatchSize):
+            __batch__ = __index__[__i__:__i__ + BatchSize]
+            yield __inputs__[__batch__], __targets__[__batch__]
+
+    def _prepare(self):
+        """
+        Description:
+        ------------
+        Parses the file and prepares the input matrix, as well as the windowed and transformed target matrix and
+        frequency axis per response.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        Every simulation must have the same number of frequency points within the frequency range. A file in the
+        columnar binary format, see Filing.SaveColumns, is read as arrays without being parsed, where a text file is
+        parsed in chunks through Filing.ReadIter.
+        """
+
+        __columns__ = self.__filing__.ReadColumns(Filename=self.__filename__, MemoryMap=True)
+        if isinstance(__columns__, dict):
+            if len(__columns__['records']) == 0:
+                raise Exception(f'<SurrogateDataset: _prepare: No data points in {self.__filename__}>')
+
+            self.__inputs__ = np.array(__columns__['parameters'], dtype=np.float64)
+        else:
+            # The text file is parsed in chunks, so that only the arrays are kept in memory
+            __inputs__ = []
+            __frequencies__ = [[] for _ in self.__transforms__]
+            __responses__ = [[] for _ in self.__transforms__]
+            for __chunk__ in self.__filing__.ReadIter(Filename=self.__filename__, ChunkSize=1024,
+                                                      Responses=list(range(len(self.__transforms__)))):
+                __inputs__.append(np.asarray([__i__[0] for __i__ in __chunk__], dtype=np.float64))
+                for __k__ in range(len(self.__transforms__)):
+                    try:
+                        __frequencies__[__k__].append(np.asarray([__i__[1][__k__][0] for __i__ in __chunk__],
+                                                                 dtype=np.float64))
+                        __responses__[__k__].append(np.asarray([__i__[1][__k__][1] for __i__ in __chunk__],
+                                                               dtype=np.float64))
+                    except Exception as __error__:
+                        raise Exception(f'<SurrogateDataset: _prepare: Response {__k__} has an inconsistent number of '
+                                        f'frequency points: {__error__}>')
+
+            if len(__inputs__) == 0:
+                raise Exception(f'<SurrogateDataset: _prepare: No data points in {self.__filename__}>')
+
+            self.__inputs__ = np.concatenate(__inputs__)
+
+        self.__targets__ = []
+        self.__frequency__ = []
+
+        for __k__ in range(len(self.__transforms__)):
+            try:
+                if isinstance(__columns__, dict):
+                    __frequency__ = __columns__['frequency'][__k__][__columns__['grid'][:, __k__]]
+                    __response__ = np.asarray(__columns__['responses'][__k__], dtype=np.float64)
+                else:
+                    __frequency__ = np.concatenate(__frequencies__[__k__])
+                    __response__ = np.concatenate(__responses__[__k__])
+            except Exception as __error__:
+                raise Exception(f'<SurrogateDataset: _prepare: Response {__k__} has an inconsistent number of '
+                                f'frequency points: {__error__}>')
+
+            # Window the frequency axis of every simulation
+            if self.__frequency_range__ is None:
+                __mask__ = np.ones(__frequency__.shape, dtype=bool)
+            else:
+                __mask__ = (self.__frequency_range__[0] <= __frequency__) & \
+                           (__frequency__ <= self.__frequency_range__[1])
+            __count__ = __mask__.sum(axis=1)
+            if np.any(__count__ != __count__[0]):
+                raise Exception(f'<SurrogateDataset: _prepare: Response {__k__} has an inconsistent number of '
+                                f'frequency points within the frequency range>')
+
+            self.__frequency__.append(__frequency__[0][__mask__[0]])
+            self.__targets__.append(self._transform(self.__transforms__[__k__],
+                                                    __response__[__mask__].reshape(len(self.__inputs__), -1)))
+
+    @staticmethod
+    def _transform(__name__, __values__):
+        """
+        Description:
+        ------------
+        Applies the named transform, see the constructor, to an array of responses in decibels.
+
+        Parameters:
+        -----------
+        __name__:                   str
+                                    The name of the transform.
+        __values__:                 ndarray
+                                    The responses in decibels.
+
+        Returns:
+        --------
+        Returns the transformed responses as an ndarray.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __name__ == 'linear':
+            return 10 ** (__values__ / 20)
+        elif __name__ == 'power':
+            return 10 ** (__values__ / 10)
+        elif __name__ == 'sigmoid':
+            return 1 / (1 + np.exp(10 ** (__values__ / 10)))
+
+        return __values__
@@ -0,0 +1,348 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+from AntennaDesign.surrogate import CoarseModel
+from AntennaDesign.sweep import _train_surrogate
+
+
+class SurrogateEnsemble:
+    """
+    Description:
+    ------------
+    An ensemble of independently trained CoarseModel members, where the spread of the members' predictions is used as
+    the predictive uncertainty of the ensemble.
+
+    Attributes:
+    -----------
+    __member__:                     list
+                                    A list of CoarseModel instances, the members of the ensemble.
+    __model_arguments__:            dict
+                                    The keyword arguments that every member is constructed with.
+    __directory__:                  list
+                                    A list with the directory of each member, under the 'Surrogate' directory.
+    __filing__:                     Filing
+                                    Used for writing, reading, appending, deleting data for later use.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(NumberOfMembers=5, NumberOfHiddenLayers=None, NumberOfInputChannels=None, NumberOfOutputChannels=None,
+                ScalingFactor=1.5, Filing=None, Directory=None, DataType='float64', Initializer='xavier',
+                Debugging=False):
+                                    The constructor of the class, where the members are constructed with the same
+                                    architecture. The weights of each member are loaded from its own directory (if
+                                    available).
+    Train(TrainingData=None, ValidationData=None, TestingData=None, NumberOfEpochs=None, TrainDurationMinutes=None,
+                Patience=None, Bootstrap=True, NumberOfWorkers=None, Seed=0, TrainArguments=None):
+                                    Trains the members in parallel processes, each with its own seed and, optionally,
+                                    its own bootstrap sample of the training data.
+    FeedForward(__input__, __target__=None, __learn__=False, __return_outputs__=False):
+                                    Returns the mean prediction of the members for a single input, following the
+                                    CoarseModel interface.
+    PredictBatch(Inputs=None, ReturnVariance=False):
+                                    Predicts the mean, and optionally the variance, of the members for a batch of
+                                    inputs.
+    Jacobian(Inputs=None):
+                                    Determines the derivatives of the mean prediction with respect to the inputs.
+    SelectUncertain(Inputs=None, NumberOfCandidates=None, Threshold=None):
+                                    Returns the indices of the inputs with the highest predictive uncertainty, which
+                                    are the candidates worth simulating with the FineModel.
+
+    Notes:
+    ------
+    None.
+    """
+
+    def __init__(self, NumberOfMembers=5, NumberOfHiddenLayers=None, NumberOfInputChannels=None,
+                 NumberOfOutputChannels=None, ScalingFactor=1.5, Filing=None, Directory=None, DataType='float64',
+                 Initializer='xavier', Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the SurrogateEnsemble class. The members are constructed with the same architecture, see
+        CoarseModel for more information on the parameters, where each member has its own directory.
+
+        Parameters:
+        -----------
+        NumberOfMembers:            int
+                                    The number of CoarseModel members of the ensemble.
+        NumberOfHiddenLayers:       int
+                                    The number of hidden layers per member.
+        NumberOfInputChannels:      int
+                                    The number of input channels per member.
+        NumberOfOutputChannels:     int
+                                    The number of output channels per member.
+        ScalingFactor:              float
+                                    The rate that each member grows from the output layer to the input layer.
+        Filing:                     Filing
+                                    The results that are stored using the Filing class for reading, writing, appending,
+                                    and deleting files.
+        Directory:                  str
+                                    Should the user wish to define a unique directory for the ensemble, this should be
+                                    named something meaningful.
+        DataType:                   str
+                                    The floating point type of each member, either 'float64' or 'float32'.
+        Initializer:                str
+                                    The initializer of the weights of each member, see CoarseModel.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if NumberOfMembers is None or NumberOfMembers < 2:
+            raise Exception('<SurrogateEnsemble: __init__: At least two members are required>')
+        if Filing is None:
+            raise Exception('<SurrogateEnsemble: __init__: Filing is of None type, it must be of Filing type>')
+
+        self.__model_arguments__ = {'NumberOfHiddenLayers': NumberOfHiddenLayers,
+                                    'NumberOfInputChannels': NumberOfInputChannels,
+                                    'NumberOfOutputChannels': NumberOfOutputChannels,
+                                    'ScalingFactor': ScalingFactor,
+                                    'DataType': DataType,
+                                    'Initializer': Initializer}
+
+        # Create directory per member
+        if Directory is None:
+            __root__ = 'Ensemble'
+        else:
+            __root__ = 'Ensemble\\' + Directory
+        self.__directory__ = [__root__ + '\\' + str(__i__) for __i__ in range(NumberOfMembers)]
+
+        # Class objects
+        self.__filing__ = Filing
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+        # Construct the members
+        self.__member__ = [CoarseModel(Filing=self.__filing__, Directory=__i__, Debugging=self.__debugging__,
+                                       **self.__model_arguments__)
+                           for __i__ in self.__directory__]
+
+    def Train(self, TrainingData=None, ValidationData=None, TestingData=None, NumberOfEpochs=None,
+              TrainDurationMinutes=None, Patience=None, Bootstrap=True, NumberOfWorkers=None, Seed=0,
+              TrainArguments=None):
+        """
+        Description:
+        ------------
+        Trains every member in its own process. Member n is seeded with Seed + n and, if Bootstrap is True, is trained
+        on its own bootstrap sample (drawn with replacement) of the training data so that the members disagree where
+        the data is sparse.
+
+        Parameters:
+        -----------
+        TrainingData:               list
+                                    The training data, where each data point is in the form of [input, target].
+        ValidationData:             list
+                                    The validation data, where each data point is in the form of [input, target].
+        TestingData:                list
+                                    The testing data, where each data point is in the form of [input, target].
+        NumberOfEpochs:             int
+                                    The number of epochs per member, see CoarseModel.Train.
+        TrainDurationMinutes:       float
+                                    The amount of time, in minutes, per member, see CoarseModel.Train.
+        Patience:                   int
+                                    The patience for early stopping per member, see CoarseModel.Train.
+        Bootstrap:                  bool
+                                    When True, each member is trained on a bootstrap sample of the training data.
+        NumberOfWorkers:            int
+                                    The number of processes to train with, where None uses all the cores.
+        Seed:                       int
+                                    The seed of the first member.
+        TrainArguments:             dict
+                                    Any other keyword arguments for CoarseModel.Train that are shared by every member.
+
+        Returns:
+        --------
+        Returns a list per member in the form of [number of epochs, best validation loss, average testing loss,
+        training time in minutes, error], where the error is None if training was successful.
+
+        Notes:
+        ------
+        A member that failed to train, including a member whose worker process crashed, keeps the weights it had
+        before, where the members that did finish are still updated.
+        """
+
+        if TrainingData is None or ValidationData is None or TestingData is None or \
+                (NumberOfEpochs is None and TrainDurationMinutes is None):
+            raise Exception('<SurrogateEnsemble: Train: One or more parameters are of type None>')
+
+        __jobs__ = []
+        for __i__ in range(len(self.__member__)):
+            # Draw the bootstrap sample of the member
+            if Bootstrap:
+                __index__ = np.random.RandomState(Seed + __i__).randint(0, len(TrainingData), len(TrainingData))
+                __data__ = [TrainingData[__j__] for __j__ in __index__]
+            else:
+                __data__ = TrainingData
+
+            __train__ = {'TrainingData': __data__, 'ValidationData': ValidationData, 'TestingData': TestingData,
+                         'NumberOfEpochs': NumberOfEpochs, 'TrainDurationMinutes': TrainDurationMinutes,
+                         'Patience': Patience}
+            if TrainArguments is not None:
+                __train__.update(TrainArguments)
+
+            __jobs__.append({'Model': self.__model_arguments__, 'Train': __train__, 'Seed': Seed + __i__,
+                             'Directory': self.__directory__[__i__], 'Debugging': self.__debugging__})
+
+        # Train the members across the pool of processes
+        __results__ = [None for _ in __jobs__]
+        with futures.ProcessPoolExecutor(max_workers=NumberOfWorkers) as __executor__:
+            __pending__ = {__executor__.submit(_train_surrogate, __jobs__[__i__]): __i__
+                           for __i__ in range(len(__jobs__))}
+
+            for __count__, __future__ in enumerate(futures.as_completed(__pending__)):
+                # A worker that crashed, for instance by running out of memory, breaks the pool, where the member
+                # is kept as failed in the same way as a member that raised an exception
+                try:
+                    __results__[__pending__[__future__]] = __future__.result()
+
+                except Exception as __error__:
+                    __results__[__pending__[__future__]] = [None, None, None, None, None,
+                                                            f'{type(__error__).__name__}: {__error__}']
+
+                print(f'\r<SurrogateEnsemble: Train: {__count__ + 1} of {len(__jobs__)} members trained>', end='')
+        print()
+
+        # Update the members with their trained weights
+        for __i__ in range(len(self.__member__)):
+            if __results__[__i__][4] is not None:
+                self.__member__[__i__].__weights_vector__[:] = __results__[__i__][4]
+
+            elif self.__debugging__:
+                print(f'<SurrogateEnsemble: Train: Member {__i__} failed to train: {__results__[__i__][5]}>')
+
+        return [__i__[:4] + __i__[5:] for __i__ in __results__]
+
+    def FeedForward(self, __input__, __target__=None, __learn__=False, __return_outputs__=False):
+        """
+        Description:
+        ------------
+        Predicts the mean output of the members for a single input, following the CoarseModel.FeedForward interface.
+
+        Parameters:
+        -----------
+        __input__:                  list
+                                    The input to the members.
+        __target__:                 list
+                                    Unused, kept for the CoarseModel interface.
+        __learn__:                  bool
+                                    Must be False, the ensemble is trained through the Train method.
+        __return_outputs__:         bool
+                                    Used for returning the mean output values of the members when True.
+
+        Returns:
+        --------
+        Returns the mean output values, in a 1D list, should the outputs be required to be returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __learn__:
+            raise Exception('<SurrogateEnsemble: FeedForward: The ensemble is trained through the Train method>')
+
+        if __return_outputs__:
+            return self.PredictBatch(Inputs=[__input__])[0].tolist()
+
+    def PredictBatch(self, Inputs=None, ReturnVariance=False):
+        """
+        Description:
+        ------------
+        Predicts the outputs of every member for a batch of inputs and returns their mean, and optionally their
+        variance, per output.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels).
+        ReturnVariance:             bool
+                                    When True, the variance of the members' predictions is returned along with the
+                                    mean.
+
+        Returns:
+        --------
+        Returns the mean prediction, a 2D array in the form of (number of samples, number of output channels). If
+        ReturnVariance is True, a tuple of the mean and the variance, both in the same form, is returned instead.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __prediction__ = np.stack([__i__.PredictBatch(Inputs=Inputs) for __i__ in self.__member__])
+
+        if ReturnVariance:
+            return __prediction__.mean(axis=0), __prediction__.var(axis=0)
+
+        return __prediction__.mean(axis=0)
+
+    def Jacobian(self, Inputs=None):
+        """
+        Description:
+        ------------
+        Determines the derivatives of the mean prediction of the members with respect to the inputs for a batch of
+        inputs.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels).
+
+        Returns:
+        --------
+        Returns a 3D array in the form of (number of samples, number of output channels, number of input channels).
+
+        Notes:
+        ------
+        None.
+        """
+
+        return np.mean([__i__.Jacobian(Inputs=Inputs) for __i__ in self.__member__], axis=0)
+
+    def SelectUncertain(self, Inputs=None, NumberOfCandidates=None, Threshold=None):
+        """
+        Description:
+        ------------
+        Ranks the inputs by their predictive uncertainty, the variance of the members averaged over the outputs, so
+        that only the most uncertain candidates are simulated with the FineModel.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels).
+        NumberOfCandidates:         int
+                                    When defined, at most NumberOfCandidates indices are returned.
+        Threshold:                  float
+                                    When defined, only the indices with an uncertainty above Threshold are returned.
+
+        Returns:
+        --------
+        Returns a list of indices into Inputs, sorted from the most uncertain to the least uncertain input.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __uncertainty__ = self.PredictBatch(Inputs=Inputs, ReturnVariance=True)[1].mean(axis=1)
+        __index__ = np.argsort(-__uncertainty__)
+
+        if Threshold is not None:
+            __index__ = __index__[__uncertainty__[__index__] > Threshold]
+        if NumberOfCandidates is not None:
+            __index__ = __index__[:NumberOfCandidates]
+
+        return __index__.tolist()
@@ -13,6 +13,9 @@ class Filing:
     -----------
     __directory__:                  str
                                     A private attribute that the class uses as its root directory.
+    __index__:                      dict
+                                    The in-memory index per file searched by Duplicate, in the form of {Filename:
+                                    [signature of the file, {rounded parameters: data point}]}.
     __debugging__:                  bool
                                     For debugging purposes (developer mode).
 
@@ -36,11 +39,36 @@ class Filing:
                                     The data within the file is extracted into a list of lists, where each element
                                     is a single data point. The format is [parameters, [[return loss frequency
                                     range, return loss responses], [gain frequency range, gain responses]]].
+    ReadIter(Filename, ChunkSize=None, Responses=None):
+                                    The data points within the file are yielded one at a time, or in chunks of
+                                    ChunkSize, optionally with only the responses of Responses.
     Append(Filename, List):
                                     The List parameter is appended to the file given the Filename.
     Save(Filename, Lists):
                                     The file is overwritten with the data contained in the Lists parameter. This
                                     parameter is a list of lists with the same format as the Read function.
+    SaveArray(Filename, Array):
+                                    The file is atomically overwritten with the Array parameter in a binary format
+                                    that can be memory-mapped.
+    ReadArray(Filename, MemoryMap=True):
+                                    The array within the binary file, written by SaveArray, is loaded without any
+                                    parsing, optionally as a read-only memory-map.
+    SaveArrays(Filename, Arrays):
+                                    The file is atomically overwritten with the named arrays of the Arrays parameter in
+                                    a single binary archive.
+    SaveText(Filename, Text):
+                                    The file is atomically overwritten with the Text parameter.
+    SaveColumns(Filename, Lists, Precision='float64'):
+                                    The file is atomically overwritten with the data points of the Lists parameter in
+                                    a columnar binary format, where a frequency range shared by the data points is
+                                    only kept once.
+    ReadColumns(Filename, MemoryMap=True):
+                                    The columns of the file, written by SaveColumns, are returned as arrays,
+                                    optionally as read-only memory-maps.
+    ConvertColumns(Filename, Source=None, Precision='float64'):
+                                    The data points of a text file are converted into the columnar binary format.
+    Hash(Filename):
+                                    The SHA-256 digest of the content of the file is returned given the Filename.
     DeleteFile(Filename):
                                     The file is permanently deleted given the Filename.
     Duplicate(Filename, List):
@@ -48,10 +76,37 @@ class Filing:
                                     the List parameter and current line of data, the full line is returned in the
                                     same format as the Read function, but only for a single data point. If no match
                                     has been found, False is returned.
+    _signature(__filename__):
+                                    Returns the inode, size, and modification time of a file, which change whenever
+                                    the file is written.
+    _key(__parameters__):
+                                    Returns the key of a data point within the index, its rounded parameters.
+    _index(__filename__):
+                                    Returns the index of a file, which is (re)built should the file have changed on
+                                    disk.
+    _literal(__text__):
+                                    Parses the text of a data point, through the json module whenever possible.
+    _parse(__line__, __responses__=None):
+                                    Parses a line of a text file into a data point.
+    _project(__list__, __responses__=None):
+                                    Keeps only the selected responses within a data point.
+    _selection(__responses__):
+                                    Returns True should the selection of responses be valid.
+    _iterate(__filename__, __size__, __single__, __responses__=None):
+                                    Yields the data points of a file, or chunks of data points, for ReadIter.
+    _columns(__filename__):
+                                    Returns the header of a file in the columnar binary format, or None.
+    _layout(__list__, __precision__):
+                                    Returns the header of a new file in the columnar binary format.
+    _pack(__lists__, __header__, __grids__):
+                                    Converts data points into the records of the columnar binary format.
+    _unpack(__records__, __header__, __grids__, __responses__=None):
+                                    Converts records of the columnar binary format into data points.
 
     Notes:
     ------
-    None.
+    Read, Append, Save, DeleteContent, DeleteFile, and Duplicate work on files in either the text or the columnar
+    binary format, where the format of an existing file is kept.
     """
 
     def __init__(self, Directories=None, Debugging=False):
@@ -80,6 +135,8 @@ class Filing:
         self.__directory__ = str(pkg_resources.files('AntennaDesign') / 'Filing')
         # For debugging (developer mode)
         self.__debugging__ = Debugging
+        # The index of the files searched by Duplicate
+        self.__index__ = {}
 
         # Initialize/Create default directories (the root directory is Filing)
         __temp__ = ''
@@ -189,9 +246,17 @@ class Filing:
 
         Notes:
         ------
-        If the file does not exist, the file will be created without the intention of doing so.
+        If the file does not exist, the file will be created without the intention of doing so. A file in the
+        columnar binary format keeps its header.
         """
 
+        self.__index__.pop(Filename, None)
+
+        __header__ = self._columns(__filename__=Filename)
+        if __header__ is not None:
+            os.truncate(self.__directory__ + Filename, __header__['offset'])
+            return
+
         __temp__ = open(self.__directory__ + Filename, 'w')
         __temp__.close()
 
@@ -215,9 +280,21 @@ class Filing:
 
         Notes:
         ------
-        None.
+        A file in the columnar binary format is unpacked into the same format, where the numbers are floats.
         """
 
+        __header__ = self._columns(__filename__=Filename)
+        if __header__ is not None:
+            __columns__ = self.ReadColumns(Filename=Filename, MemoryMap=False)
+            if not isinstance(__columns__, dict) or len(__columns__['records']) == 0:
+                if self.__debugging__:
+                    print('<Filing: Read: File is empty>')
+
+                return -1
+
+            return self._unpack(__records__=__columns__['records'], __header__=__header__,
+                                __grids__=__columns__['frequency'])
+
         try:
 
             with open(self.__directory__ + Filename, 'r') as __file_read__:
@@ -233,7 +310,7 @@ class Filing:
                     try:
                         __first_index__ = __i__.index('[')
                         __last_index__ = __i__.index('\n')
-                        __list__.append(ast.literal_eval(__i__[__first_index__: __last_index__]))
+                        __list__.append(self._literal(__text__=__i__[__first_index__: __last_index__]))
 
                     except Exception as __error__:
                         if self.__debugging__:
@@ -251,6 +328,48 @@ class Filing:
 
         return -1
 
+    def ReadIter(self, Filename, ChunkSize=None, Responses=None):
+        """
+        Description:
+        ------------
+        Reads the data points of the file one at a time, or in chunks, as they are requested, so that a file can be
+        processed without keeping all of its data points in memory.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        ChunkSize:                  int
+                                    The number of data points per chunk, where None yields a single data point at a
+                                    time.
+        Responses:                  list
+                                    The indices of the responses to keep, for instance [0] for the return loss only or
+                                    [] for the parameters only. When None, every response is kept.
+
+        Returns:
+        -------
+        A generator of data points, in the same format as Read, or of lists of up to ChunkSize data points. Should the
+        file not exist, nothing is yielded.
+
+        Notes:
+        ------
+        A data point is in the form of [parameters, [[frequency range, responses], ...]] with only the responses of
+        Responses, where data points of another form are yielded as they are. For the parameters only, the responses
+        within a text file are not parsed. An exception is raised should a data point not have one of the responses of
+        Responses, for a text file as well as for a file in the columnar binary format.
+        """
+
+        __size__ = 256 if ChunkSize is None else int(ChunkSize)
+        if __size__ < 1:
+            raise Exception('<Filing: ReadIter: ChunkSize must be a positive integer>')
+        if not self._selection(__responses__=Responses):
+            raise Exception('<Filing: ReadIter: Responses must be None or a list of non-negative integers>')
+
+        # The generator is returned rather than being this method, so that ChunkSize is validated when it is called
+        return self._iterate(__filename__=Filename, __size__=__size__, __single__=ChunkSize is None,
+                             __responses__=Responses)
+
     def Append(self, Filename, List):
         """
         Description:
@@ -271,14 +390,67 @@ class Filing:
 
         Notes:
         ------
-        None.
+        The index of the file is updated with the List, unless the file was changed on disk since the index was built.
+        Should the file be in the columnar binary format, the List is appended as a record, where -1 is returned
+        should the List not have the same number of parameters, responses, and frequency points as the file.
         """
 
         try:
+            __signature__ = self._signature(__filename__=Filename)
+
+            __header__ = self._columns(__filename__=Filename)
+            if __header__ is not None:
+                __columns__ = self.ReadColumns(Filename=Filename, MemoryMap=True)
+                if not isinstance(__columns__, dict):
+                    raise Exception(f'<Filing: Append: Unable to read the columns of {Filename}>')
+                __count__ = len(__columns__['records'])
+                __grids__ = [__i__.copy() for __i__ in __columns__['frequency']]
+                del __columns__
+
+                # A data point that does not fit the records of the columnar binary format can not be appended
+                try:
+                    __records__, __changed__ = self._pack(__lists__=[List], __header__=__header__,
+                                                          __grids__=__grids__)
+                except Exception as __error__:
+                    raise Exception(f'<Filing: Append: The data point does not fit the columnar binary format of '
+                                    f'{Filename}, either convert the file back to text with Save or keep such data '
+                                    f'points in another file: {__error__}>')
+
+                # A new frequency range is saved before the record that refers to it
+                __arrays__ = {f'grid{__i__}': __grids__[__i__] for __i__ in range(len(__grids__))}
+                if 'version' in __header__:
+                    __arrays__['version'] = np.array(__header__['version'])
+                if __changed__ and self.SaveArrays(Filename=Filename + '.grids', Arrays=__arrays__) == -1:
+                    raise Exception('<Filing: Append: Unable to save the frequency ranges>')
+
+                # Any partially written record, for instance of a crashed process, is overwritten
+                with open(self.__directory__ + Filename, 'r+b') as __file_append__:
+                    __file_append__.seek(__header__['offset'] + __count__ * __records__.dtype.itemsize)
+                    __file_append__.write(__records__.tobytes())
+                    __file_append__.truncate()
+
+                __list__ = self._unpack(__records__=__records__, __header__=__header__, __grids__=__grids__)[0]
+            else:
+                __file_append__ = open(f'{self.__directory__ + Filename}', 'a+')
+                __file_append__.write(f'{List}\n')
+                __file_append__.close()
+
+                __list__ = None
+
+            # Keep the index up to date with the data point as it will be read back from the file
+            if Filename in self.__index__:
+                if self.__index__[Filename][0] == __signature__:
+                    try:
+                        if __list__ is None:
+                            __list__ = self._literal(__text__=f'{List}')
+                        self.__index__[Filename][1].setdefault(self._key(__parameters__=__list__[0]), __list__)
+                    except Exception as __error__:
+                        if self.__debugging__:
+                            print(f'<Filing: Append: {__error__}>')
 
-            __file_append__ = open(f'{self.__directory__ + Filename}', 'a+')
-            __file_append__.write(f'{List}\n')
-            __file_append__.close()
+                    self.__index__[Filename][0] = self._signature(__filename__=Filename)
+                else:
+                    self.__index__.pop(Filename)
 
             return 0
 
@@ -311,9 +483,15 @@ class Filing:
 
         Notes:
         ------
-        None.
+        A file in the columnar binary format is saved in the same format and precision, see SaveColumns.
         """
 
+        self.__index__.pop(Filename, None)
+
+        __header__ = self._columns(__filename__=Filename)
+        if __header__ is not None:
+            return self.SaveColumns(Filename=Filename, Lists=Lists, Precision=np.dtype(__header__['dtype']).name)
+
         try:
             __file_save__ = open(f'{self.__directory__ + Filename}', 'w')
 
@@ -330,6 +508,383 @@ class Filing:
 
             return -1
 
+    def SaveArray(self, Filename, Array):
+        """
+        Description:
+        ------------
+        Attempts to save an array in the binary NumPy format given the filename. The array is first written to a
+        temporary file, which then replaces the file Filename, so that the file is never left partially written.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        Array:                      ndarray
+                                    The array to save into the file given the Filename parameter.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            __temp__ = self.__directory__ + Filename + '.tmp'
+
+            with open(__temp__, 'wb') as __file_save__:
+                np.save(__file_save__, np.ascontiguousarray(Array), allow_pickle=False)
+                __file_save__.flush()
+                os.fsync(__file_save__.fileno())
+
+            os.replace(__temp__, self.__directory__ + Filename)
+
+            return 0
+
+        except Exception as __error__:
+
+            if self.__debugging__:
+                print(f'<Filing: SaveArray: {__error__}>')
+
+            return -1
+
+    def ReadArray(self, Filename, MemoryMap=True):
+        """
+        Description:
+        ------------
+        Attempts to load an array, written by SaveArray, given the filename.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        MemoryMap:                  bool
+                                    When True, the array is returned as a read-only memory-map of the file, else the
+                                    array is read into memory.
+
+        Return:
+        -------
+        Returns the array when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        A memory-mapped array keeps the file open until the array is deleted.
+        """
+
+        try:
+            return np.load(self.__directory__ + Filename, mmap_mode='r' if MemoryMap else None, allow_pickle=False)
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<Filing: ReadArray: {__error__}>')
+
+        return -1
+
+    def SaveArrays(self, Filename, Arrays):
+        """
+        Description:
+        ------------
+        Attempts to save named arrays in a single binary NumPy archive (.npz) given the filename. The archive is first
+        written to a temporary file, which then replaces the file Filename, so that the file is never left partially
+        written.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        Arrays:                     dict
+                                    The arrays to save into the file, keyed by their names.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The archive is read with numpy.load, which does not require the AntennaDesign package.
+        """
+
+        try:
+            __temp__ = self.__directory__ + Filename + '.tmp'
+
+            with open(__temp__, 'wb') as __file_save__:
+                np.savez(__file_save__, **Arrays)
+                __file_save__.flush()
+                os.fsync(__file_save__.fileno())
+
+            os.replace(__temp__, self.__directory__ + Filename)
+
+            return 0
+
+        except Exception as __error__:
+
+            if self.__debugging__:
+                print(f'<Filing: SaveArrays: {__error__}>')
+
+            return -1
+
+    def SaveText(self, Filename, Text):
+        """
+        Description:
+        ------------
+        Attempts to save text given the filename. The text is first written to a temporary file, which then replaces
+        the file Filename, so that the file is never left partially written.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        Text:                       str
+                                    The text to save into the file given the Filename parameter.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            __temp__ = self.__directory__ + Filename + '.tmp'
+
+            with open(__temp__, 'w') as __file_save__:
+                __file_save__.write(Text)
+                __file_save__.flush()
+                os.fsync(__file_save__.fileno())
+
+            os.replace(__temp__, self.__directory__ + Filename)
+
+            return 0
+
+        except Exception as __error__:
+
+            if self.__debugging__:
+                print(f'<Filing: SaveText: {__error__}>')
+
+            return -1
+
+    def SaveColumns(self, Filename, Lists, Precision='float64'):
+        """
+        Description:
+        ------------
+        Attempts to save data points in the form of [parameters, [[frequency range, responses], ...]] in a columnar
+        binary format given the filename. Every data point is a fixed-size record of its parameters, the index of its
+        frequency range per response, and its responses, so that the records can be appended and memory-mapped. The
+        frequency ranges are kept once in the file Filename + '.grids', which is usually a single range per response.
+        The files are first written to temporary files, so that the file is never left partially written.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        Lists:                      list
+                                    A list of data points, with the same number of parameters, responses, and frequency
+                                    points per response.
+        Precision:                  str
+                                    The precision of the responses, either 'float32' or 'float64', where the parameters
+                                    and frequency ranges are always kept in 'float64'.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The format of the file is a header, in the form of the magic string '\\x93ADCOLS', the length of the JSON
+        header as a 32-bit unsigned integer, and the JSON header itself (padded to 64 bytes), followed by the records.
+        The JSON header holds a random version, which is also kept with the frequency ranges, so that the records are
+        never read with the frequency ranges of another SaveColumns.
+        """
+
+        self.__index__.pop(Filename, None)
+
+        try:
+            if Precision not in ['float32', 'float64']:
+                raise Exception(f'<Filing: SaveColumns: Unknown precision {Precision}>')
+            if len(Lists) == 0:
+                raise Exception('<Filing: SaveColumns: Lists is empty>')
+
+            __header__ = self._layout(__list__=Lists[0], __precision__=Precision)
+            __grids__ = [np.empty((0, __i__)) for __i__ in __header__['points']]
+            __records__, _ = self._pack(__lists__=Lists, __header__=__header__, __grids__=__grids__)
+
+            __temp__ = [self.__directory__ + Filename + '.tmp', self.__directory__ + Filename + '.grids.tmp']
+
+            with open(__temp__[0], 'wb') as __file_save__:
+                __file_save__.write(__header__['bytes'])
+                __file_save__.write(__records__.tobytes())
+                __file_save__.flush()
+                os.fsync(__file_save__.fileno())
+
+            # The frequency ranges carry the version of the records that refer to them
+            with open(__temp__[1], 'wb') as __file_save__:
+                np.savez(__file_save__, version=np.array(__header__['version']),
+                         **{f'grid{__i__}': __grids__[__i__] for __i__ in range(len(__grids__))})
+                __file_save__.flush()
+                os.fsync(__file_save__.fileno())
+
+            # The records are replaced first, should the process crash before the frequency ranges are replaced, the
+            # versions differ and ReadColumns refuses the records rather than returning the wrong frequency ranges
+            os.replace(__temp__[0], self.__directory__ + Filename)
+            os.replace(__temp__[1], self.__directory__ + Filename + '.grids')
+
+            return 0
+
+        except Exception as __error__:
+
+            if self.__debugging__:
+                print(f'<Filing: SaveColumns: {__error__}>')
+
+            return -1
+
+    def ReadColumns(self, Filename, MemoryMap=True):
+        """
+        Description:
+        ------------
+        Attempts to load the columns of a file, written by SaveColumns or Append, without any parsing.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+        MemoryMap:                  bool
+                                    When True, the columns are read-only memory-maps of the file, else the records are
+                                    read into memory.
+
+        Return:
+        -------
+        Returns a dictionary in the form of {'parameters': (number of data points, number of parameters),
+        'grid': (number of data points, number of responses), 'frequency': [(number of frequency ranges, number of
+        frequency points), ...], 'responses': [(number of data points, number of frequency points), ...], 'records'},
+        where the frequency range of response k of data point i is frequency[k][grid[i, k]] and 'records' is the
+        structured array of the records. Should the file not be in the columnar binary format, -1 is returned.
+
+        Notes:
+        ------
+        A partially written record at the end of the file, for instance of a crashed process, is left out.
+        """
+
+        try:
+            __header__ = self._columns(__filename__=Filename)
+            if __header__ is None:
+                raise Exception(f'<Filing: ReadColumns: {Filename} is not in the columnar binary format>')
+
+            __dtype__ = __header__['record']
+            __count__ = (os.path.getsize(self.__directory__ + Filename) - __header__['offset']) // __dtype__.itemsize
+
+            if __count__ <= 0:
+                __records__ = np.zeros(0, dtype=__dtype__)
+            elif MemoryMap:
+                __records__ = np.memmap(self.__directory__ + Filename, dtype=__dtype__, mode='r',
+                                        offset=__header__['offset'], shape=(__count__,))
+            else:
+                __records__ = np.fromfile(self.__directory__ + Filename, dtype=__dtype__, count=__count__,
+                                          offset=__header__['offset'])
+
+            with np.load(self.__directory__ + Filename + '.grids', allow_pickle=False) as __archive__:
+                # Files without a version predate the version, thus their frequency ranges can not be verified
+                if 'version' in __header__ and ('version' not in __archive__ or
+                                                str(__archive__['version']) != __header__['version']):
+                    raise Exception(f'<Filing: ReadColumns: The frequency ranges of {Filename} do not belong to its '
+                                    f'records, for instance of a crashed SaveColumns>')
+
+                __grids__ = [__archive__[f'grid{__i__}'] for __i__ in range(len(__header__['points']))]
+
+            __offsets__ = np.cumsum([0] + __header__['points'])
+
+            return {'parameters': __records__['parameters'],
+                    'grid': __records__['grid'],
+                    'frequency': __grids__,
+                    'responses': [__records__['responses'][:, __offsets__[__i__]:__offsets__[__i__ + 1]]
+                                  for __i__ in range(len(__header__['points']))],
+                    'records': __records__}
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<Filing: ReadColumns: {__error__}>')
+
+        return -1
+
+    def ConvertColumns(self, Filename, Source=None, Precision='float64'):
+        """
+        Description:
+        ------------
+        Attempts to convert the data points of a text file, written by Save or Append, into the columnar binary
+        format, see SaveColumns.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file in the
+                                    columnar binary format.
+        Source:                     str
+                                    The full path of the text file, where None converts the file Filename in place.
+        Precision:                  str
+                                    The precision of the responses, either 'float32' or 'float64'.
+
+        Return:
+        -------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        The conversion fails, and the text file is kept, should a data point not have the same number of parameters,
+        responses, and frequency points as the first data point.
+        """
+
+        __lists__ = self.Read(Filename=Filename if Source is None else Source)
+        if not isinstance(__lists__, list):
+            return -1
+
+        return self.SaveColumns(Filename=Filename, Lists=__lists__, Precision=Precision)
+
+    def Hash(self, Filename):
+        """
+        Description:
+        ------------
+        Attempts to determine the SHA-256 digest of the content of the file given the filename, which changes whenever
+        the content of the file changes.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The full path, with the filename and possible extension, of the file to do the
+                                    intended operation on.
+
+        Return:
+        -------
+        Returns the hexadecimal digest when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            __hash__ = hashlib.sha256()
+
+            with open(self.__directory__ + Filename, 'rb') as __file_read__:
+                for __block__ in iter(lambda: __file_read__.read(1 << 20), b''):
+                    __hash__.update(__block__)
+
+            return __hash__.hexdigest()
+
+        except Exception as __error__:
+            if self.__debugging__:
+                print(f'<Filing: Hash: {__error__}>')
+
+        return -1
+
     def DeleteFile(self, Filename):
         """
         Description:
@@ -351,6 +906,16 @@ class Filing:
         None.
         """
 
+        self.__index__.pop(Filename, None)
+
+        # The frequency ranges of a file in the columnar binary format
+        if os.path.exists(self.__directory__ + Filename + '.grids'):
+            try:
+                os.remove(self.__directory__ + Filename + '.grids')
+            except Exception as __error__:
+                if self.__debugging__:
+                    print(f'<Filing: DeleteFile: {__error__}>')
+
         try:
             os.remove(self.__directory__ + Filename)
 
@@ -383,33 +948,26 @@ class Filing:
 
         Notes:
         ------
-        None.
+        The file is only read (and parsed) once into an index keyed by the parameters rounded to 12 decimals, after
+        which a search is a single lookup. The index is updated by Append and rebuilt should the file change on disk,
+        for instance by another process. Should the parameters match more than one data point, the first data point
+        within the file is returned.
         """
 
         if List is None:
             return -1
 
         try:
+            __index__ = self._index(__filename__=Filename)
+            if __index__ is None:
+                return -1
 
-            __temp__ = self.Read(Filename=Filename)
-
-            for __index__ in range(len(__temp__)):
+            __temp__ = __index__.get(self._key(__parameters__=List[0]))
 
-                # Proceed when the number of parameters between the List and __temp__[__index__] are the same
-                if len(List[0]) == len(__temp__[__index__][0]):
-
-                    __parameter_value_duplicate__ = 0
-
-                    # Go through each parameter
-                    for __i__ in range(len(__temp__[__index__][0])):
-
-                        if __temp__[__index__][0][__i__] == List[0][__i__]:
-                            __parameter_value_duplicate__ += 1
-
-                    # If a duplicate has been found, return the duplicate list that contains the parameters
-                    # and simulation results
-                    if __parameter_value_duplicate__ == len(List[0]):
-                        return __temp__[__index__]
+            # If a duplicate has been found, return a copy of the data point that contains the parameters and
+            # simulation results, so that the index is not changed by the caller
+            if __temp__ is not None:
+                return copy.deepcopy(__temp__)
 
             return False
 
@@ -419,3 +977,499 @@ class Filing:
                 print(f'<Filing: Duplicate: {__error__}>')
 
         return -1
+
+    def _signature(self, __filename__):
+        """
+        Description:
+        ------------
+        Determines the signature of a file, its inode, size, and modification time, which change whenever the file is
+        written to or replaced.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Returns:
+        --------
+        Returns the signature as a tuple, or None should the file not exist.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            __stat__ = os.stat(self.__directory__ + __filename__)
+        except OSError:
+            return None
+
+        return __stat__.st_ino, __stat__.st_size, __stat__.st_mtime_ns
+
+    @staticmethod
+    def _key(__parameters__):
+        """
+        Description:
+        ------------
+        Determines the key of a data point within the index of Duplicate.
+
+        Parameters:
+        -----------
+        __parameters__:             list
+                                    The parameter values of the data point.
+
+        Returns:
+        --------
+        Returns the parameter values, rounded to 12 decimals, as a tuple.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return tuple(round(float(__i__), 12) for __i__ in __parameters__)
+
+    def _index(self, __filename__):
+        """
+        Description:
+        ------------
+        Returns the index of a file, which is built from the file on the first call and rebuilt whenever the signature
+        of the file has changed since.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Returns:
+        --------
+        Returns the index in the form of {rounded parameters: data point}, or None should the file not be readable.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __signature__ = self._signature(__filename__=__filename__)
+
+        if __filename__ in self.__index__ and self.__index__[__filename__][0] == __signature__:
+            return self.__index__[__filename__][1]
+
+        self.__index__.pop(__filename__, None)
+
+        __temp__ = self.Read(Filename=__filename__)
+        if not isinstance(__temp__, list):
+            return None
+
+        # The first data point with the parameters is kept
+        __index__ = {}
+        for __i__ in __temp__:
+            try:
+                __index__.setdefault(self._key(__parameters__=__i__[0]), __i__)
+            except Exception as __error__:
+                if self.__debugging__:
+                    print(f'<Filing: _index: {__error__}>')
+
+        self.__index__[__filename__] = [__signature__, __index__]
+
+        return __index__
+
+    @staticmethod
+    def _literal(__text__):
+        """
+        Description:
+        ------------
+        Parses the text of a data point, as written by Append and Save, into a list.
+
+        Parameters:
+        -----------
+        __text__:                   str
+                                    The text of the data point, for instance '[[20.5, 11.0], [[[1.0, ...], [...]]]]'.
+
+        Returns:
+        --------
+        Returns the data point.
+
+        Notes:
+        ------
+        The text of a data point of numbers, the repr of nested lists of int and float values, is also valid JSON, which
+        the C parser of the json module parses several times faster than ast.literal_eval. Any other text, for instance
+        with strings in single quotes or tuples, is parsed with ast.literal_eval, so that the result is the same either
+        way. The text nan and inf, as written for such values, is neither valid JSON nor a literal, thus an exception is
+        raised and the data point is rejected, as it was before.
+        """
+
+        try:
+            return json.loads(__text__)
+        except ValueError:
+            return ast.literal_eval(__text__)
+
+    @staticmethod
+    def _parse(__line__, __responses__=None):
+        """
+        Description:
+        ------------
+        Parses a line of a text file into a data point, with only the responses of __responses__.
+
+        Parameters:
+        -----------
+        __line__:                   str
+                                    The line of the file.
+        __responses__:              list
+                                    The indices of the responses to keep, where None keeps every response and [] only
+                                    the parameters.
+
+        Returns:
+        --------
+        Returns the data point, see ReadIter.
+
+        Notes:
+        ------
+        An exception is raised should the line not be a list.
+        """
+
+        __first_index__ = __line__.index('[')
+
+        # Only the parameters, the first list within the line, are parsed
+        if __responses__ is not None and len(__responses__) == 0 and __line__[__first_index__ + 1] == '[':
+            try:
+                return [Filing._literal(__text__=__line__[__first_index__ + 1: __line__.index(']') + 1]), []]
+            except Exception:
+                pass
+
+        return Filing._project(__list__=Filing._literal(__text__=__line__[__first_index__:].rstrip()),
+                               __responses__=__responses__)
+
+    def _iterate(self, __filename__, __size__, __single__, __responses__=None):
+        """
+        Description:
+        ------------
+        Yields the data points of a file, see ReadIter.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path, with the filename and possible extension, of the file.
+        __size__:                   int
+                                    The number of data points that are read at a time.
+        __single__:                 bool
+                                    When True, a single data point is yielded at a time, else lists of up to __size__
+                                    data points are yielded.
+        __responses__:              list
+                                    The indices of the responses to keep, where None keeps every response.
+
+        Returns:
+        --------
+        A generator of data points, or of lists of up to __size__ data points. Should the file not exist, nothing is
+        yielded.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __header__ = self._columns(__filename__=__filename__)
+
+        if __header__ is not None:
+            __columns__ = self.ReadColumns(Filename=__filename__, MemoryMap=True)
+            if not isinstance(__columns__, dict):
+                return
+
+            def __chunks__():
+                for __i__ in range(0, len(__columns__['records']), __size__):
+                    yield self._unpack(__records__=__columns__['records'][__i__:__i__ + __size__],
+                                       __header__=__header__, __grids__=__columns__['frequency'],
+                                       __responses__=__responses__)
+        else:
+            try:
+                __file_read__ = open(self.__directory__ + __filename__, 'r')
+            except Exception as __error__:
+                if self.__debugging__:
+                    print(f'<Filing: _iterate: {__error__}>')
+
+                return
+
+            # The responses are selected once the line is parsed, except for the parameters only
+            __parsed__ = None if __responses__ is None or len(__responses__) > 0 else []
+
+            def __chunks__():
+                with __file_read__:
+                    __chunk__ = []
+                    for __i__ in __file_read__:
+                        try:
+                            __list__ = self._parse(__line__=__i__, __responses__=__parsed__)
+                        except Exception as __error__:
+                            if self.__debugging__:
+                                print(f'<Filing: _iterate: {__error__}>')
+
+                            continue
+
+                        # A line that can not be parsed is skipped, where a response that the data point does not
+                        # have is an error, as for the columnar binary format
+                        __chunk__.append(self._project(__list__=__list__, __responses__=__responses__))
+
+                        if len(__chunk__) == __size__:
+                            yield __chunk__
+                            __chunk__ = []
+
+                    if len(__chunk__) > 0:
+                        yield __chunk__
+
+        for __chunk__ in __chunks__():
+            if __single__:
+                yield from __chunk__
+            else:
+                yield __chunk__
+
+    @staticmethod
+    def _project(__list__, __responses__=None):
+        """
+        Description:
+        ------------
+        Keeps only the responses of __responses__ within a data point.
+
+        Parameters:
+        -----------
+        __list__:                   list
+                                    The data point in the form of [parameters, [[frequency range, responses], ...]].
+        __responses__:              list
+                                    The indices of the responses to keep, where None keeps every response.
+
+        Returns:
+        --------
+        Returns the data point with only the responses of __responses__, or the data point as it is should it not be
+        of the form above.
+
+        Notes:
+        ------
+        An exception is raised should the data point not have one of the responses of __responses__.
+        """
+
+        if __responses__ is None or not isinstance(__list__, list) or len(__list__) != 2 or \
+                not isinstance(__list__[1], list):
+            return __list__
+
+        for __i__ in __responses__:
+            if __i__ >= len(__list__[1]):
+                raise Exception(f'<Filing: _project: Response {__i__} is not one of the {len(__list__[1])} responses '
+                                f'of the data point>')
+
+        return [__list__[0], [__list__[1][__i__] for __i__ in __responses__]]
+
+    @staticmethod
+    def _selection(__responses__):
+        """
+        Description:
+        ------------
+        Determines whether __responses__ is a valid selection of responses.
+
+        Parameters:
+        -----------
+        __responses__:              list
+                                    The indices of the responses to keep, where None keeps every response.
+
+        Returns:
+        --------
+        Returns True should __responses__ be None or a list of non-negative integers, else False.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __responses__ is None:
+            return True
+
+        try:
+            return all(isinstance(__i__, (int, np.integer)) and not isinstance(__i__, bool) and __i__ >= 0
+                       for __i__ in __responses__)
+        except TypeError:
+            return False
+
+    def _columns(self, __filename__):
+        """
+        Description:
+        ------------
+        Reads the header of a file in the columnar binary format.
+
+        Parameters:
+        -----------
+        __filename__:               str
+                                    The full path, with the filename and possible extension, of the file.
+
+        Returns:
+        --------
+        Returns the header in the form of {'dtype', 'dimension', 'points', 'offset', 'record'}, where 'offset' is the
+        position of the first record and 'record' the structured data type of a record, or None should the file not
+        exist or not be in the columnar binary format.
+
+        Notes:
+        ------
+        None.
+        """
+
+        try:
+            with open(self.__directory__ + __filename__, 'rb') as __file_read__:
+                if __file_read__.read(8) != b'\x93ADCOLS\x01':
+                    return None
+
+                __length__ = int.from_bytes(__file_read__.read(4), 'little')
+                __header__ = json.loads(__file_read__.read(__length__).decode())
+
+        except Exception:
+            return None
+
+        __header__['offset'] = 12 + __length__
+        __header__['record'] = np.dtype([('parameters', '<f8', (__header__['dimension'],)),
+                                         ('grid', '<i4', (len(__header__['points']),)),
+                                         ('responses', __header__['dtype'], (sum(__header__['points']),))])
+
+        return __header__
+
+    @staticmethod
+    def _layout(__list__, __precision__):
+        """
+        Description:
+        ------------
+        Determines the header of a new file in the columnar binary format from its first data point.
+
+        Parameters:
+        -----------
+        __list__:                   list
+                                    The first data point in the form of [parameters, [[frequency range, responses],
+                                    ...]].
+        __precision__:              str
+                                    The precision of the responses, either 'float32' or 'float64'.
+
+        Returns:
+        --------
+        Returns the header as for _columns, along with the bytes of the header in 'bytes'.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __header__ = {'dtype': np.dtype(__precision__).newbyteorder('<').str,
+                      'dimension': len(__list__[0]),
+                      'points': [len(__i__[1]) for __i__ in __list__[1]],
+                      'version': os.urandom(8).hex()}
+
+        # The records start on a multiple of 64 bytes
+        __text__ = json.dumps(__header__).encode()
+        __text__ += b' ' * (-(12 + len(__text__)) % 64)
+
+        __header__['offset'] = 12 + len(__text__)
+        __header__['record'] = np.dtype([('parameters', '<f8', (__header__['dimension'],)),
+                                         ('grid', '<i4', (len(__header__['points']),)),
+                                         ('responses', __header__['dtype'], (sum(__header__['points']),))])
+        __header__['bytes'] = b'\x93ADCOLS\x01' + len(__text__).to_bytes(4, 'little') + __text__
+
+        return __header__
+
+    @staticmethod
+    def _pack(__lists__, __header__, __grids__):
+        """
+        Description:
+        ------------
+        Converts data points into the records of the columnar binary format, where the frequency range of every
+        response is looked up among the known frequency ranges, or added as a new one.
+
+        Parameters:
+        -----------
+        __lists__:                  list
+                                    The data points in the form of [parameters, [[frequency range, responses], ...]].
+        __header__:                 dict
+                                    The header of the file, see _columns.
+        __grids__:                  list
+                                    The known frequency ranges per response, which are updated in place.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (records, whether a frequency range has been added).
+
+        Notes:
+        ------
+        An exception is raised should a data point not fit the header.
+        """
+
+        __records__ = np.zeros(len(__lists__), dtype=__header__['record'])
+        __offsets__ = np.cumsum([0] + __header__['points'])
+        __changed__ = False
+
+        # The index of every known frequency range per response, keyed by its bytes
+        __lookup__ = [{__j__.tobytes(): __k__ for __k__, __j__ in enumerate(__i__)} for __i__ in __grids__]
+
+        for __i__ in range(len(__lists__)):
+            __parameters__ = np.asarray(__lists__[__i__][0])
+            if __parameters__.shape != (__header__['dimension'],) or __parameters__.dtype.kind not in 'iuf':
+                raise Exception(f'<Filing: _pack: Data point {__i__} does not have {__header__["dimension"]} '
+                                f'numerical parameters>')
+            if len(__lists__[__i__]) != 2 or len(__lists__[__i__][1]) != len(__header__['points']):
+                raise Exception(f'<Filing: _pack: Data point {__i__} does not have {len(__header__["points"])} '
+                                f'responses>')
+            __records__['parameters'][__i__] = __parameters__
+
+            for __j__ in range(len(__header__['points'])):
+                __frequency__ = np.asarray(__lists__[__i__][1][__j__][0])
+                __response__ = np.asarray(__lists__[__i__][1][__j__][1])
+                for __k__ in (__frequency__, __response__):
+                    if __k__.shape != (__header__['points'][__j__],) or __k__.dtype.kind not in 'iuf':
+                        raise Exception(f'<Filing: _pack: Response {__j__} of data point {__i__} does not have '
+                                        f'{__header__["points"][__j__]} numerical frequency points>')
+
+                __key__ = __frequency__.astype(np.float64).tobytes()
+                if __key__ not in __lookup__[__j__]:
+                    __lookup__[__j__][__key__] = len(__grids__[__j__])
+                    __grids__[__j__] = np.vstack([__grids__[__j__], __frequency__.astype(np.float64)[None, :]])
+                    __changed__ = True
+
+                __records__['grid'][__i__, __j__] = __lookup__[__j__][__key__]
+                __records__['responses'][__i__, __offsets__[__j__]:__offsets__[__j__ + 1]] = __response__
+
+        return __records__, __changed__
+
+    @staticmethod
+    def _unpack(__records__, __header__, __grids__, __responses__=None):
+        """
+        Description:
+        ------------
+        Converts records of the columnar binary format into data points.
+
+        Parameters:
+        -----------
+        __records__:                ndarray
+                                    The structured array of the records.
+        __header__:                 dict
+                                    The header of the file, see _columns.
+        __grids__:                  list
+                                    The frequency ranges per response.
+        __responses__:              list
+                                    The indices of the responses to convert, where None converts every response.
+
+        Returns:
+        --------
+        Returns a list of data points in the form of [parameters, [[frequency range, responses], ...]].
+
+        Notes:
+        ------
+        None.
+        """
+
+        __selected__ = range(len(__header__['points'])) if __responses__ is None else list(__responses__)
+        for __j__ in __selected__:
+            if __j__ >= len(__header__['points']):
+                raise Exception(f'<Filing: _unpack: Response {__j__} is not one of the {len(__header__["points"])} '
+                                f'responses of the data points>')
+
+        __offsets__ = np.cumsum([0] + __header__['points'])
+        __parameters__ = __records__['parameters'].tolist()
+        __index__ = __records__['grid'].tolist()
+        __frequency__ = {__j__: __grids__[__j__].tolist() for __j__ in __selected__}
+        __responses__ = {__j__: __records__['responses'][:, __offsets__[__j__]:__offsets__[__j__ + 1]].tolist()
+                         for __j__ in __selected__}
+
+        # Every data point gets a copy of its frequency range, as for the text format
+        return [[__parameters__[__i__], [[list(__frequency__[__j__][__index__[__i__][__j__]]),
+                                          __responses__[__j__][__i__]] for __j__ in __selected__]]
+                for __i__ in range(len(__parameters__))]
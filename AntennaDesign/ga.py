@@ -289,7 +289,9 @@ class SearchSpaceOptimizer:
                         __best_minimum__ = self.__pool_fitness__[__j__]
 
             # Save the evaluation results (fitness values) of the population
-            self.__filing__.Append(Filename=self.__files__[3], List=self.__pool_fitness__)
+            if self.__filing__.Append(Filename=self.__files__[3], List=self.__pool_fitness__) == -1:
+                raise Exception(f'<SearchSpaceOptimizer: Search: Unable to append the fitness values to '
+                                f'{self.__files__[3]}>')
 
             # Update pool to new generation
             self.__pool__ = __new_generation__
@@ -390,7 +392,9 @@ class SearchSpaceOptimizer:
                 if not isinstance(__temp__, list):
                     __pool__[__i__][1] = \
                         self.__individual__.SimulateModel(Parameters=__pool__[__i__][0], Rounding=self.__rounding__)
-                    self.__filing__.Append(Filename=self.__files__[1], List=__pool__[__i__])
+                    if self.__filing__.Append(Filename=self.__files__[1], List=__pool__[__i__]) == -1:
+                        raise Exception(f'<SearchSpaceOptimizer: _populate_simulation_results: Unable to append '
+                                        f'individual {__pool__[__i__][0]} to {self.__files__[1]}>')
 
                 # Duplicate found, assign the __temp__ to the individual/child
                 else:
@@ -0,0 +1,499 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+
+
+class KrigingModel:
+    """
+    Description:
+    ------------
+    Based on ordinary kriging (Gaussian process regression), this class is a surrogate for the small datasets that are
+    generated by CoarseModel.BuildDataset. The correlation matrix is shared by every output channel, thus the model is
+    fitted with a single Cholesky factorization, after which the outputs and their variance are predicted in closed
+    form. The class follows the FeedForward and PredictBatch interface of CoarseModel, so that either can be used as
+    the surrogate of the particle swarm optimizer.
+
+    Attributes:
+    -----------
+    __phi_k__:                      int
+                                    The number of output channels.
+    __kernel__:                     str
+                                    The name of the correlation function, either 'gaussian' or 'matern52'.
+    __nugget__:                     float
+                                    The value added to the diagonal of the correlation matrix, for numerical stability
+                                    and noisy simulation results.
+    __length_scale__:               float
+                                    The length scale of the correlation function, in normalized input units.
+    __lower__:                      ndarray
+                                    The lower bound per input channel, used for normalizing the inputs.
+    __range__:                      ndarray
+                                    The range per input channel, used for normalizing the inputs.
+    __inputs__:                     ndarray
+                                    The normalized inputs of the fitted data points, one row per data point.
+    __targets__:                    ndarray
+                                    The targets of the fitted data points, one row per data point.
+    __cholesky__:                   ndarray
+                                    The lower triangular Cholesky factor of the correlation matrix.
+    __mean__:                       ndarray
+                                    The generalized least squares mean per output channel.
+    __weights__:                    ndarray
+                                    The inverse of the correlation matrix multiplied with the centred targets.
+    __sigma2__:                     ndarray
+                                    The process variance per output channel.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(NumberOfInputChannels=None, NumberOfOutputChannels=None, Kernel='gaussian', Nugget=1e-8, Bounds=None,
+                Debugging=False):
+                                    The constructor of the class.
+    Fit(TrainingData=None, LengthScale=None):
+                                    Fits the model to the data points, where the length scale is estimated by maximum
+                                    likelihood if it is not defined.
+    Update(NewData=None):
+                                    Adds data points to the fitted model by extending the Cholesky factor in closed
+                                    form.
+    FeedForward(__input__, __target__=None, __learn__=False, __return_outputs__=False):
+                                    Returns the predicted output for a single input, following the CoarseModel
+                                    interface.
+    PredictBatch(Inputs=None, ReturnVariance=False):
+                                    Predicts the outputs, and optionally the variance, for a batch of inputs.
+    Jacobian(Inputs=None):
+                                    Determines the derivatives of the predicted outputs with respect to the inputs.
+    _normalize(__input__):
+                                    Scales the inputs to the unit hypercube.
+    _correlation(__a__, __b__):
+                                    Determines the correlation matrix between two sets of normalized inputs.
+    _solve():
+                                    Determines the mean, weights, and process variance from the Cholesky factor.
+    _likelihood():
+                                    Determines the concentrated log-likelihood of the fitted model.
+
+    Notes:
+    ------
+    The number of data points is expected to be in the hundreds, as fitting scales with the cube of the number of data
+    points.
+    """
+
+    def __init__(self, NumberOfInputChannels=None, NumberOfOutputChannels=None, Kernel='gaussian', Nugget=1e-8,
+                 Bounds=None, Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the KrigingModel class.
+
+        Parameters:
+        -----------
+        NumberOfInputChannels:      int
+                                    The number of input channels (parameters).
+        NumberOfOutputChannels:     int
+                                    The number of output channels.
+        Kernel:                     str
+                                    The name of the correlation function, either 'gaussian' or 'matern52'.
+        Nugget:                     float
+                                    The value added to the diagonal of the correlation matrix.
+        Bounds:                     list
+                                    The range per input channel in the form of [minimum, maximum], for instance the
+                                    ranges of the parameters of the ModelGeometry. When None, the ranges are taken from
+                                    the data points given to Fit.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if NumberOfInputChannels is None or NumberOfOutputChannels is None:
+            raise Exception('<KrigingModel: __init__: NumberOfInputChannels and/or NumberOfOutputChannels is of None '
+                            'type>')
+        if Kernel not in ['gaussian', 'matern52']:
+            raise Exception(f'<KrigingModel: __init__: Unknown kernel {Kernel}>')
+
+        self.__phi_k__ = NumberOfOutputChannels
+        self.__kernel__ = Kernel
+        self.__nugget__ = Nugget
+        self.__length_scale__ = None
+
+        # Input normalization
+        if Bounds is not None:
+            if len(Bounds) != NumberOfInputChannels:
+                raise Exception('<KrigingModel: __init__: Bounds must have a range per input channel>')
+            self.__lower__ = np.asarray([__i__[0] for __i__ in Bounds], dtype=np.float64)
+            self.__range__ = np.asarray([__i__[1] - __i__[0] for __i__ in Bounds], dtype=np.float64)
+        else:
+            self.__lower__ = None
+            self.__range__ = None
+
+        # Fitted model
+        self.__inputs__ = np.zeros((0, NumberOfInputChannels))
+        self.__targets__ = np.zeros((0, NumberOfOutputChannels))
+        self.__cholesky__ = None
+        self.__mean__ = None
+        self.__weights__ = None
+        self.__sigma2__ = None
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+    def Fit(self, TrainingData=None, LengthScale=None):
+        """
+        Description:
+        ------------
+        Fits the model to the data points. When LengthScale is None, the length scale is chosen from a logarithmic grid
+        by maximizing the concentrated log-likelihood, where every candidate costs a single Cholesky factorization.
+
+        Parameters:
+        -----------
+        TrainingData:               list
+                                    The training data, where each data point is in the form of [input, target].
+        LengthScale:                float
+                                    The length scale of the correlation function in normalized input units, or None.
+
+        Returns:
+        --------
+        Returns the leave-one-out normalized RMSE per data point as a list, determined in closed form, which is
+        comparable to the testing loss of CoarseModel.Train.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if TrainingData is None or len(TrainingData) < 2:
+            raise Exception('<KrigingModel: Fit: At least two data points are required>')
+
+        __input__ = np.asarray([__i__[0] for __i__ in TrainingData], dtype=np.float64)
+        __target__ = np.asarray([__i__[1] for __i__ in TrainingData], dtype=np.float64)
+
+        if __input__.shape[1] != self.__inputs__.shape[1] or __target__.shape[1] != self.__phi_k__:
+            raise Exception(f'<KrigingModel: Fit: The model expects {self.__inputs__.shape[1]} input values and '
+                            f'{self.__phi_k__} target values, but the data has {__input__.shape[1]} and '
+                            f'{__target__.shape[1]}>')
+
+        # Take the input ranges from the data, should they not be defined
+        if self.__range__ is None:
+            self.__lower__ = __input__.min(axis=0)
+            self.__range__ = np.where(np.ptp(__input__, axis=0) > 0, np.ptp(__input__, axis=0), 1.0)
+
+        self.__inputs__ = self._normalize(__input__=__input__)
+        self.__targets__ = __target__
+
+        if LengthScale is not None:
+            __candidates__ = [LengthScale]
+        else:
+            __candidates__ = np.logspace(-2, 1, 25) * np.sqrt(self.__inputs__.shape[1])
+
+        # Keep the length scale with the largest likelihood
+        __best__ = -np.inf
+        __best_length_scale__ = None
+        for __i__ in __candidates__:
+            self.__length_scale__ = float(__i__)
+            try:
+                self.__cholesky__ = linalg.cholesky(self._correlation(__a__=self.__inputs__, __b__=self.__inputs__) +
+                                                    self.__nugget__ * np.eye(len(self.__inputs__)), lower=True)
+            except linalg.LinAlgError as __error__:
+                if self.__debugging__:
+                    print(f'<KrigingModel: Fit: Length scale {self.__length_scale__} skipped: {__error__}>')
+                continue
+
+            self._solve()
+            __likelihood__ = self._likelihood()
+            if __likelihood__ > __best__:
+                __best__ = __likelihood__
+                __best_length_scale__ = self.__length_scale__
+
+        if __best_length_scale__ is None:
+            raise Exception('<KrigingModel: Fit: The correlation matrix is not positive definite, increase the '
+                            'Nugget>')
+
+        # Refit with the best length scale
+        self.__length_scale__ = __best_length_scale__
+        self.__cholesky__ = linalg.cholesky(self._correlation(__a__=self.__inputs__, __b__=self.__inputs__) +
+                                            self.__nugget__ * np.eye(len(self.__inputs__)), lower=True)
+        self._solve()
+
+        # Leave-one-out residuals, r_i = (R^-1 (y - mean))_i / (R^-1)_ii
+        __inverse__ = linalg.cho_solve((self.__cholesky__, True), np.eye(len(self.__inputs__)))
+        __prediction__ = self.__targets__ - self.__weights__ / np.diag(__inverse__)[:, np.newaxis]
+
+        return (np.sum(np.abs(self.__targets__ - __prediction__), axis=1) /
+                (self.__targets__.max(axis=1) - self.__targets__.min(axis=1))).tolist()
+
+    def Update(self, NewData=None):
+        """
+        Description:
+        ------------
+        Adds data points to the fitted model without refactorizing the correlation matrix, where the Cholesky factor
+        is extended with the rows of the new data points. The length scale and input normalization are kept.
+
+        Parameters:
+        -----------
+        NewData:                    list
+                                    The new data, where each data point is in the form of [input, target].
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        Updating costs O(n^2 m) for n fitted and m new data points, compared to O((n + m)^3) for Fit. The length
+        scale should be re-estimated with Fit once the dataset has grown considerably.
+        """
+
+        if self.__cholesky__ is None:
+            raise Exception('<KrigingModel: Update: The model must be fitted with Fit first>')
+        if NewData is None or len(NewData) == 0:
+            raise Exception('<KrigingModel: Update: NewData is of None type or empty>')
+
+        __input__ = self._normalize(__input__=np.asarray([__i__[0] for __i__ in NewData], dtype=np.float64))
+        __target__ = np.asarray([__i__[1] for __i__ in NewData], dtype=np.float64)
+
+        # [[L, 0], [B^T, C]] is the Cholesky factor of [[R, K], [K^T, R_new]], where L B = K and
+        # C C^T = R_new - B^T B
+        __b__ = linalg.solve_triangular(self.__cholesky__,
+                                        self._correlation(__a__=self.__inputs__, __b__=__input__), lower=True)
+        __c__ = linalg.cholesky(self._correlation(__a__=__input__, __b__=__input__) +
+                                self.__nugget__ * np.eye(len(__input__)) - __b__.T @ __b__, lower=True)
+
+        __n__ = len(self.__inputs__)
+        __cholesky__ = np.zeros((__n__ + len(__input__), __n__ + len(__input__)))
+        __cholesky__[:__n__, :__n__] = self.__cholesky__
+        __cholesky__[__n__:, :__n__] = __b__.T
+        __cholesky__[__n__:, __n__:] = __c__
+
+        self.__cholesky__ = __cholesky__
+        self.__inputs__ = np.concatenate((self.__inputs__, __input__))
+        self.__targets__ = np.concatenate((self.__targets__, __target__))
+        self._solve()
+
+    def FeedForward(self, __input__, __target__=None, __learn__=False, __return_outputs__=False):
+        """
+        Description:
+        ------------
+        Predicts the output for a single input, following the CoarseModel.FeedForward interface.
+
+        Parameters:
+        -----------
+        __input__:                  list
+                                    The input to the model.
+        __target__:                 list
+                                    The actual outputs, which are added to the model through Update when __learn__ is
+                                    True.
+        __learn__:                  bool
+                                    When True, the data point [__input__, __target__] is added to the model.
+        __return_outputs__:         bool
+                                    Used for returning the predicted output values when True.
+
+        Returns:
+        --------
+        Returns the predicted output values, in a 1D list, should the outputs be required to be returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __return_outputs__:
+            __output__ = self.PredictBatch(Inputs=[__input__])[0].tolist()
+        else:
+            __output__ = None
+
+        if __learn__:
+            self.Update(NewData=[[__input__, __target__]])
+
+        return __output__
+
+    def PredictBatch(self, Inputs=None, ReturnVariance=False):
+        """
+        Description:
+        ------------
+        Predicts the outputs, and optionally their variance, for a batch of inputs in a single vectorized operation.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels). A 1D array is treated as a single sample.
+        ReturnVariance:             bool
+                                    When True, the kriging variance is returned along with the prediction.
+
+        Returns:
+        --------
+        Returns the prediction, a 2D array in the form of (number of samples, number of output channels). If
+        ReturnVariance is True, a tuple of the prediction and the variance, both in the same form, is returned instead.
+
+        Notes:
+        ------
+        None of the attributes of the class are changed.
+        """
+
+        if self.__cholesky__ is None:
+            raise Exception('<KrigingModel: PredictBatch: The model must be fitted with Fit first>')
+
+        __input__ = self._normalize(__input__=np.atleast_2d(np.asarray(Inputs, dtype=np.float64)))
+        if __input__.shape[1] != self.__inputs__.shape[1]:
+            raise Exception(f'<KrigingModel: PredictBatch: Inputs must have {self.__inputs__.shape[1]} columns, not '
+                            f'{__input__.shape[1]}>')
+
+        __correlation__ = self._correlation(__a__=__input__, __b__=self.__inputs__)
+        __prediction__ = self.__mean__ + __correlation__ @ self.__weights__
+
+        if ReturnVariance:
+            __v__ = linalg.solve_triangular(self.__cholesky__, __correlation__.T, lower=True)
+            __reduction__ = np.maximum(1 + self.__nugget__ - np.sum(__v__ ** 2, axis=0), 0.0)
+            return __prediction__, __reduction__[:, np.newaxis] * self.__sigma2__
+
+        return __prediction__
+
+    def Jacobian(self, Inputs=None):
+        """
+        Description:
+        ------------
+        Determines the derivatives of the predicted outputs with respect to the inputs for a batch of inputs, in
+        closed form from the derivatives of the correlation function.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels). A 1D array is treated as a single sample.
+
+        Returns:
+        --------
+        Returns a 3D array in the form of (number of samples, number of output channels, number of input channels).
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__cholesky__ is None:
+            raise Exception('<KrigingModel: Jacobian: The model must be fitted with Fit first>')
+
+        __input__ = self._normalize(__input__=np.atleast_2d(np.asarray(Inputs, dtype=np.float64)))
+        if __input__.shape[1] != self.__inputs__.shape[1]:
+            raise Exception(f'<KrigingModel: Jacobian: Inputs must have {self.__inputs__.shape[1]} columns, not '
+                            f'{__input__.shape[1]}>')
+
+        # Differences in the form of (number of samples, number of fitted data points, number of input channels)
+        __difference__ = (__input__[:, np.newaxis, :] - self.__inputs__[np.newaxis]) / self.__length_scale__ ** 2
+
+        # Derivative of the correlation function divided by the derivative of the squared distance
+        __correlation__ = self._correlation(__a__=__input__, __b__=self.__inputs__)
+        if self.__kernel__ == 'gaussian':
+            __slope__ = -__correlation__
+        else:
+            __distance__ = np.sqrt(5 * np.sum(__difference__ ** 2, axis=2)) * self.__length_scale__
+            __slope__ = -5 / 3 * (1 + __distance__) * np.exp(-__distance__)
+
+        # Chain rule through the normalization of the inputs
+        return np.einsum('nm,nmp,mk->nkp', __slope__, __difference__, self.__weights__) / self.__range__
+
+    def _normalize(self, __input__):
+        """
+        Description:
+        ------------
+        Scales the inputs to the unit hypercube given the input ranges.
+
+        Parameters:
+        -----------
+        __input__:                  ndarray
+                                    A 2D array of inputs, one row per sample.
+
+        Returns:
+        --------
+        Returns the normalized inputs.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return (__input__ - self.__lower__) / self.__range__
+
+    def _correlation(self, __a__, __b__):
+        """
+        Description:
+        ------------
+        Determines the correlation matrix between two sets of normalized inputs, given the kernel and length scale.
+
+        Parameters:
+        -----------
+        __a__:                      ndarray
+                                    A 2D array of normalized inputs, one row per sample.
+        __b__:                      ndarray
+                                    A 2D array of normalized inputs, one row per sample.
+
+        Returns:
+        --------
+        Returns a 2D array in the form of (number of samples in __a__, number of samples in __b__).
+
+        Notes:
+        ------
+        None.
+        """
+
+        # Squared distances, ||a||^2 + ||b||^2 - 2 a.b, clipped against round-off
+        __distance__ = np.maximum(np.sum(__a__ ** 2, axis=1)[:, np.newaxis] + np.sum(__b__ ** 2, axis=1) -
+                                  2 * __a__ @ __b__.T, 0.0) / self.__length_scale__ ** 2
+
+        if self.__kernel__ == 'gaussian':
+            return np.exp(-0.5 * __distance__)
+
+        __distance__ = np.sqrt(5 * __distance__)
+        return (1 + __distance__ + __distance__ ** 2 / 3) * np.exp(-__distance__)
+
+    def _solve(self):
+        """
+        Description:
+        ------------
+        Determines the generalized least squares mean, the weights, and the process variance per output channel from
+        the Cholesky factor of the correlation matrix.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __ones__ = linalg.cho_solve((self.__cholesky__, True), np.ones(len(self.__inputs__)))
+        self.__mean__ = (__ones__ @ self.__targets__) / np.sum(__ones__)
+        self.__weights__ = linalg.cho_solve((self.__cholesky__, True), self.__targets__ - self.__mean__)
+        self.__sigma2__ = np.maximum(np.sum((self.__targets__ - self.__mean__) * self.__weights__, axis=0) /
+                                     len(self.__inputs__), np.finfo(np.float64).tiny)
+
+    def _likelihood(self):
+        """
+        Description:
+        ------------
+        Determines the concentrated log-likelihood of the fitted model, summed over the output channels.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        Returns the log-likelihood, up to a constant.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return -0.5 * (len(self.__inputs__) * np.sum(np.log(self.__sigma2__)) +
+                       2 * self.__phi_k__ * np.sum(np.log(np.diag(self.__cholesky__))))
@@ -0,0 +1,151 @@
+# A standalone loader for surrogates exported with CoarseModel.Export or CompressedSurrogate.Export. This module is
+# copied next to the exported archive and only depends on NumPy, thus it must not import the AntennaDesign package
+import numpy as np
+
+
+class Predictor:
+    """
+    Description:
+    ------------
+    Predicts the outputs of an exported surrogate, without the AntennaDesign package. The archive keeps the number of
+    neurons per layer and the contiguous weights of the neural network, as well as the basis of a CompressedSurrogate
+    (if exported from one).
+
+    Attributes:
+    -----------
+    __weights_array__:              list
+                                    A list of 2D arrays, one per layer, with the bias weights kept in the last row.
+    __basis__:                      list
+                                    A list in the form of [mean, components, lower, range] for reconstructing the full
+                                    curves, or None.
+
+    Methods:
+    --------
+    __init__(Filename=None):
+                                    The constructor of the class, where the archive is loaded.
+    PredictBatch(Inputs=None):
+                                    Predicts the outputs for a batch of inputs.
+    FeedForward(__input__, __target__=None, __learn__=False, __return_outputs__=False):
+                                    Returns the output for a single input, following the CoarseModel interface.
+
+    Notes:
+    ------
+    Usage, from the directory of the archive:
+        from predictor import Predictor
+        surrogate = Predictor('Predictor.npz')
+        outputs = surrogate.PredictBatch([[...], ...])
+    """
+
+    def __init__(self, Filename=None):
+        """
+        Description:
+        ------------
+        The constructor of the Predictor class, where the weights are split into the weight matrices per layer.
+
+        Parameters:
+        -----------
+        Filename:                   str
+                                    The path of the archive, 'Predictor.npz'.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if Filename is None:
+            raise Exception('<Predictor: __init__: Filename is of None type>')
+
+        with np.load(Filename, allow_pickle=False) as __archive__:
+            if int(__archive__['version']) != 1:
+                raise Exception(f'<Predictor: __init__: Unsupported archive version {int(__archive__["version"])}>')
+
+            __layer_sizes__ = __archive__['layer_sizes'].tolist()
+            __weights__ = __archive__['weights']
+
+            if 'components' in __archive__.files:
+                self.__basis__ = [__archive__['mean'], __archive__['components'], __archive__['lower'],
+                                  __archive__['range']]
+            else:
+                self.__basis__ = None
+
+        # The input layer only has bias weights, where every other layer keeps its bias weights in the last row
+        __shapes__ = [(__layer_sizes__[0], 1)] + [(__layer_sizes__[__i__ - 1] + 1, __layer_sizes__[__i__])
+                                                  for __i__ in range(1, len(__layer_sizes__))]
+        self.__weights_array__ = []
+        __offset__ = 0
+        for __i__ in __shapes__:
+            self.__weights_array__.append(__weights__[__offset__:__offset__ + __i__[0] * __i__[1]].reshape(__i__))
+            __offset__ += __i__[0] * __i__[1]
+
+    def PredictBatch(self, Inputs=None):
+        """
+        Description:
+        ------------
+        Predicts the outputs for a batch of inputs, in the same way as CoarseModel.PredictBatch.
+
+        Parameters:
+        -----------
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels). A 1D array is treated as a single sample.
+
+        Returns:
+        --------
+        Returns a 2D array in the form of (number of samples, number of output channels).
+
+        Notes:
+        ------
+        None.
+        """
+
+        __output__ = np.atleast_2d(np.asarray(Inputs, dtype=self.__weights_array__[0].dtype))
+        if __output__.shape[1] != self.__weights_array__[0].shape[0]:
+            raise Exception(f'<Predictor: PredictBatch: Inputs must have {self.__weights_array__[0].shape[0]} '
+                            f'columns, not {__output__.shape[1]}>')
+
+        __output__ = 1 / (1 + np.exp(-(__output__ + self.__weights_array__[0][:, 0])))
+        for __i__ in self.__weights_array__[1:]:
+            __output__ = 1 / (1 + np.exp(-(__output__ @ __i__[:-1] + __i__[-1])))
+
+        # Reconstruct the full curves from the scaled coefficients
+        if self.__basis__ is not None:
+            __output__ = self.__basis__[0] + \
+                ((__output__ - 0.1) / 0.8 * self.__basis__[3] + self.__basis__[2]) @ self.__basis__[1]
+
+        return __output__
+
+    def FeedForward(self, __input__, __target__=None, __learn__=False, __return_outputs__=False):
+        """
+        Description:
+        ------------
+        Predicts the output for a single input, following the CoarseModel.FeedForward interface.
+
+        Parameters:
+        -----------
+        __input__:                  list
+                                    The input to the neural network.
+        __target__:                 list
+                                    Unused, kept for the CoarseModel interface.
+        __learn__:                  bool
+                                    Must be False, an exported surrogate can not be trained.
+        __return_outputs__:         bool
+                                    Used for returning the output values when True.
+
+        Returns:
+        --------
+        Returns the output values, in a 1D list, should the outputs be required to be returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __learn__:
+            raise Exception('<Predictor: FeedForward: An exported surrogate can not be trained>')
+
+        if __return_outputs__:
+            return self.PredictBatch(Inputs=[__input__])[0].tolist()
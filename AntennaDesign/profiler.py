@@ -0,0 +1,221 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+
+
+class Profiler:
+    """
+    Description:
+    ------------
+    Records the cumulative wall time and number of calls per phase of training, such as the forward passes, gradients,
+    moments, weight updates, and checkpoints, both in total and per epoch. A disabled profiler records nothing, so that
+    the phases can always be wrapped with Phase.
+
+    Attributes:
+    -----------
+    __enabled__:                    bool
+                                    When False, nothing is recorded.
+    __total__:                      dict
+                                    The cumulative [seconds, calls] per phase.
+    __epoch__:                      dict
+                                    The cumulative [seconds, calls] per phase of the current epoch.
+    __epochs__:                     list
+                                    A record per finished epoch in the form of {'Epoch', 'Seconds', 'Samples',
+                                    'SamplesPerSecond', 'Phases'}.
+    __stack__:                      list
+                                    The phases that have been entered, along with their start times.
+
+    Methods:
+    --------
+    __init__(Enabled=True):
+                                    The constructor of the class.
+    Phase(Name=None):
+                                    Returns the profiler as a context manager that records the time of the phase Name.
+    Epoch(NumberOfSamples=0, Seconds=0.0):
+                                    Closes the record of the current epoch.
+    Summary():
+                                    Returns the totals and the records per epoch.
+    Export(Filing=None, Filename=None, Format='csv'):
+                                    Writes the summary to a CSV or JSON file for tracking regressions.
+
+    Notes:
+    ------
+    Usage:
+        with profiler.Phase(Name='forward'):
+            ...
+    """
+
+    def __init__(self, Enabled=True):
+        """
+        Description:
+        ------------
+        The constructor of the Profiler class.
+
+        Parameters:
+        -----------
+        Enabled:                    bool
+                                    When False, nothing is recorded.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        self.__enabled__ = Enabled
+        self.__total__ = {}
+        self.__epoch__ = {}
+        self.__epochs__ = []
+        self.__stack__ = []
+
+    def Phase(self, Name=None):
+        """
+        Description:
+        ------------
+        Returns the profiler as a context manager, which records the wall time of the phase Name from entering to
+        exiting the context.
+
+        Parameters:
+        -----------
+        Name:                       str
+                                    The name of the phase.
+
+        Returns:
+        --------
+        Returns the profiler.
+
+        Notes:
+        ------
+        Phases may be nested, in which case the time of the inner phase is also part of the outer phase.
+        """
+
+        if self.__enabled__:
+            self.__stack__.append([Name, None])
+
+        return self
+
+    def __enter__(self):
+        if self.__enabled__:
+            self.__stack__[-1][1] = time.perf_counter()
+
+        return self
+
+    def __exit__(self, __type__, __value__, __traceback__):
+        if self.__enabled__:
+            __phase__, __start__ = self.__stack__.pop()
+            __seconds__ = time.perf_counter() - __start__
+
+            for __i__ in (self.__total__, self.__epoch__):
+                __record__ = __i__.setdefault(__phase__, [0.0, 0])
+                __record__[0] += __seconds__
+                __record__[1] += 1
+
+        return False
+
+    def Epoch(self, NumberOfSamples=0, Seconds=0.0):
+        """
+        Description:
+        ------------
+        Closes the record of the current epoch, after which the phases are recorded for the next epoch.
+
+        Parameters:
+        -----------
+        NumberOfSamples:            int
+                                    The number of training samples of the epoch.
+        Seconds:                    float
+                                    The wall time of the epoch.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if not self.__enabled__:
+            return
+
+        self.__epochs__.append({'Epoch': len(self.__epochs__) + 1,
+                                'Seconds': Seconds,
+                                'Samples': NumberOfSamples,
+                                'SamplesPerSecond': NumberOfSamples / Seconds if Seconds > 0 else 0.0,
+                                'Phases': {__i__: list(self.__epoch__[__i__]) for __i__ in self.__epoch__}})
+        self.__epoch__ = {}
+
+    def Summary(self):
+        """
+        Description:
+        ------------
+        Returns the totals and the records per epoch.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        Returns a dictionary in the form of {'Seconds', 'Samples', 'SamplesPerSecond', 'Phases', 'Epochs'}, where
+        'Phases' maps the name of every phase to [seconds, calls] and 'Epochs' is a list of the records per epoch.
+
+        Notes:
+        ------
+        The totals also include the phases outside of the epochs, such as the final checkpoint and testing.
+        """
+
+        __seconds__ = sum(__i__['Seconds'] for __i__ in self.__epochs__)
+        __samples__ = sum(__i__['Samples'] for __i__ in self.__epochs__)
+
+        return {'Seconds': __seconds__,
+                'Samples': __samples__,
+                'SamplesPerSecond': __samples__ / __seconds__ if __seconds__ > 0 else 0.0,
+                'Phases': {__i__: list(self.__total__[__i__]) for __i__ in self.__total__},
+                'Epochs': copy.deepcopy(self.__epochs__)}
+
+    def Export(self, Filing=None, Filename=None, Format='csv'):
+        """
+        Description:
+        ------------
+        Writes the summary to a file, either as CSV, with a row per phase per epoch (where the epoch of the totals is
+        'total'), or as JSON.
+
+        Parameters:
+        -----------
+        Filing:                     Filing
+                                    The Filing instance used for writing the file.
+        Filename:                   str
+                                    The full path, with the filename and extension, of the file.
+        Format:                     str
+                                    Either 'csv' or 'json'.
+
+        Returns:
+        --------
+        Returns 0 when the operation is successfully complete, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if Filing is None or Filename is None:
+            raise Exception('<Profiler: Export: Filing and/or Filename is of None type>')
+        if Format not in ['csv', 'json']:
+            raise Exception(f'<Profiler: Export: Unknown format {Format}>')
+
+        __summary__ = self.Summary()
+
+        if Format == 'json':
+            return Filing.SaveText(Filename=Filename, Text=json.dumps(__summary__, indent=4))
+
+        __lines__ = ['epoch,phase,seconds,calls,epoch_seconds,samples,samples_per_second']
+        for __i__ in __summary__['Epochs'] + [dict(__summary__, Epoch='total')]:
+            for __j__ in __i__['Phases']:
+                __lines__.append(f'{__i__["Epoch"]},{__j__},{__i__["Phases"][__j__][0]:.9f},'
+                                 f'{__i__["Phases"][__j__][1]},{__i__["Seconds"]:.9f},{__i__["Samples"]},'
+                                 f'{__i__["SamplesPerSecond"]:.3f}')
+
+        return Filing.SaveText(Filename=Filename, Text='\n'.join(__lines__) + '\n')
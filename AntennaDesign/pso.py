@@ -16,9 +16,9 @@ class PSO:
                                     A list of parameter boundaries per parameter in the form of
                                     [[lower bound 0, upper bound 0], [lower bound 1, upper bound 1], ...,
                                     [lower bound n, upper bound n]].
-    __surrogate__:                  list
-                                    A list with two surrogates of type CoarseModel. Each surrogate is assumed to be
-                                    trained and ready for predictions.
+    __surrogate__:                  CoarseModel
+                                    A surrogate of type CoarseModel or KrigingModel, or any surrogate with a
+                                    PredictBatch method, that is assumed to be trained and ready for predictions.
     __particle__:                   list
                                     A list of particles for exploration. Each particle has the form of
                                     [position, velocity, current fitness, personal best fitness, personal best
@@ -236,8 +236,11 @@ class PSO:
         """
         # for __i__ in range(len(self.__particle__)):
         #     self.__particle__[__i__][2][0] = 0.1 * self.__particle__[__i__][0][0] ** 2 + 18 * self.__particle__[__i__][0][0] - 48
+        # Predict the responses of all the particles in a single batch
+        __prediction__ = self.__surrogate__.PredictBatch(Inputs=[__i__[0] for __i__ in self.__particle__])
+
         for __i__ in range(len(self.__particle__)):
-            __temp__ = self.__surrogate__.FeedForward(__input__=self.__particle__[__i__][0], __target__=None, __return_outputs__=True)
+            __temp__ = __prediction__[__i__].tolist()
             __temp__[0] *= 10
             __temp__[1] *= 10
             __temp__[3] = -np.log(1 / __temp__[3] - 1)
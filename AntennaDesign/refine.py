@@ -0,0 +1,191 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+
+
+class GradientRefiner:
+    """
+    Description:
+    ------------
+    Refines designs, for instance the global best of the particle swarm optimizer, with a gradient-based local
+    optimizer (L-BFGS-B) against a trained surrogate. The objective is the weighted mean-square-error between the
+    predicted outputs and the target outputs, where the gradient is determined from the Jacobian of the surrogate, so
+    that a design is polished in a handful of iterations.
+
+    Attributes:
+    -----------
+    __surrogate__:                  CoarseModel
+                                    A trained surrogate with a PredictBatch method and, preferably, a Jacobian method.
+    __boundary__:                   list
+                                    A list of parameter boundaries per parameter in the form of
+                                    [[lower bound 0, upper bound 0], ..., [lower bound n, upper bound n]].
+    __target__:                     ndarray
+                                    The target output per output channel.
+    __weights__:                    ndarray
+                                    The weight of the error per output channel, normalized to a sum of 1.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(Surrogate=None, ParameterRanges=None, Model=None, Target=None, Weights=None, Debugging=False):
+                                    The constructor of the class, where the bounds are either the ParameterRanges or
+                                    the parameter ranges of the ModelGeometry.
+    Refine(StartingPoints=None, MaximumIterations=20, Tolerance=1e-10):
+                                    Refines every starting point and returns the refined designs, from the best to the
+                                    worst objective.
+    _objective(__position__):
+                                    Determines the objective, and its gradient, of a design.
+
+    Notes:
+    ------
+    Surrogates without a Jacobian method are supported, in which case the gradient is approximated with finite
+    differences, at the cost of a prediction per parameter per iteration.
+    """
+
+    def __init__(self, Surrogate=None, ParameterRanges=None, Model=None, Target=None, Weights=None, Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the GradientRefiner class.
+
+        Parameters:
+        -----------
+        Surrogate:                  CoarseModel
+                                    A trained surrogate, for instance a CoarseModel, CompressedSurrogate, KrigingModel,
+                                    or SurrogateEnsemble.
+        ParameterRanges:            list
+                                    A list of lists, where each parameter is a list of the form [lower bound,
+                                    upper bound].
+        Model:                      ModelGeometry
+                                    When ParameterRanges is None, the parameter ranges of the ModelGeometry are used.
+        Target:                     list
+                                    The target output per output channel of the surrogate, for instance the linear
+                                    return loss that the design should reach.
+        Weights:                    list
+                                    The weight of the error per output channel, for instance 1 within the band of
+                                    interest and 0 elsewhere. When None, every output channel is weighted equally.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if Surrogate is None or Target is None:
+            raise Exception('<GradientRefiner: __init__: Surrogate and/or Target is of None type>')
+        if ParameterRanges is None and Model is None:
+            raise Exception('<GradientRefiner: __init__: Both ParameterRanges and Model are of None type>')
+
+        self.__surrogate__ = Surrogate
+        if ParameterRanges is not None:
+            self.__boundary__ = [list(__i__) for __i__ in ParameterRanges]
+        else:
+            self.__boundary__ = [list(__i__) for __i__ in Model.__parameter__['range']]
+
+        self.__target__ = np.asarray(Target, dtype=np.float64)
+        if Weights is None:
+            self.__weights__ = np.ones(len(self.__target__))
+        else:
+            self.__weights__ = np.asarray(Weights, dtype=np.float64)
+        if self.__weights__.shape != self.__target__.shape or np.sum(self.__weights__) <= 0:
+            raise Exception('<GradientRefiner: __init__: Weights must be positive and have a weight per output '
+                            'channel of Target>')
+        self.__weights__ = self.__weights__ / np.sum(self.__weights__)
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+    def Refine(self, StartingPoints=None, MaximumIterations=20, Tolerance=1e-10):
+        """
+        Description:
+        ------------
+        Refines every starting point with L-BFGS-B, where the parameters are kept within their bounds.
+
+        Parameters:
+        -----------
+        StartingPoints:             list
+                                    A list of designs (parameter values) to refine, for instance the global best of
+                                    PSO.Optimize. A single design is also accepted.
+        MaximumIterations:          int
+                                    The maximum number of iterations per starting point.
+        Tolerance:                  float
+                                    The relative reduction of the objective below which the refinement stops.
+
+        Returns:
+        --------
+        Returns a list in the form of [[parameter values, objective], ...], sorted from the best to the worst
+        objective.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if StartingPoints is None:
+            raise Exception('<GradientRefiner: Refine: StartingPoints is of None type>')
+
+        __points__ = np.atleast_2d(np.asarray(StartingPoints, dtype=np.float64))
+        if __points__.shape[1] != len(self.__boundary__):
+            raise Exception(f'<GradientRefiner: Refine: A design must have {len(self.__boundary__)} parameters, not '
+                            f'{__points__.shape[1]}>')
+
+        # Without a Jacobian, only the objective is returned and L-BFGS-B approximates the gradient
+        __gradient__ = hasattr(self.__surrogate__, 'Jacobian')
+        if __gradient__:
+            __function__ = self._objective
+        else:
+            def __function__(__x__):
+                return self._objective(__position__=__x__)[0]
+
+        __results__ = []
+        for __i__ in __points__:
+            __result__ = optimize.minimize(fun=__function__,
+                                           x0=np.clip(__i__, [__j__[0] for __j__ in self.__boundary__],
+                                                      [__j__[1] for __j__ in self.__boundary__]),
+                                           jac=__gradient__, method='L-BFGS-B', bounds=self.__boundary__,
+                                           options={'maxiter': MaximumIterations, 'ftol': Tolerance})
+
+            if self.__debugging__:
+                print(f'<GradientRefiner: Refine: {__result__.nit} iterations, objective '
+                      f'{"{:.6f}".format(__result__.fun)}: {__result__.message}>')
+
+            __results__.append([__result__.x.tolist(), float(__result__.fun)])
+
+        return sorted(__results__, key=lambda __x__: __x__[1])
+
+    def _objective(self, __position__):
+        """
+        Description:
+        ------------
+        Determines the weighted mean-square-error between the predicted outputs and the target outputs of a design, as
+        well as its gradient with respect to the parameters.
+
+        Parameters:
+        -----------
+        __position__:               ndarray
+                                    The parameter values of the design.
+
+        Returns:
+        --------
+        Returns a tuple in the form of (objective, gradient).
+
+        Notes:
+        ------
+        None.
+        """
+
+        __error__ = self.__surrogate__.PredictBatch(Inputs=[__position__])[0] - self.__target__
+        __objective__ = float(np.sum(self.__weights__ * __error__ ** 2))
+
+        if not hasattr(self.__surrogate__, 'Jacobian'):
+            return __objective__, None
+
+        __gradient__ = 2 * (self.__weights__ * __error__) @ self.__surrogate__.Jacobian(Inputs=[__position__])[0]
+
+        return __objective__, __gradient__.astype(np.float64)
@@ -1,6 +1,139 @@
 # The initialization module for the package AntennaDesign, which will be a list of common public libraries,
 # see AntennaDesign.__init__ for more information
 from AntennaDesign.__init__ import *
+from AntennaDesign.profiler import Profiler
+from AntennaDesign.kriging import KrigingModel
+
+# The state of a worker process, in the form of {'Model', 'Memory', 'Input', 'Target', 'Gradients'} for data-parallel
+# training, which is set once per worker by _attach_worker, or {'Simulator'} for simulating samples of BuildDataset,
+# which is set once per worker by _attach_simulator
+__worker_state__ = {}
+
+
+def _attach_worker(__configuration__):
+    """
+    Description:
+    ------------
+    Attaches a worker process of data-parallel training to the shared memory of the weights, the training data, and
+    the gradients, after which a bare CoarseModel is built on top of the shared weights. Nothing is copied, thus every
+    weight update of the main process is seen by the worker.
+
+    Parameters:
+    -----------
+    __configuration__:              dict
+                                    A dictionary with the keys 'Shapes', 'DataType', 'Weights', 'Input', 'Target', and
+                                    'Gradients', where every shared array is in the form of [name of the shared memory,
+                                    shape of the array].
+
+    Returns:
+    --------
+    None.
+
+    Notes:
+    ------
+    The bare CoarseModel only has the attributes used by _forward, _update_loss, and _update_gradients.
+    """
+
+    __worker_state__['Memory'] = []
+    for __i__ in ['Weights', 'Input', 'Target', 'Gradients']:
+        __memory__ = shared_memory.SharedMemory(name=__configuration__[__i__][0])
+        __worker_state__['Memory'].append(__memory__)
+        __worker_state__[__i__] = np.ndarray(__configuration__[__i__][1], dtype=__configuration__['DataType'],
+                                             buffer=__memory__.buf)
+
+    __model__ = CoarseModel.__new__(CoarseModel)
+    __model__.__dtype__ = np.dtype(__configuration__['DataType'])
+    __model__.__shapes__ = __configuration__['Shapes']
+    __model__.__weights_vector__ = __worker_state__['Weights']
+    __model__.__weights_array__ = __model__._views(__buffer__=__model__.__weights_vector__)
+    __worker_state__['Model'] = __model__
+
+
+def _shard_gradients(__shard__, __slot__, __batch_size__):
+    """
+    Description:
+    ------------
+    Determines the gradients of a shard of a batch within a worker process of data-parallel training, which are written
+    to the row __slot__ of the shared gradients.
+
+    Parameters:
+    -----------
+    __shard__:                      ndarray
+                                    The indices of the training samples of the shard.
+    __slot__:                       int
+                                    The row of the shared gradients that is owned by the shard.
+    __batch_size__:                 int
+                                    The number of samples of the whole batch, which the gradients are averaged over.
+
+    Returns:
+    --------
+    Returns a 1D array with the loss per sample of the shard.
+
+    Notes:
+    ------
+    Since the gradients of every shard are averaged over the whole batch, the sum of the rows is the gradient of the
+    batch.
+    """
+
+    __model__ = __worker_state__['Model']
+    __model__.__grad_vector__ = __worker_state__['Gradients'][__slot__]
+    __model__.__grad_vector__[:] = 0.0
+    __model__.__grad__ = __model__._views(__buffer__=__model__.__grad_vector__)
+
+    __activations__ = __model__._forward(__input__=__worker_state__['Input'][__shard__])
+    __model__._update_gradients(__activations__=__activations__, __target__=__worker_state__['Target'][__shard__],
+                                __batch_size__=__batch_size__)
+
+    return __model__._update_loss(__output__=__activations__[-1], __target__=__worker_state__['Target'][__shard__])
+
+
+def _attach_simulator(__factory__):
+    """
+    Description:
+    ------------
+    Builds the simulator of a worker process of BuildDataset, which is kept for every sample that the worker simulates.
+
+    Parameters:
+    -----------
+    __factory__:                    function
+                                    A function without arguments that returns an object with a SimulateModel(Parameters,
+                                    Rounding) method, for instance a ModelGeometry with its own FineModel session.
+
+    Returns:
+    --------
+    None.
+
+    Notes:
+    ------
+    None.
+    """
+
+    __worker_state__['Simulator'] = __factory__()
+
+
+def _simulate_sample(__sample__, __rounding__):
+    """
+    Description:
+    ------------
+    Simulates a sample of BuildDataset with the simulator of the worker process.
+
+    Parameters:
+    -----------
+    __sample__:                     list
+                                    The parameter values of the sample.
+    __rounding__:                   int
+                                    The rounding for the float value(s) of the parameter(s).
+
+    Returns:
+    --------
+    Returns the simulation results of the sample.
+
+    Notes:
+    ------
+    None.
+    """
+
+    return __worker_state__['Simulator'].SimulateModel(Parameters=__sample__, Rounding=__rounding__)
 
 
 class CoarseModel:
@@ -24,7 +157,8 @@ class CoarseModel:
     __N__:                          int
                                     The batch size for the neural network.
     __init_N__:                     int
-                                    Variable used to notify the network when to back-propagate.
+                                    Variable used to notify the network when to update the weights when samples are
+                                    learnt one at a time through FeedForward.
     __time_step__:                  int
                                     A variable used for adjusting the learning rate dynamically.
     __filing__:                     Filing
@@ -33,7 +167,18 @@ class CoarseModel:
                                     A string representing the directory for the instance of this class to store results.
     __files__:                      list
                                     A list that contains file names to create, write, and read from. The following files
-                                    are used: 'Weights' and 'lhs'.
+                                    are used: 'Weights', 'lhs', 'Weights.npy', 'Optimizer.npy', and 'Replay.npy'. The
+                                    'Weights' file is the text format of earlier builds, which is only read when
+                                    'Weights.npy' does not exist.
+    __checkpoint_steps__:           int
+                                    The number of weight updates between checkpoints of the weights, or None.
+    __checkpoint_seconds__:         float
+                                    The number of seconds between checkpoints of the weights, or None.
+    __checkpoint_time__:            float
+                                    The time stamp of the latest checkpoint of the weights.
+    __dtype__:                      dtype
+                                    The floating point type of the weights, gradients, moments, and checkpoints, either
+                                    float64 or float32.
     __phi_k__:                      int
                                     Variable that describes the number of output channels / output neurons for the
                                     neural network.
@@ -42,70 +187,137 @@ class CoarseModel:
     __s_c__:                        float
                                     Variable that describes the rate that the architecture of the neural network expands
                                     from the output layer to the input layer, in a trapezoidal fashion.
-    __error_k__:                    list
-                                    Variable used to keep the error at the output layer given the target/actual output.
+    __layer_sizes__:                list
+                                    A list with the number of neurons per layer, from the input layer to the output
+                                    layer.
+    __shapes__:                     list
+                                    A list with the shape of the weight matrix per layer. The input layer has a
+                                    (neurons, 1) matrix of bias weights, where every other layer has a (previous layer
+                                    neurons + 1, neurons) matrix with the bias weights kept in the last row.
     __nrmse__:                      float
                                     Variable used to keep the normalized root-mean-square-error value per feedforward
                                     operation.
     __neuron_array__:               list
-                                    A 2D list which is the architecture of the neural network, where the first
-                                    dimension is the layer of the network and the second layer is the neuron of the
-                                    network.
-    __in_j__:                       list
-                                    A 2D list which keeps all the values, averaged to the batch size __N__, of the
-                                    dot product operation for the neural network in order to train on.
-    __out_j__:                      list
-                                    A 2D list which keeps all the values, averaged to the batch size __N__, of the
-                                    activation operation for the neural network in order to train on.
-    __delta__:                      list
-                                    A 2D list which keeps all the values of the delta values per neuron per layer for
-                                    the neural network in order to train on.
+                                    A list of 1D arrays which is the architecture of the neural network, where the list
+                                    index is the layer of the network and the array index is the neuron of the network.
+                                    It keeps the neuron outputs of the latest FeedForward call.
+    __weights_vector__:             ndarray
+                                    A contiguous 1D array that keeps all the weights of the neural network.
     __weights_array__:              list
-                                    A 3D list which keeps all the weights linking the neurons to each other per layer
-                                    of the neural network.
+                                    A list of 2D arrays, one per layer, which are views into __weights_vector__ and
+                                    keep all the weights linking the neurons to each other per layer of the neural
+                                    network.
+    __grad_vector__:                ndarray
+                                    A contiguous 1D array that keeps all the gradients, in the same order as
+                                    __weights_vector__.
     __grad__:                       list
-                                    A 3D list which keeps all the gradients, averaged over the batch size,
-                                    per weight per the neuron per layer of the neural network.
-    __mean__:                       list
-                                    A 3D list which keeps all the first moment values, averaged over the batch size,
-                                    per weight per the neuron per layer of the neural network.
-    __variance__:                   list
-                                    A 3D list which keeps all the second moment values, averaged over the batch size,
-                                    per weight per the neuron per layer of the neural network.
+                                    A list of 2D arrays, one per layer, which are views into __grad_vector__ and keep
+                                    all the gradients, averaged over the batch size, per weight.
+    __mean_vector__:                ndarray
+                                    A contiguous 1D array which keeps all the first moment values, averaged over the
+                                    batch size, per weight of the neural network.
+    __variance_vector__:            ndarray
+                                    A contiguous 1D array which keeps all the second moment values, averaged over the
+                                    batch size, per weight of the neural network.
+    __profiler__:                   Profiler
+                                    Records the time per phase of training when profiling is enabled in Train.
+    __replay__:                     ndarray
+                                    The replay buffer of samples that were learnt through Update, one row per sample in
+                                    the form of [sample number, input values, target values].
+    __replay_seen__:                int
+                                    The number of samples that were ever added to the replay buffer.
     __debugging__:                  bool
                                     For debugging purposes (developer mode).
 
     Methods:
     --------
     __init__(NumberOfHiddenLayers=None, NumberOfInputChannels=None, NumberOfOutputChannels=None,
-                 ScalingFactor=1.5, Filing=None, Directory=None, Debugging=False):
+                 ScalingFactor=1.5, Filing=None, Directory=None, DataType='float64', Initializer='xavier', Seed=None,
+                 Debugging=False):
                                     The constructor of the class, where the NumberOfOutputChannels and
                                     NumberOfHiddenLayers must be given as arguments. The neural network is
                                     initialized if all required parameters are correct.
-    BuildDataset(Model=None, Parameters=None, NumberOfSamples=21, Rounding=6):
-                                    Generates data for the surrogate model to train on.
+    BuildDataset(Model=None, Parameters=None, NumberOfSamples=21, Rounding=6, ModelFactory=None,
+                NumberOfWorkers=None, Retries=2):
+                                    Generates data for the surrogate model to train on, either one sample after another
+                                    or across a pool of simulator workers.
+    BuildDatasetAdaptive(Model=None, Parameters=None, InitialSamples=10, MaximumSamples=100, BatchSize=5,
+                Criterion='variance', NumberOfCandidates=500, Response=0, Maximize=None, Tolerance=0.01, Patience=3,
+                Rounding=6, ModelFactory=None, NumberOfWorkers=None, Retries=2):
+                                    Generates data by sequential design, where the next samples are chosen by an infill
+                                    criterion on a KrigingModel until its error stops improving.
     Train(BatchSize=10, LearningRate=1e-3, Beta1=0.900, Beta2=0.999, Epsilon=1e-8, TrainingData=None,
                 ValidationData=None, TestingData=None, NumberOfEpochs=None, TrainDurationMinutes=None,
-                NRMSEConvergence=None):
+                NRMSEConvergence=None, Shuffle=True, CheckpointSteps=None, CheckpointSeconds=None,
+                CheckpointBest=False, Patience=None, MinDelta=0.0, RestoreBestWeights=True, Schedule=None,
+                ScheduleArguments=None, NumberOfWorkers=None, ReplayBufferSize=1000, Profile=False, Verbose=True):
                                     Used for training the neural network given that the TrainingData, ValidationData,
                                     and TestingData is correctly parsed as arguments.
+    Update(NewData=None, BatchSize=10, LearningRate=1e-4, Beta1=0.900, Beta2=0.999, Epsilon=1e-8, NumberOfEpochs=5,
+                ReplayRatio=1.0, ReplayBufferSize=1000, Shuffle=True):
+                                    Fine-tunes the trained neural network on new data points, mixed with samples from
+                                    the replay buffer, whilst the ADAM state carries on from earlier sessions.
     FeedForward(__input__, __target__, __learn__=False, __return_outputs__=False):
                                     Feeds the neural network given the input and target lists where the output
                                     is analysed if in training mode.
-    _summation(__layer_index__, __neuron_index__):
-                                    Performs the dot product operation per neuron in the neural network given the
-                                    layer index and neuron index.
+    PredictBatch(Inputs=None):
+                                    Predicts the outputs for a batch of inputs in a single vectorized call without
+                                    changing the state of the neural network.
+    Jacobian(Inputs=None):
+                                    Determines the derivatives of the outputs with respect to the inputs for a batch of
+                                    inputs.
+    Export(Directory=None):
+                                    Writes a self-contained predictor, a binary archive of the weights and a NumPy-only
+                                    loader, for inference without the AntennaDesign package.
+    _initialize(__initializer__, __seed__):
+                                    Initializes the weights of the neural network given the name of the initializer.
+    _schedule(__schedule__, __arguments__, __state__, __epoch__, __validation_loss__):
+                                    Determines the learning rate for the next epoch given the learning rate schedule.
+    _views(__buffer__):
+                                    Splits a contiguous 1D array into the 2D weight matrices per layer.
+    _to_arrays(__data__):
+                                    Converts a list of [input, target] data points into an input matrix and a target
+                                    matrix.
+    _forward(__input__):
+                                    Feeds a batch of inputs, one row per sample, through the neural network and
+                                    returns the outputs of every layer.
+    _summation(__layer_index__, __input__):
+                                    Performs the matrix product for a layer in the neural network given the layer
+                                    index and the outputs of the previous layer.
     _activation(__input__):
-                                    Performs the activation operation per neuron in the neural network given the input.
-    _activation_derivative(__input__):
-                                    Performs the derivative of the activation operation.
-    _update_loss(__target__, __learn__=True):
-                                    Updates the loss at the outputs of the neural network given the target list and
-                                    whether training mode is True (__learn__=True).
+                                    Performs the activation operation on an array of neuron inputs.
+    _activation_derivative(__output__):
+                                    Performs the derivative of the activation operation given the activation outputs.
+    _update_loss(__output__, __target__):
+                                    Determines the normalized root-mean-square-error per sample given the outputs and
+                                    targets of the neural network.
+    _export(__directory__, __arrays__):
+                                    Writes the archive of the weights, along with any extra arrays, and the loader.
+    _checkpoint():
+                                    Writes the weights of the neural network and the ADAM state to the binary
+                                    checkpoint files.
+    _update_replay(__input__, __target__, __size__):
+                                    Adds samples to the replay buffer, which is kept to a fixed size by reservoir
+                                    sampling.
+    _sample(__model__, __parameters__, __number__, __rounding__):
+                                    Draws a number of feasible, unique, and space-filling samples for BuildDataset.
+    _simulate(__sample__, __model__, __rounding__, __factory__, __number__, __retries__):
+                                    Simulates the samples that are not in the 'lhs' file already, one after another or
+                                    across a pool of simulator workers.
+    _simulate_pool(__sample__, __factory__, __number__, __retries__, __rounding__):
+                                    Simulates the samples of BuildDataset across a pool of simulator workers.
+    _start_workers(__number__, __input__, __target__):
+                                    Starts a pool of processes for data-parallel training, attached to the weights and
+                                    the training data in shared memory.
+    _parallel_gradients(__workers__, __batch__):
+                                    Determines the gradients of a batch across the pool of processes, a shard per
+                                    worker.
+    _stop_workers(__workers__):
+                                    Shuts the pool of processes down and releases the shared memory.
     _update_weights():
                                     In training mode, the weights of the neural network are updated.
-    _update_gradients():
-                                    In training mode, the gradients of the weights are updated.
+    _update_gradients(__activations__, __target__, __batch_size__):
+                                    In training mode, the gradients of the weights are updated for a batch of samples.
     _update_mean_variance():
                                     In training mode, the two moments per weight, both the mean and variance, are
                                     updated.
@@ -116,7 +328,8 @@ class CoarseModel:
     """
 
     def __init__(self, NumberOfHiddenLayers=None, NumberOfInputChannels=None, NumberOfOutputChannels=None,
-                 ScalingFactor=1.5, Filing=None, Directory=None, Debugging=False):
+                 ScalingFactor=1.5, Filing=None, Directory=None, DataType='float64', Initializer='xavier', Seed=None,
+                 Debugging=False):
         """
         Description:
         ------------
@@ -143,6 +356,17 @@ class CoarseModel:
         Directory:                  str
                                     Should the user wish to define a unique directory for his/her current antenna
                                     geometry, this should be named something meaningful.
+        DataType:                   str
+                                    The floating point type used for the computations and storage of the neural
+                                    network, either 'float64' or 'float32'. The float32 type halves the memory of the
+                                    weights, gradients, and moments, and speeds up predictions of wide networks.
+        Initializer:                str
+                                    The initializer of the weights, either 'xavier' (Glorot uniform, suited to the
+                                    sigmoid activation), 'he' (He normal), 'uniform' (uniform within plus or minus one
+                                    over the square root of the number of inputs per neuron), or 'zeros' (the
+                                    initialization of earlier builds, where every neuron in a layer starts the same).
+        Seed:                       int
+                                    The seed of the initializer. When None, the global NumPy random state is used.
         Debugging:                  bool
                                     For debugging purposes (developer mode).
 
@@ -152,11 +376,20 @@ class CoarseModel:
 
         Notes:
         ------
-        None.
+        Checkpoints of either floating point type can be loaded, as they are converted to DataType. The ADAM state and
+        the replay buffer, see Update, are also loaded (if available). The initialized weights are replaced by the
+        checkpoint (if available).
         """
 
         if NumberOfHiddenLayers is None or NumberOfOutputChannels is None:
             raise Exception('<CoarseModel: NumberOfHiddenLayers and/or NumberOfOutputChannels is of None type>')
+        if np.dtype(DataType) not in (np.float64, np.float32):
+            raise Exception(f'<CoarseModel: DataType must be float64 or float32, not {DataType}>')
+        if Initializer not in ['xavier', 'he', 'uniform', 'zeros']:
+            raise Exception(f'<CoarseModel: Unknown initializer {Initializer}>')
+
+        # Floating point type of the neural network
+        self.__dtype__ = np.dtype(DataType)
 
         # Learning parameters
         self.__beta_1__ = None
@@ -167,6 +400,14 @@ class CoarseModel:
         self.__init_N__ = 0
         self.__time_step__ = 0
 
+        # Checkpoint parameters, where samples that are learnt through FeedForward are checkpointed every update
+        self.__checkpoint_steps__ = 1
+        self.__checkpoint_seconds__ = None
+        self.__checkpoint_time__ = time.time()
+
+        # Profiling is only enabled through Train
+        self.__profiler__ = Profiler(Enabled=False)
+
         # Class objects
         self.__filing__ = Filing
 
@@ -179,9 +420,11 @@ class CoarseModel:
         self.__filing__.CreateDirectories(Directories=self.__directory__)
 
         # Create file absolute path(s)
-        self.__files__ = [self.__directory__[0] + 'Weights', '\\Surrogate\\lhs']
+        self.__files__ = [self.__directory__[0] + 'Weights', '\\Surrogate\\lhs', self.__directory__[0] + 'Weights.npy',
+                          self.__directory__[0] + 'Optimizer.npy', self.__directory__[0] + 'Replay.npy']
 
-        for __i__ in self.__files__:
+        # The binary checkpoints are only created once there is something to write
+        for __i__ in self.__files__[:2]:
             self.__filing__.CreateFile(Filename=__i__)
 
         # Network structure
@@ -192,56 +435,37 @@ class CoarseModel:
         else:
             self.__s_c__ = ScalingFactor
 
-        # 1D array(s)
-        self.__error_k__ = [0.0 for _ in range(self.__phi_k__)]
+        # Number of neurons per layer, from the input layer to the output layer
+        self.__layer_sizes__ = [int(round(self.__phi_k__ * (self.__s_c__ ** __i__), 0))
+                                for __i__ in range(self.__d_s__ - 1, -1, -1)]
+
+        # Shape of the weight matrix per layer. The input layer only has a bias weight per neuron, which does not have
+        # links into it from previous layers. The plus 1 for the remaining layers is for accommodating the bias weight
+        # links, which are kept in the last row of the matrix
+        self.__shapes__ = [(self.__layer_sizes__[0], 1)]
+        for __i__ in range(1, len(self.__layer_sizes__)):
+            self.__shapes__.append((self.__layer_sizes__[__i__ - 1] + 1, self.__layer_sizes__[__i__]))
+
         self.__nrmse__ = 0.0
 
-        # 2D array(s)
-        self.__neuron_array__ = []
-        self.__in_j__ = []
-        self.__out_j__ = []
-        self.__delta__ = []
-
-        # 3D array(s)
-        __init_num_weights__ = int(round(self.__phi_k__ * self.__s_c__ ** (self.__d_s__ - 1)))
-        self.__weights_array__ = [[[0.0]
-                                   for _ in range(__init_num_weights__)]]
-        self.__grad__ = [[copy.deepcopy([0.0]) for _ in range(__init_num_weights__)]]
-        self.__mean__ = [[copy.deepcopy([0.0]) for _ in range(__init_num_weights__)]]
-        self.__variance__ = [[copy.deepcopy([0.0]) for _ in range(__init_num_weights__)]]
-
-        # Construct neural network
-        for __i__ in range(self.__d_s__ - 1, -1, -1):
-
-            # Number of neurons for layer __i__
-            __num_neurons__ = int(round(self.__phi_k__ * (self.__s_c__ ** __i__), 0))
-
-            # Since there are no weights from the output, do not append a list that
-            # will have no value for the neural network
-            if __i__ > 0:
-
-                # Number of weights for the current neuron to the next layer's neurons. The plus 1 in the
-                # self.__weights_array__ is for accommodating the bias weight links, which does not have
-                # links into it from previous layers
-                __num_neuron_weights__ = int(round(self.__phi_k__ * (self.__s_c__ ** (__i__ - 1)), 0))
-                self.__weights_array__.append([
-                    [0.0 for _ in range(__num_neuron_weights__)]
-                    for _ in range(__num_neurons__ + 1)])
-                self.__grad__.append([
-                    [0.0 for _ in range(__num_neuron_weights__)]
-                    for _ in range(__num_neurons__ + 1)])
-                self.__mean__.append([
-                    [0.0 for _ in range(__num_neuron_weights__)]
-                    for _ in range(__num_neurons__ + 1)])
-                self.__variance__.append([
-                    [0.0 for _ in range(__num_neuron_weights__)]
-                    for _ in range(__num_neurons__ + 1)])
-
-            # Append layer lists
-            self.__neuron_array__.append([0.0 for _ in range(__num_neurons__)])
-            self.__in_j__.append([0.0 for _ in range(__num_neurons__)])
-            self.__out_j__.append([0.0 for _ in range(__num_neurons__)])
-            self.__delta__.append([0.0 for _ in range(__num_neurons__)])
+        # 2D array(s), one array per layer
+        self.__neuron_array__ = [np.zeros(__i__, dtype=self.__dtype__) for __i__ in self.__layer_sizes__]
+
+        # Contiguous 1D array(s), where the weight matrices per layer are views into the array
+        __num_weights__ = sum(__i__[0] * __i__[1] for __i__ in self.__shapes__)
+        self.__weights_vector__ = np.zeros(__num_weights__, dtype=self.__dtype__)
+        self.__grad_vector__ = np.zeros(__num_weights__, dtype=self.__dtype__)
+        self.__mean_vector__ = np.zeros(__num_weights__, dtype=self.__dtype__)
+        self.__variance_vector__ = np.zeros(__num_weights__, dtype=self.__dtype__)
+        self.__weights_array__ = self._views(__buffer__=self.__weights_vector__)
+        self.__grad__ = self._views(__buffer__=self.__grad_vector__)
+
+        # Break the symmetry between the neurons of a layer
+        self._initialize(__initializer__=Initializer, __seed__=Seed)
+
+        # Replay buffer, one row per sample in the form of [sample number, input values, target values]
+        self.__replay__ = np.zeros((0, 1 + self.__layer_sizes__[0] + self.__layer_sizes__[-1]))
+        self.__replay_seen__ = 0
 
         # For debugging (developer mode)
         self.__debugging__ = Debugging
@@ -249,33 +473,67 @@ class CoarseModel:
         # Extract the weights array
         if self.__filing__ is not None:
 
-            # Attempt to get stored weights
-            __weights__ = self.__filing__.Read(Filename=self.__files__[0])
+            # Attempt to get the stored ADAM state, in the form of [time step, first moments, second moments]
+            __state__ = self.__filing__.ReadArray(Filename=self.__files__[3], MemoryMap=False)
+            if isinstance(__state__, np.ndarray) and __state__.shape == (1 + 2 * __num_weights__,):
+                self.__time_step__ = int(__state__[0])
+                self.__mean_vector__[:] = __state__[1:1 + __num_weights__]
+                self.__variance_vector__[:] = __state__[1 + __num_weights__:]
+
+            # Attempt to get the stored replay buffer, where the first row is in the form of [-1, number of samples
+            # ever added, 0, ...] (a replay buffer of earlier builds has no such row)
+            __replay__ = self.__filing__.ReadArray(Filename=self.__files__[4], MemoryMap=False)
+            if isinstance(__replay__, np.ndarray) and __replay__.ndim == 2 and \
+                    __replay__.shape[1] == self.__replay__.shape[1]:
+                if len(__replay__) > 0 and __replay__[0, 0] == -1:
+                    self.__replay_seen__ = int(__replay__[0, 1])
+                    self.__replay__ = __replay__[1:]
+                else:
+                    self.__replay_seen__ = int(__replay__[:, 0].max()) + 1 if len(__replay__) > 0 else 0
+                    self.__replay__ = __replay__
+
+            # Attempt to get the stored weights from the binary checkpoint, which needs no parsing
+            __weights__ = self.__filing__.ReadArray(Filename=self.__files__[2])
 
-            # Save the weights if the file does not exist
-            if not isinstance(__weights__, list) or __weights__ == -1:
-                self.__filing__.Save(Filename=self.__files__[0], Lists=self.__weights_array__)
+            if isinstance(__weights__, np.ndarray):
+                if __weights__.shape == self.__weights_vector__.shape:
+                    self.__weights_vector__[:] = __weights__
 
-            # Initialize weights array from file read
+                # The architecture does not match the defined architecture of the neural network
+                elif self.__debugging__:
+                    print(f'<CoarseModel: __init__: Read weights do not match the defined architecture: expected '
+                          f'{self.__weights_vector__.size} weights, found {__weights__.size}>')
+
+                # Release the memory-map of the file
+                del __weights__
+
+            # Fall back on the text format of earlier builds, after which the binary checkpoint is created
             else:
-                __temp_weights__ = copy.deepcopy(self.__weights_array__)
+                __weights__ = self.__filing__.Read(Filename=self.__files__[0])
 
-                # The full iteration through the read __weights__ array should match the architecture of the defined
-                # neural network
-                try:
-                    for __i__ in range(len(__weights__)):
-                        for __j__ in range(len(__weights__[__i__])):
-                            for __k__ in range(len(__weights__[__i__][__j__])):
-                                self.__weights_array__[__i__][__j__][__k__] = __weights__[__i__][__j__][__k__]
+                if isinstance(__weights__, list):
+                    # The read __weights__ array should match the architecture of the defined neural network
+                    try:
+                        __layers__ = [np.asarray(__i__, dtype=self.__dtype__) for __i__ in __weights__]
 
-                # The architecture does not match the defined architecture of the neural network
-                except Exception as __error__:
-                    if self.__debugging__:
-                        print(f'<CoarseModel: __init__: Read weights do not match the defined architecture: '
-                              f'{__error__}>')
-                    self.weights_array__ = __temp_weights__
+                        if len(__layers__) != len(self.__shapes__) or \
+                                any(__layers__[__i__].shape != self.__shapes__[__i__]
+                                    for __i__ in range(len(__layers__))):
+                            raise Exception(f'expected layer shapes {self.__shapes__}')
 
-    def BuildDataset(self, Model=None, Parameters=None, NumberOfSamples=21, Rounding=6):
+                        for __i__ in range(len(__layers__)):
+                            self.__weights_array__[__i__][...] = __layers__[__i__]
+
+                    # The architecture does not match the defined architecture of the neural network
+                    except Exception as __error__:
+                        if self.__debugging__:
+                            print(f'<CoarseModel: __init__: Read weights do not match the defined architecture: '
+                                  f'{__error__}>')
+
+                self._checkpoint()
+
+    def BuildDataset(self, Model=None, Parameters=None, NumberOfSamples=21, Rounding=6, ModelFactory=None,
+                     NumberOfWorkers=None, Retries=2):
         """
         Description:
         ------------
@@ -292,6 +550,16 @@ class CoarseModel:
                                     Defined by the user, this describes to the number of samples to be generated.
         Rounding:                   int
                                     The rounding for the float value(s) of the Parameter(s) (attribute Parameters).
+        ModelFactory:               function
+                                    When defined, the samples are simulated across a pool of NumberOfWorkers processes,
+                                    where every worker calls ModelFactory once to build its own simulator, see the
+                                    Notes. It must be a module-level function without arguments.
+        NumberOfWorkers:            int
+                                    The number of simulator workers, where None is the number of processors. Every
+                                    worker holds a simulator session (and a license) of its own.
+        Retries:                    int
+                                    The number of times a failed sample is simulated again before it is left out of the
+                                    dataset.
 
         Returns:
         --------
@@ -299,62 +567,211 @@ class CoarseModel:
 
         Notes:
         ------
-        None.
+        The samples are drawn with _sample, which only keeps feasible samples and spreads them through the parameter
+        space.
+
+        The simulator that ModelFactory returns is either a ModelGeometry, built on a FineModel of its own, or any
+        stand-in backend with a SimulateModel(Parameters, Rounding) method. The Model is still used for checking the
+        boundaries of the samples.
+
+        Every worker runs in a process of its own, thus a crash of a worker (or its simulator) only costs the sample it
+        was simulating, after which a new worker is started. Every simulated sample is appended to the 'lhs' file as
+        soon as it is finished, thus the completed samples are kept (and found as duplicates) should BuildDataset be
+        interrupted and started again.
         """
 
         if Model is None or Parameters is None:
             raise Exception('<CoarseModel: CollectData: One or more arguments are of None type>')
 
-        __sample__ = []
+        # Draw NumberOfSamples feasible and well spread samples, such that the parameters, collectively, do not go
+        # beyond the boundaries
+        __sample__ = self._sample(__model__=Model, __parameters__=Parameters, __number__=NumberOfSamples,
+                                  __rounding__=Rounding)
 
-        # Loop until __sample__ has the same number of samples as the defined NumberOfSamples. Note that
-        # the bounds must be checked so that the parameters, collectively, doe not go beyond the boundaries
-        while len(__sample__) < NumberOfSamples:
+        return self._simulate(__sample__=__sample__, __model__=Model, __rounding__=Rounding, __factory__=ModelFactory,
+                              __number__=NumberOfWorkers, __retries__=Retries)
+
+    def BuildDatasetAdaptive(self, Model=None, Parameters=None, InitialSamples=10, MaximumSamples=100, BatchSize=5,
+                             Criterion='variance', NumberOfCandidates=500, Response=0, Maximize=None, Tolerance=0.01,
+                             Patience=3, Rounding=6, ModelFactory=None, NumberOfWorkers=None, Retries=2):
+        """
+        Description:
+        ------------
+        Generates a dataset by sequential design, rather than spending the whole simulation budget on a single LHS
+        design. A small LHS design is simulated first, after which a KrigingModel is fitted to the simulated responses
+        and the next batch of samples is chosen from feasible candidates by an infill criterion, until the error of the
+        KrigingModel stops improving or MaximumSamples have been simulated.
 
-            # Initialize LHS instance
-            __lhs__ = LHS(xlimits=np.asarray(Parameters))
-            # Get samples from __lhs__ variable
-            __temp__ = __lhs__(NumberOfSamples).tolist()
+        Parameters:
+        -----------
+        Model:                      ModelGeometry
+                                    Instance of the antenna model that was used for the genetic algorithm.
+        Parameters:                 list
+                                    A list of parameter ranges in the form of [[lower bound, upper bound], ...], the
+                                    same format as for BuildDataset.
+        InitialSamples:             int
+                                    The number of samples of the initial LHS design.
+        MaximumSamples:             int
+                                    The simulation budget, the maximum number of samples of the dataset.
+        BatchSize:                  int
+                                    The number of samples that are chosen, and simulated, per iteration.
+        Criterion:                  str
+                                    The infill criterion, either 'variance' (the candidates with the largest predicted
+                                    variance of the response) or 'improvement' (the candidates with the largest expected
+                                    improvement of the mean response within the objective bands of the Model).
+        NumberOfCandidates:         int
+                                    The number of feasible candidates that the criterion is evaluated on per iteration.
+        Response:                   int
+                                    The index of the response within the simulation results that the KrigingModel is
+                                    fitted to, where 0 is the return loss.
+        Maximize:                   bool
+                                    Whether the expected improvement maximizes the mean response within the objective
+                                    bands, for instance of the gain, rather than minimizes it, for instance of the
+                                    return loss. When None, the return loss (Response 0) is minimized and any other
+                                    response is maximized.
+        Tolerance:                  float
+                                    The relative decrease of the error that counts as an improvement.
+        Patience:                   int
+                                    The number of consecutive iterations without improvement after which sampling is
+                                    stopped.
+        Rounding:                   int
+                                    The rounding for the float value(s) of the Parameter(s) (attribute Parameters).
+        ModelFactory:               function
+                                    When defined, every batch is simulated across a pool of simulator workers, see
+                                    BuildDataset.
+        NumberOfWorkers:            int
+                                    The number of simulator workers, where None is the number of processors.
+        Retries:                    int
+                                    The number of times a failed sample is simulated again before it is left out of the
+                                    dataset.
 
-            for __i__ in __temp__:
-                try:
-                    Model.CheckBoundary(Parameters=__i__, Rounding=Rounding)
+        Returns:
+        --------
+        Returns a list in the form of [dataset, error], where the dataset is in the form of [[parameter values,
+        simulation results], ...], the same as for BuildDataset, and the error is a list of [number of samples, mean
+        leave-one-out normalized RMSE of the KrigingModel] per iteration.
 
-                    if not __sample__.__contains__(__i__):
-                        __sample__.append(__i__)
+        Notes:
+        ------
+        The error is the leave-one-out normalized RMSE of the KrigingModel of the response in decibels, which is
+        determined in closed form, thus no samples are held back for validation. The batch is chosen greedily, where
+        the KrigingModel that scores the criterion is updated with the predicted response of every chosen candidate
+        (the 'kriging believer'), so that the variance around the chosen candidates shrinks and the batch spreads out.
+
+        The expected improvement is determined on a second KrigingModel, fitted to the mean response (in decibels)
+        within the objective bands [f_min, f_max] of the Model, which is minimized (or maximized, see Maximize). The
+        incumbent, the best mean response, is that of the simulated samples only, thus it is not updated by the
+        believed predictions of the candidates that were chosen for the batch.
+        """
 
-                except Exception as __error__:
-                    if self.__debugging__:
-                        print(f'<CoarseModel: BuildDataset: {__error__}>')
+        if Model is None or Parameters is None:
+            raise Exception('<CoarseModel: BuildDatasetAdaptive: One or more arguments are of None type>')
+        if Criterion not in ['variance', 'improvement']:
+            raise Exception(f'<CoarseModel: BuildDatasetAdaptive: Unknown criterion {Criterion}>')
+        if Criterion == 'improvement' and Model.__objective__ is None:
+            raise Exception('<CoarseModel: BuildDatasetAdaptive: The expected improvement requires the objectives of '
+                            'the Model>')
+        if InitialSamples < 2 or InitialSamples > MaximumSamples:
+            raise Exception('<CoarseModel: BuildDatasetAdaptive: InitialSamples must be between 2 and '
+                            'MaximumSamples>')
+
+        __dataset__ = self._simulate(__sample__=self._sample(__model__=Model, __parameters__=Parameters,
+                                                             __number__=InitialSamples, __rounding__=Rounding),
+                                     __model__=Model, __rounding__=Rounding, __factory__=ModelFactory,
+                                     __number__=NumberOfWorkers, __retries__=Retries)
+
+        __error__ = []
+        __best__ = np.inf
+        __stale__ = 0
+
+        while True:
+            __input__ = [__i__[0] for __i__ in __dataset__]
+            __frequency__ = np.asarray(__dataset__[0][1][Response][0], dtype=np.float64)
+            __target__ = [__i__[1][Response][1] for __i__ in __dataset__]
+
+            # The error of the KrigingModel decides when to stop
+            __kriging__ = KrigingModel(NumberOfInputChannels=len(Parameters),
+                                       NumberOfOutputChannels=len(__frequency__), Bounds=Parameters,
+                                       Debugging=self.__debugging__)
+
+            # A sample with a flat response has an undefined normalized RMSE, which is left out
+            with np.errstate(divide='ignore', invalid='ignore'):
+                __loss__ = np.asarray(__kriging__.Fit(TrainingData=[[__input__[__i__], __target__[__i__]]
+                                                                    for __i__ in range(len(__input__))]))
+            __error__.append([len(__dataset__), float(np.mean(__loss__[np.isfinite(__loss__)]))])
+
+            print(f'\r<CoarseModel: BuildDatasetAdaptive: {__error__[-1][0]} samples, leave-one-out normalized RMSE = '
+                  f'{"{:.4f}".format(__error__[-1][1])}>')
+
+            if __error__[-1][1] < __best__ * (1 - Tolerance):
+                __best__ = __error__[-1][1]
+                __stale__ = 0
+            else:
+                __stale__ += 1
 
-        # Data list that keeps all samples in the form of [parameter values, simulation results]
-        __temp__ = []
+            if __stale__ >= Patience or len(__dataset__) >= MaximumSamples:
+                break
 
-        for __i__ in range(NumberOfSamples):
-            __start__ = time.time() / 60
+            # The candidates are feasible, well spread, and not simulated before
+            __simulated__ = set(tuple(__i__) for __i__ in __input__)
+            __candidates__ = [__i__ for __i__ in self._sample(__model__=Model, __parameters__=Parameters,
+                                                              __number__=NumberOfCandidates, __rounding__=Rounding)
+                              if tuple(__i__) not in __simulated__]
+
+            # The model that scores the criterion, where the expected improvement is of the mean response within the
+            # objective bands
+            if Criterion == 'improvement':
+                __band__ = np.zeros(len(__frequency__), dtype=bool)
+                for __i__ in Model.__objective__:
+                    __band__ |= (__i__[0] <= __frequency__) & (__frequency__ <= __i__[1])
+                if not np.any(__band__):
+                    raise Exception('<CoarseModel: BuildDatasetAdaptive: No frequency points are within the objective '
+                                    'bands>')
+
+                # A response that is maximized is minimized with the opposite sign
+                __objective__ = np.asarray(__target__, dtype=np.float64)[:, __band__].mean(axis=1)
+                if (Response != 0) if Maximize is None else Maximize:
+                    __objective__ = -__objective__
+                __kriging__ = KrigingModel(NumberOfInputChannels=len(Parameters), NumberOfOutputChannels=1,
+                                           Bounds=Parameters, Debugging=self.__debugging__)
+
+                # The normalized RMSE of a single output channel is undefined, and not used
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    __kriging__.Fit(TrainingData=[[__input__[__i__], [__objective__[__i__]]]
+                                                  for __i__ in range(len(__input__))])
+
+            __batch__ = []
+            for _ in range(min(BatchSize, MaximumSamples - len(__dataset__), len(__candidates__))):
+                __mean__, __variance__ = __kriging__.PredictBatch(Inputs=__candidates__, ReturnVariance=True)
+
+                if Criterion == 'variance':
+                    __score__ = __variance__.mean(axis=1)
+                else:
+                    __deviation__ = np.sqrt(__variance__[:, 0])
+                    __z__ = (__objective__.min() - __mean__[:, 0]) / np.maximum(__deviation__, 1e-12)
+                    __score__ = (__objective__.min() - __mean__[:, 0]) * stats.norm.cdf(__z__) + \
+                        __deviation__ * stats.norm.pdf(__z__)
 
-            # Attempt to retrieve a duplicate
-            __result__ = self.__filing__.Duplicate(Filename=self.__files__[1], List=[__sample__[__i__], []])
+                __index__ = int(np.argmax(__score__))
+                __batch__.append(__candidates__.pop(__index__))
 
-            # No duplicate found, simulate and store data point
-            if not isinstance(__result__, list):
-                __temp__.append([__sample__[__i__], Model.SimulateModel(Parameters=__sample__[__i__],
-                                                                        Rounding=Rounding)])
-                self.__filing__.Append(Filename=self.__files__[1], List=__temp__[-1])
+                # Believe the prediction of the chosen candidate for choosing the rest of the batch
+                __kriging__.Update(NewData=[[__batch__[-1], __mean__[__index__]]])
 
-            # Duplicate found
-            else:
-                __temp__.append(__result__)
+            if len(__batch__) == 0:
+                break
 
-            print(f'\r<CoarseModel: BuildDataset: Generating dataset: {len(__sample__) - __i__} '
-                  f'samples remaining \t Time taken for simulation {__i__ + 1}: '
-                  f'{round(time.time() / 60 - __start__, 2)}', end='')
+            __dataset__ += self._simulate(__sample__=__batch__, __model__=Model, __rounding__=Rounding,
+                                          __factory__=ModelFactory, __number__=NumberOfWorkers, __retries__=Retries)
 
-        return __temp__
+        return [__dataset__, __error__]
 
     def Train(self, BatchSize=10, LearningRate=1e-3, Beta1=0.900, Beta2=0.999, Epsilon=1e-8,
               TrainingData=None, ValidationData=None, TestingData=None, NumberOfEpochs=None,
-              TrainDurationMinutes=None, NRMSEConvergence=None):
+              TrainDurationMinutes=None, NRMSEConvergence=None, Shuffle=True, CheckpointSteps=None,
+              CheckpointSeconds=None, CheckpointBest=False, Patience=None, MinDelta=0.0, RestoreBestWeights=True,
+              Schedule=None, ScheduleArguments=None, NumberOfWorkers=None, ReplayBufferSize=1000, Profile=False,
+              Verbose=True):
         """
         Description:
         ------------
@@ -395,20 +812,88 @@ class CoarseModel:
         NRMSEConvergence:           float
                                     The value for the convergence that will halt the training process should the
                                     loss meet the convergence before the termination condition.
+        Shuffle:                    bool
+                                    When True, the order of the training data is shuffled every epoch before it is
+                                    split into batches.
+        CheckpointSteps:            int
+                                    When defined, the weights are checkpointed every CheckpointSteps weight updates.
+        CheckpointSeconds:          float
+                                    When defined, the weights are checkpointed once CheckpointSeconds seconds have
+                                    passed since the previous checkpoint.
+        CheckpointBest:             bool
+                                    When True, the weights are only checkpointed when the validation loss improves on
+                                    the best validation loss of this training session, thus CheckpointSteps and
+                                    CheckpointSeconds are ignored.
+        Patience:                   int
+                                    When defined, training is stopped early once the validation loss has not improved
+                                    for Patience consecutive epochs.
+        MinDelta:                   float
+                                    The minimum decrease of the validation loss that resets the patience, where the
+                                    weights of any decrease are kept as the best weights.
+        RestoreBestWeights:         bool
+                                    When True, the weights with the best validation loss are kept in memory and
+                                    restored once training has finished.
+        Schedule:                   str
+                                    The learning rate schedule, which updates the learning rate after every epoch,
+                                    either None (a constant LearningRate), 'step', 'cosine', 'plateau', or a function
+                                    in the form of f(epoch, learning rate, validation losses) that returns the learning
+                                    rate for the next epoch.
+        ScheduleArguments:          dict
+                                    The arguments of the schedule, see the Notes.
+        NumberOfWorkers:            int
+                                    When greater than 1, every batch is split into NumberOfWorkers shards, of which the
+                                    gradients are determined across a pool of NumberOfWorkers processes, see the Notes.
+        ReplayBufferSize:           int
+                                    The maximum number of training samples kept in the replay buffer, see Update.
+        Profile:                    bool
+                                    When True, the wall time and number of calls per phase of training ('forward',
+                                    'loss', 'gradients', 'mean_variance', 'weights', 'checkpoint', 'validation', and
+                                    'test') are recorded, in total and per epoch, along with the samples per second.
+                                    In data-parallel training, the work of the pool is recorded as 'gradients'.
+        Verbose:                    bool
+                                    When True, the losses are printed after every epoch.
 
         Returns:
         --------
         Returns the training loss, validation loss, and testing loss where each element (except for the testing loss)
-        is the loss for an epoch in the form of [test loss, validation loss, test loss].
+        is the loss for an epoch in the form of [test loss, validation loss, test loss]. If Profile is True, the
+        Profiler is appended, in the form of [train loss, validation loss, test loss, profiler], which can be exported
+        with Profiler.Export.
 
         Notes:
         ------
-        None.
+        Each batch of BatchSize samples is fed through the network as a single matrix, after which the gradients are
+        averaged over the batch and a single ADAM update is applied. Unless CheckpointBest is True, the weights are
+        always checkpointed once training has finished, after the best weights have been restored (if enabled). The
+        testing loss is determined with the weights that the network ends with.
+
+        The replay buffer of an earlier model is discarded, after which it is filled with a reservoir sample of the
+        training data, so that Update replays the training data from the first fine-tuning on.
+
+        In data-parallel training, the weights, the training data, and a row of gradients per worker are kept in shared
+        memory, thus only the indices of the shards are sent to the workers. The workers feed their shards forward and
+        back on the shared weights, the main process sums the gradients of the shards and applies a single ADAM update,
+        thus the updates are the same as in serial training (up to rounding). A worker process costs a round trip per
+        batch, hence it pays off for large batches and wide networks, such as the return loss networks.
+
+        The arguments of the schedules (with their defaults) are:
+            'step':                 {'StepSize': 10, 'Factor': 0.5}, the learning rate is multiplied by Factor every
+                                    StepSize epochs.
+            'cosine':               {'Period': NumberOfEpochs, 'MinimumLearningRate': 0.0}, the learning rate follows
+                                    half a cosine from LearningRate to MinimumLearningRate over Period epochs.
+            'plateau':              {'Patience': 5, 'Factor': 0.5, 'MinimumLearningRate': 1e-6}, the learning rate is
+                                    multiplied by Factor once the validation loss has not improved by MinDelta for
+                                    Patience consecutive epochs.
         """
 
         if TrainingData is None or ValidationData is None or TestingData is None or \
                 (NumberOfEpochs is None and TrainDurationMinutes is None):
             raise Exception('<CoarseModel: Train: One or more parameters are of type None>')
+        if Schedule not in [None, 'step', 'cosine', 'plateau'] and not callable(Schedule):
+            raise Exception(f'<CoarseModel: Train: Unknown learning rate schedule {Schedule}>')
+        if Schedule == 'cosine' and NumberOfEpochs is None and \
+                (ScheduleArguments is None or 'Period' not in ScheduleArguments):
+            raise Exception('<CoarseModel: Train: The cosine schedule requires NumberOfEpochs or a Period>')
 
         # Learning parameters
         self.__beta_1__ = Beta1
@@ -419,8 +904,27 @@ class CoarseModel:
         self.__init_N__ = 0
         self.__time_step__ = 0
 
-        # Reset self.__init_N__
-        self.__init_N__ = 0
+        # Learning rate schedule parameters
+        __schedule_arguments__ = {'StepSize': 10, 'Factor': 0.5, 'Period': NumberOfEpochs, 'Patience': 5,
+                                  'MinimumLearningRate': 0.0 if Schedule == 'cosine' else 1e-6, 'MinDelta': MinDelta}
+        if ScheduleArguments is not None:
+            __schedule_arguments__.update(ScheduleArguments)
+        __schedule_state__ = {'LearningRate': LearningRate, 'Best': np.inf, 'Stale': 0}
+
+        # Early stopping parameters, where the patience is measured from the last improvement by more than MinDelta
+        __best_validation__ = np.inf
+        __best_weights__ = None
+        __stale_validation__ = np.inf
+        __stale_epochs__ = 0
+
+        # Input and target matrices, one row per sample
+        __train_input__, __train_target__ = self._to_arrays(__data__=TrainingData)
+        __validation_input__, __validation_target__ = self._to_arrays(__data__=ValidationData)
+        __test_input__, __test_target__ = self._to_arrays(__data__=TestingData)
+
+        if __train_input__.shape[1] != self.__layer_sizes__[0]:
+            raise Exception(f'<CoarseModel: Train: The input layer has {self.__layer_sizes__[0]} neurons, but the '
+                            f'training data has {__train_input__.shape[1]} input values>')
 
         # Initialize start and finish variables
         if NumberOfEpochs is not None:
@@ -433,7 +937,6 @@ class CoarseModel:
         # Arrays used for performance analysis
         __validation_loss__ = []
         __train_loss__ = []
-        __test_loss__ = []
 
         __num_epochs__ = 0
         __elapsed_time__ = time.time() / 60
@@ -441,74 +944,299 @@ class CoarseModel:
         # Temporary loss list
         __temp_loss__ = []
 
-        for __i__ in range(len(self.__grad__)):
-            for __j__ in range(len(self.__grad__[__i__])):
-                for __k__ in range(len(self.__grad__[__i__][__j__])):
-                    self.__grad__[__i__][__j__][__k__] = 0.0
-                    self.__mean__[__i__][__j__][__k__] = 0.0
-                    self.__variance__[__i__][__j__][__k__] = 0.0
+        # Reset the gradients and the two moments
+        self.__grad_vector__[:] = 0.0
+        self.__mean_vector__[:] = 0.0
+        self.__variance_vector__[:] = 0.0
+
+        self.__profiler__ = Profiler(Enabled=Profile)
 
-        while __start__ < __finish__:
+        # Share the weights and the training data with a pool of processes for data-parallel training
+        if NumberOfWorkers is not None and NumberOfWorkers > 1:
+            __workers__ = self._start_workers(__number__=NumberOfWorkers, __input__=__train_input__,
+                                              __target__=__train_target__)
+        else:
+            __workers__ = None
 
-            # Loop through training data
-            for __i__ in TrainingData:
-                self.FeedForward(__input__=__i__[0], __target__=__i__[1], __learn__=True)
-                __temp_loss__.append(self.__nrmse__)
+        # The checkpoint parameters of training, after which the checkpoint parameters of FeedForward are restored
+        __checkpoint__ = [self.__checkpoint_steps__, self.__checkpoint_seconds__]
+        if CheckpointBest:
+            self.__checkpoint_steps__ = None
+            self.__checkpoint_seconds__ = None
+        else:
+            self.__checkpoint_steps__ = CheckpointSteps
+            self.__checkpoint_seconds__ = CheckpointSeconds
+        self.__checkpoint_time__ = time.time()
 
-            __train_loss__.append(copy.deepcopy(sum(__temp_loss__) / len(__temp_loss__)))
-            __temp_loss__.clear()
+        try:
+            while __start__ < __finish__:
+                __epoch_time__ = time.perf_counter()
 
-            # Loop through validation data
-            for __i__ in ValidationData:
-                self.FeedForward(__input__=__i__[0], __target__=__i__[1], __learn__=False)
-                __temp_loss__.append(self.__nrmse__)
+                # Shuffle the training data
+                if Shuffle:
+                    __order__ = np.random.permutation(len(__train_input__))
+                else:
+                    __order__ = np.arange(len(__train_input__))
+
+                # Loop through training data, one batch at a time
+                for __i__ in range(0, len(__order__), self.__N__):
+                    __batch__ = __order__[__i__: __i__ + self.__N__]
+
+                    # The shards of the batch are fed through the workers, which also determine the losses
+                    if __workers__ is not None:
+                        with self.__profiler__.Phase(Name='gradients'):
+                            __temp_loss__.append(self._parallel_gradients(__workers__=__workers__,
+                                                                          __batch__=__batch__))
+                        self._update_weights()
+                        continue
+
+                    with self.__profiler__.Phase(Name='forward'):
+                        __activations__ = self._forward(__input__=__train_input__[__batch__])
+                    with self.__profiler__.Phase(Name='loss'):
+                        __temp_loss__.append(self._update_loss(__output__=__activations__[-1],
+                                                               __target__=__train_target__[__batch__]))
+
+                    with self.__profiler__.Phase(Name='gradients'):
+                        self._update_gradients(__activations__=__activations__, __target__=__train_target__[__batch__],
+                                               __batch_size__=len(__batch__))
+                    self._update_weights()
+
+                __train_loss__.append(float(np.mean(np.concatenate(__temp_loss__))))
+                __temp_loss__.clear()
+
+                # Evaluate the validation data as a single batch
+                with self.__profiler__.Phase(Name='validation'):
+                    __validation_loss__.append(float(np.mean(
+                        self._update_loss(__output__=self._forward(__input__=__validation_input__)[-1],
+                                          __target__=__validation_target__))))
+
+                # Keep track of the weights with the best validation loss, however small the improvement
+                if __validation_loss__[-1] < __best_validation__:
+                    __best_validation__ = __validation_loss__[-1]
+
+                    if RestoreBestWeights:
+                        __best_weights__ = self.__weights_vector__.copy()
+
+                    if CheckpointBest:
+                        self._checkpoint()
+
+                # Only an improvement by more than MinDelta resets the patience
+                if __validation_loss__[-1] < __stale_validation__ - MinDelta:
+                    __stale_validation__ = __validation_loss__[-1]
+                    __stale_epochs__ = 0
 
-            __validation_loss__.append(copy.deepcopy(sum(__temp_loss__) / len(__temp_loss__)))
-            __temp_loss__.clear()
+                else:
+                    __stale_epochs__ += 1
 
-            # Either increment the number of epochs or update the timer
-            if NumberOfEpochs is not None:
-                __start__ += 1
-            else:
-                __start__ = time.time() / 60 - __elapsed_time__
+                self.__profiler__.Epoch(NumberOfSamples=len(__order__), Seconds=time.perf_counter() - __epoch_time__)
 
-            if __train_loss__[-1] > 1 or __validation_loss__[-1] > 1:
-                print('\033[0;31;40m', end='')
+                # Update the learning rate for the next epoch
+                __learning_rate__ = self.__alpha__
+                if Schedule is not None:
+                    self.__alpha__ = self._schedule(__schedule__=Schedule, __arguments__=__schedule_arguments__,
+                                                    __state__=__schedule_state__, __epoch__=__num_epochs__ + 1,
+                                                    __validation_loss__=__validation_loss__)
 
-            elif 0.3 <= __train_loss__[-1] <= 1 or 0.3 <= __validation_loss__[-1] <= 1:
-                # self.__alpha__ = 1e-3
-                print('\033[0;33;40m', end='')
+                # Either increment the number of epochs or update the timer
+                if NumberOfEpochs is not None:
+                    __start__ += 1
+                else:
+                    __start__ = time.time() / 60 - __elapsed_time__
 
-            elif 0.2 <= __train_loss__[-1] < 0.3 or 0.2 <= __validation_loss__[-1] < 0.3:
-                # self.__alpha__ = 1e-4
-                print('\033[0;34;40m', end='')
+                # Print the progress of the current epoch
+                if Verbose:
+                    if __train_loss__[-1] > 1 or __validation_loss__[-1] > 1:
+                        print('\033[0;31;40m', end='')
 
-            elif 0.1 <= __train_loss__[-1] < 0.2 or 0.1 <= __validation_loss__[-1] < 0.2:
-                # self.__alpha__ = 1e-5
-                print('\033[0;32;40m', end='')
+                    elif 0.3 <= __train_loss__[-1] <= 1 or 0.3 <= __validation_loss__[-1] <= 1:
+                        print('\033[0;33;40m', end='')
 
-            else:
-                print('\033[0;30;47m', end='')
+                    elif 0.2 <= __train_loss__[-1] < 0.3 or 0.2 <= __validation_loss__[-1] < 0.3:
+                        print('\033[0;34;40m', end='')
 
-            print(f'Epoch: {__num_epochs__ + 1}\t'
-                  f'Train normalized RMSE = {"{:.3f}".format(__train_loss__[-1])}\t'
-                  f'Validation normalized RMSE = {"{:.3f}".format(__validation_loss__[-1])}\t'
-                  f'Time elapsed: {int(time.time() / 60 - __elapsed_time__)} minutes '
-                  f'and {int(time.time() - __elapsed_time__ * 60) % 60} seconds\033[0m')
+                    elif 0.1 <= __train_loss__[-1] < 0.2 or 0.1 <= __validation_loss__[-1] < 0.2:
+                        print('\033[0;32;40m', end='')
 
-            __num_epochs__ += 1
+                    else:
+                        print('\033[0;30;47m', end='')
 
-            if NRMSEConvergence is not None and __train_loss__[-1] <= NRMSEConvergence and \
-                    __validation_loss__[-1] <= NRMSEConvergence:
-                break
+                    print(f'Epoch: {__num_epochs__ + 1}\t'
+                          f'Train normalized RMSE = {"{:.3f}".format(__train_loss__[-1])}\t'
+                          f'Validation normalized RMSE = {"{:.3f}".format(__validation_loss__[-1])}\t'
+                          f'Learning rate = {"{:.2e}".format(__learning_rate__)}\t'
+                          f'Time elapsed: {int(time.time() / 60 - __elapsed_time__)} minutes '
+                          f'and {int(time.time() - __elapsed_time__ * 60) % 60} seconds\033[0m')
+
+                __num_epochs__ += 1
+
+                if NRMSEConvergence is not None and __train_loss__[-1] <= NRMSEConvergence and \
+                        __validation_loss__[-1] <= NRMSEConvergence:
+                    break
+
+                # Stop early when the validation loss has stopped improving
+                if Patience is not None and __stale_epochs__ >= Patience:
+                    if Verbose:
+                        print(f'<CoarseModel: Train: Early stopping after {__num_epochs__} epochs, the best validation '
+                              f'normalized RMSE is {"{:.3f}".format(__best_validation__)}>')
+                    break
+
+        finally:
+            self.__checkpoint_steps__, self.__checkpoint_seconds__ = __checkpoint__
+
+            if __workers__ is not None:
+                self._stop_workers(__workers__=__workers__)
+
+        # Restore the weights with the best validation loss
+        if __best_weights__ is not None:
+            self.__weights_vector__[:] = __best_weights__
+
+        if not CheckpointBest:
+            self._checkpoint()
+
+        # Replace the replay buffer with a reservoir sample of the training data
+        self.__replay__ = self.__replay__[:0]
+        self.__replay_seen__ = 0
+        self._update_replay(__input__=__train_input__, __target__=__train_target__, __size__=ReplayBufferSize)
 
         # Evaluate the network with test data
-        for __i__ in TestingData:
-            self.FeedForward(__input__=__i__[0], __target__=__i__[1], __learn__=False)
-            __test_loss__.append(copy.deepcopy(self.__nrmse__))
+        with self.__profiler__.Phase(Name='test'):
+            __test_loss__ = self._update_loss(__output__=self._forward(__input__=__test_input__)[-1],
+                                              __target__=__test_target__).tolist()
+
+        if Profile:
+            return [__train_loss__, __validation_loss__, __test_loss__, self.__profiler__]
 
         return [__train_loss__, __validation_loss__, __test_loss__]
 
+    def Update(self, NewData=None, BatchSize=10, LearningRate=1e-4, Beta1=0.900, Beta2=0.999, Epsilon=1e-8,
+               NumberOfEpochs=5, ReplayRatio=1.0, ReplayBufferSize=1000, Shuffle=True):
+        """
+        Description:
+        ------------
+        Fine-tunes the neural network on new data points, such as simulation results that were appended since the
+        neural network was trained, without training from scratch. Every epoch, the new data points are mixed with a
+        sample of the replay buffer so that the neural network does not forget the data points it learnt earlier.
+        Unlike Train, the time step and the two moments of the ADAM algorithm carry on from earlier sessions.
+
+        Parameters:
+        -----------
+        NewData:                    list
+                                    The new data, where each data point is in the form of [input, target].
+        BatchSize:                  int
+                                    The number of samples per weight update.
+        LearningRate:               float
+                                    The learning rate, which is usually smaller than the one used for Train.
+        Beta1:                      float
+                                    Biased value for the first moment.
+        Beta2:                      float
+                                    Biased value for the second moment.
+        Epsilon:                    float
+                                    A value so that division by zero is avoided.
+        NumberOfEpochs:             int
+                                    The number of passes over the new data points.
+        ReplayRatio:                float
+                                    The number of replayed samples per new data point in every epoch.
+        ReplayBufferSize:           int
+                                    The maximum number of samples kept in the replay buffer.
+        Shuffle:                    bool
+                                    When True, the order of the samples is shuffled every epoch.
+
+        Returns:
+        --------
+        Returns a list in the form of [training loss per epoch, loss of the new data, loss of the replay buffer], where
+        the last two losses are determined once fine-tuning has finished, and the loss of the replay buffer (before the
+        new data points were added) is None if the replay buffer was empty.
+
+        Notes:
+        ------
+        The weights, the ADAM state, and the replay buffer are checkpointed once fine-tuning has finished, after which
+        the new data points are added to the replay buffer. The replay buffer is filled by Train, thus an exception is
+        raised should it be empty whilst ReplayRatio is greater than 0.
+        """
+
+        if NewData is None or len(NewData) == 0:
+            raise Exception('<CoarseModel: Update: NewData is of None type or empty>')
+        if ReplayRatio > 0 and len(self.__replay__) == 0:
+            raise Exception('<CoarseModel: Update: The replay buffer is empty, train the network with Train first (or '
+                            'set ReplayRatio to 0)>')
+
+        # Learning parameters, where the time step and the two moments are kept
+        self.__beta_1__ = Beta1
+        self.__beta_2__ = Beta2
+        self.__epsilon__ = Epsilon
+        self.__alpha__ = LearningRate
+        self.__N__ = BatchSize
+        self.__init_N__ = 0
+
+        # The weights are only checkpointed once fine-tuning has finished, after which the checkpoint parameters of
+        # FeedForward are restored
+        __checkpoint__ = [self.__checkpoint_steps__, self.__checkpoint_seconds__]
+        self.__checkpoint_steps__ = None
+        self.__checkpoint_seconds__ = None
+
+        try:
+            __new_input__, __new_target__ = self._to_arrays(__data__=NewData)
+
+            if __new_input__.shape[1] != self.__layer_sizes__[0] or __new_target__.shape[1] != self.__layer_sizes__[-1]:
+                raise Exception(f'<CoarseModel: Update: The network expects {self.__layer_sizes__[0]} input values and '
+                                f'{self.__layer_sizes__[-1]} target values, but the new data has '
+                                f'{__new_input__.shape[1]} and {__new_target__.shape[1]}>')
+
+            # Samples of the replay buffer
+            __replay_input__ = self.__replay__[:, 1:1 + self.__layer_sizes__[0]].astype(self.__dtype__)
+            __replay_target__ = self.__replay__[:, 1 + self.__layer_sizes__[0]:].astype(self.__dtype__)
+            __num_replay__ = min(len(__replay_input__), int(round(ReplayRatio * len(__new_input__))))
+
+            __train_loss__ = []
+            __temp_loss__ = []
+
+            # Clear any gradients that were accumulated through FeedForward
+            self.__grad_vector__[:] = 0.0
+
+            for _ in range(NumberOfEpochs):
+
+                # Draw a different sample of the replay buffer every epoch
+                __replay_sample__ = np.random.choice(len(__replay_input__), __num_replay__, replace=False)
+                __input__ = np.concatenate((__new_input__, __replay_input__[__replay_sample__]))
+                __target__ = np.concatenate((__new_target__, __replay_target__[__replay_sample__]))
+
+                if Shuffle:
+                    __order__ = np.random.permutation(len(__input__))
+                else:
+                    __order__ = np.arange(len(__input__))
+
+                # Loop through the samples, one batch at a time
+                for __i__ in range(0, len(__order__), self.__N__):
+                    __batch__ = __order__[__i__: __i__ + self.__N__]
+
+                    __activations__ = self._forward(__input__=__input__[__batch__])
+                    __temp_loss__.append(self._update_loss(__output__=__activations__[-1],
+                                                           __target__=__target__[__batch__]))
+
+                    self._update_gradients(__activations__=__activations__, __target__=__target__[__batch__],
+                                           __batch_size__=len(__batch__))
+                    self._update_weights()
+
+                __train_loss__.append(float(np.mean(np.concatenate(__temp_loss__))))
+                __temp_loss__.clear()
+
+            self._checkpoint()
+
+            # Evaluate whether the new data was learnt and the older samples were not forgotten
+            __new_loss__ = float(np.mean(self._update_loss(__output__=self._forward(__input__=__new_input__)[-1],
+                                                           __target__=__new_target__)))
+            __replay_loss__ = None
+            if len(__replay_input__) > 0:
+                __replay_loss__ = float(np.mean(self._update_loss(
+                    __output__=self._forward(__input__=__replay_input__)[-1], __target__=__replay_target__)))
+
+            self._update_replay(__input__=__new_input__, __target__=__new_target__, __size__=ReplayBufferSize)
+
+        finally:
+            self.__checkpoint_steps__, self.__checkpoint_seconds__ = __checkpoint__
+
+        return [__train_loss__, __new_loss__, __replay_loss__]
+
     def FeedForward(self, __input__, __target__, __learn__=False, __return_outputs__=False):
         """
         Description:
@@ -541,137 +1269,144 @@ class CoarseModel:
         None.
         """
 
-        # Feed the inputs, conditioned with the activation function and bias, which will be used as initial values.
-        # Remember, the bias output value is 1.0, thus only the weight of the bias is considered
-        for __i__ in range(len(__input__)):
-
-            self.__neuron_array__[0][__i__] = \
-                self._activation(__input__=__input__[__i__] + self.__weights_array__[0][__i__][0])
-
-            # Update average output of layer neuron
-            self.__out_j__[0][__i__] = self.__neuron_array__[0][__i__]
+        __activations__ = self._forward(__input__=np.asarray(__input__, dtype=self.__dtype__)[np.newaxis])
 
-        # Perform actual feed-forward process
-        # Layer loop
-        for __i__ in range(1, len(self.__neuron_array__)):
-            # Neuron loop
-            for __j__ in range(len(self.__neuron_array__[__i__])):
-                self.__neuron_array__[__i__][__j__] = \
-                    self._activation(__input__=self._summation(__layer_index__=__i__, __neuron_index__=__j__))
-
-                # Update average output of layer neuron
-                self.__out_j__[__i__][__j__] += self.__neuron_array__[__i__][__j__] / self.__N__
+        # Keep the neuron outputs of the latest feedforward operation
+        for __i__ in range(len(__activations__)):
+            self.__neuron_array__[__i__][:] = __activations__[__i__][0]
 
         if __target__ is not None:
-            self._update_loss(__target__=__target__, __learn__=__learn__)
+            __target__ = np.asarray(__target__, dtype=self.__dtype__)[np.newaxis]
+            self.__nrmse__ = float(self._update_loss(__output__=__activations__[-1], __target__=__target__)[0])
 
         if __learn__:
             self.__init_N__ += 1
-            self._update_gradients()
+            self._update_gradients(__activations__=__activations__, __target__=__target__,
+                                   __batch_size__=self.__N__)
             if self.__init_N__ % self.__N__ == 0:
                 self._update_weights()
                 return
 
         if __return_outputs__:
-            return [__i__ for __i__ in self.__neuron_array__[-1]]
+            return self.__neuron_array__[-1].tolist()
 
-    def _summation(self, __layer_index__, __neuron_index__):
+    def PredictBatch(self, Inputs=None):
         """
         Description:
         ------------
-        Performs a dot product operation given the layer index and neuron index.
+        Predicts the output layer values for a batch of inputs, where every sample is fed through the neural network
+        in a single vectorized feedforward operation.
 
         Parameters:
         -----------
-        __layer_index__:            int
-                                    Used for pointing to the indexed layer of the neural network.
-        __neuron_index__:           int
-                                    Used for pointing to the indexed neuron of the neural network.
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels). A 1D array is treated as a single sample.
 
         Returns:
         --------
-        Returns the result after the dot product operation.
+        Returns a 2D array in the form of (number of samples, number of output channels).
 
         Notes:
         ------
-        None.
+        None of the attributes of the class are changed, thus it is safe to call from more than one thread whilst the
+        neural network is not being trained.
         """
 
-        __total__ = 0.0
+        if Inputs is None:
+            raise Exception('<CoarseModel: PredictBatch: Inputs is of None type>')
 
-        # The indices for both the self.__input_array__ and self.__weights_array__ are
-        # the same, except for the self.__weights_array__ having an extra dimension,
-        # weights that are associated with neuron n.
-        for __i__ in range(len(self.__weights_array__[__layer_index__]) - 1):
-            __total__ += self.__neuron_array__[__layer_index__ - 1][__i__] * \
-                         self.__weights_array__[__layer_index__][__i__][__neuron_index__]
+        __input__ = np.atleast_2d(np.asarray(Inputs, dtype=self.__dtype__))
 
-        # Add bias
-        __total__ += self.__weights_array__[__layer_index__][-1][__neuron_index__]
+        if __input__.ndim != 2 or __input__.shape[1] != self.__layer_sizes__[0]:
+            raise Exception(f'<CoarseModel: PredictBatch: Inputs must be of shape (number of samples, '
+                            f'{self.__layer_sizes__[0]}), not {__input__.shape}>')
 
-        # Update average summation input to neuron __neuron_index__
-        self.__in_j__[__layer_index__][__neuron_index__] = __total__
+        return self._forward(__input__=__input__)[-1]
 
-        return __total__
-
-    def _activation(self, __input__):
+    def Jacobian(self, Inputs=None):
         """
         Description:
         ------------
-        Performs an activation operation given the input (__input__).
+        Determines the derivatives of the output layer values with respect to the input values for a batch of inputs,
+        which is used for gradient-based refinement of designs.
 
         Parameters:
         -----------
-        __input__:                  float
-                                    The value to perform the activation function on.
+        Inputs:                     ndarray
+                                    A 2D array (or list of lists) in the form of (number of samples, number of input
+                                    channels). A 1D array is treated as a single sample.
 
         Returns:
         --------
-        Returns the result of the activation function operation.
+        Returns a 3D array in the form of (number of samples, number of output channels, number of input channels).
 
         Notes:
         ------
-        None.
+        The derivatives are propagated forward, layer by layer, together with the activations, thus the cost is that of
+        a feedforward operation per input channel. None of the attributes of the class are changed.
         """
 
-        return 1 / (1 + np.exp(-1 * __input__))
+        if Inputs is None:
+            raise Exception('<CoarseModel: Jacobian: Inputs is of None type>')
+
+        __input__ = np.atleast_2d(np.asarray(Inputs, dtype=self.__dtype__))
+
+        if __input__.ndim != 2 or __input__.shape[1] != self.__layer_sizes__[0]:
+            raise Exception(f'<CoarseModel: Jacobian: Inputs must be of shape (number of samples, '
+                            f'{self.__layer_sizes__[0]}), not {__input__.shape}>')
 
-    def _activation_derivative(self, __input__):
+        __activations__ = self._forward(__input__=__input__)
+
+        # The input layer is conditioned per input channel, thus its derivative is diagonal, in the form of
+        # (number of samples, number of input channels, number of neurons)
+        __jacobian__ = np.eye(__input__.shape[1], dtype=self.__dtype__) * \
+            self._activation_derivative(__output__=__activations__[0])[:, np.newaxis, :]
+
+        for __i__ in range(1, len(self.__weights_array__)):
+            __jacobian__ = (__jacobian__ @ self.__weights_array__[__i__][:-1]) * \
+                self._activation_derivative(__output__=__activations__[__i__])[:, np.newaxis, :]
+
+        return __jacobian__.transpose(0, 2, 1)
+
+    def Export(self, Directory=None):
         """
         Description:
         ------------
-        Performs the derivative activation operation given the input (__input__).
+        Writes a self-contained predictor of the neural network, 'Predictor.npz', along with its loader,
+        'predictor.py', which only depends on NumPy. Evaluation scripts and worker processes can then load the
+        surrogate without importing the AntennaDesign package, constructing a Filing instance, or parsing any text.
 
         Parameters:
         -----------
-        __input__:                  float
-                                    The value to perform the activation function on.
+        Directory:                  str
+                                    The directory, under the 'Predictor' directory, to write the predictor to. When
+                                    None, the 'Predictor' directory is used.
 
         Returns:
         --------
-        Returns the result of the derivative activation function operation.
+        Returns 0 when the predictor was written, else -1 is returned.
 
         Notes:
         ------
-        None.
+        The predictor is loaded with predictor.Predictor('Predictor.npz'), see AntennaDesign.predictor.
         """
 
-        return (1 / (1 + np.exp(-1 * __input__))) * (1 - 1 / (1 + np.exp(-1 * __input__)))
+        return self._export(__directory__=Directory, __arrays__={})
 
-    # Update errors
-    def _update_loss(self, __target__, __learn__=True):
+    def _initialize(self, __initializer__, __seed__):
         """
         Description:
         ------------
-        Updates the loss of the neural network and determines the error at the output layer, averaged over __N__
-        (batch size).
+        Initializes the weights of the neural network, where the bias weights are initialized to zero and the weights
+        linking the neurons of consecutive layers are drawn according to the initializer.
 
         Parameters:
         -----------
-        __target__:                 list
-                                    A list that has the actual output values that the neural network should match with.
-        __learn__:                  bool
-                                    Updates the error of the neural network if True, else the error is left alone.
+        __initializer__:            str
+                                    The name of the initializer, either 'xavier', 'he', 'uniform', or 'zeros'.
+        __seed__:                   int
+                                    The seed of the initializer, or None.
 
         Returns:
         --------
@@ -679,174 +1414,888 @@ class CoarseModel:
 
         Notes:
         ------
-        None.
+        The weights are updated in-place so that the per layer views remain valid.
         """
 
-        self.__nrmse__ = 0
-        for __i__ in range(self.__phi_k__):
-            # Update average root-mean-square error for analysis
-            self.__nrmse__ += ((__target__[__i__] - self.__neuron_array__[-1][__i__]) ** 2) ** 0.5 / \
-                              (max(__target__) - min(__target__))
+        self.__weights_vector__[:] = 0.0
 
-            if __learn__:
-                # Update L2 loss that will be used for calculating the gradients. The derivative of the L2 loss function
-                # is dL2/d(predicted) = -2 * (target - predicted), where L2 = (target - predicted) ** 2
-                self.__error_k__[__i__] += -2 * (__target__[__i__] - self.__neuron_array__[-1][__i__]) / self.__N__
+        if __initializer__ == 'zeros':
+            return
 
-    def _update_weights(self):
+        __random__ = np.random.RandomState(__seed__) if __seed__ is not None else np.random
+
+        # The input layer only has bias weights, which are kept at zero
+        for __i__ in range(1, len(self.__weights_array__)):
+            __fan_in__, __fan_out__ = self.__shapes__[__i__][0] - 1, self.__shapes__[__i__][1]
+
+            if __initializer__ == 'xavier':
+                __limit__ = np.sqrt(6 / (__fan_in__ + __fan_out__))
+                __weights__ = __random__.uniform(-__limit__, __limit__, (__fan_in__, __fan_out__))
+            elif __initializer__ == 'he':
+                __weights__ = __random__.normal(0.0, np.sqrt(2 / __fan_in__), (__fan_in__, __fan_out__))
+            else:
+                __limit__ = 1 / np.sqrt(__fan_in__)
+                __weights__ = __random__.uniform(-__limit__, __limit__, (__fan_in__, __fan_out__))
+
+            self.__weights_array__[__i__][:-1] = __weights__
+
+    def _schedule(self, __schedule__, __arguments__, __state__, __epoch__, __validation_loss__):
         """
         Description:
         ------------
-        Updates the weights of the neural network given that training mode is enabled. The gradients are first updated,
-        after which the two moments are updated, before the weights are updated.
+        Determines the learning rate for the next epoch given the learning rate schedule, see Train.
 
         Parameters:
         -----------
-        None.
+        __schedule__:               str
+                                    The name of the schedule, or a function in the form of
+                                    f(epoch, learning rate, validation losses).
+        __arguments__:              dict
+                                    The arguments of the schedule.
+        __state__:                  dict
+                                    The initial learning rate, as well as the best validation loss and the number of
+                                    epochs without improvement for the 'plateau' schedule, which is updated in-place.
+        __epoch__:                  int
+                                    The number of epochs that have finished.
+        __validation_loss__:        list
+                                    The validation loss per epoch that has finished.
 
         Returns:
         --------
-        None.
+        Returns the learning rate for the next epoch.
 
         Notes:
         ------
         None.
         """
 
-        # Update gradients
-        # self._update_gradients()
+        if callable(__schedule__):
+            return float(__schedule__(__epoch__, self.__alpha__, __validation_loss__))
 
-        self.__time_step__ += 1
+        if __schedule__ == 'step':
+            return __state__['LearningRate'] * __arguments__['Factor'] ** (__epoch__ // __arguments__['StepSize'])
 
-        # Update mean and variance
-        self._update_mean_variance()
-
-        # Perform the weight updates
-        for __i__ in range(len(self.__weights_array__)):
-            for __j__ in range(len(self.__weights_array__[__i__])):
-                for __k__ in range(len(self.__weights_array__[__i__][__j__])):
-                    self.__weights_array__[__i__][__j__][__k__] = self.__weights_array__[__i__][__j__][__k__] - \
-                        (self.__alpha__ * (1 - self.__beta_2__ ** self.__time_step__) ** 0.5 /
-                         (1 - self.__beta_1__ ** self.__time_step__)) * \
-                        (self.__mean__[__i__][__j__][__k__] /
-                         (self.__variance__[__i__][__j__][__k__] ** 0.5 +
-                          self.__epsilon__))
-
-        # Save weights
-        if self.__filing__ is not None:
-            self.__filing__.Save(Filename=self.__files__[0], Lists=self.__weights_array__)
+        if __schedule__ == 'cosine':
+            __progress__ = min(__epoch__ / __arguments__['Period'], 1.0)
+            return __arguments__['MinimumLearningRate'] + 0.5 * (__state__['LearningRate'] -
+                                                                  __arguments__['MinimumLearningRate']) * \
+                (1 + np.cos(np.pi * __progress__))
 
-    # Loss used is the mean-square-error derivative
-    def _update_gradients(self):
+        # Reduce the learning rate on a plateau of the validation loss
+        if __validation_loss__[-1] < __state__['Best'] - __arguments__['MinDelta']:
+            __state__['Best'] = __validation_loss__[-1]
+            __state__['Stale'] = 0
+        else:
+            __state__['Stale'] += 1
+
+        if __state__['Stale'] >= __arguments__['Patience']:
+            __state__['Stale'] = 0
+            return max(self.__alpha__ * __arguments__['Factor'], __arguments__['MinimumLearningRate'])
+
+        return self.__alpha__
+
+    def _views(self, __buffer__):
         """
         Description:
         ------------
-        Updates the gradients of the weights, averaged over __N__ (batch size). The deltas are determined before the
-        gradients are updated.
+        Splits a contiguous 1D array, with the same length as the number of weights of the neural network, into the
+        weight matrices per layer. No data is copied, thus any in-place update to the matrices updates the buffer.
 
         Parameters:
         -----------
-        None.
+        __buffer__:                 ndarray
+                                    The 1D array to split into the weight matrices.
 
         Returns:
         --------
-        None.
+        Returns a list of 2D arrays, one per layer, with the shapes defined in __shapes__.
 
         Notes:
         ------
         None.
         """
 
-        # Output layer
-        for __i__ in range(self.__phi_k__):
-            # Update delta value
-            self.__delta__[-1][__i__] = self.__error_k__[__i__] * self._activation_derivative(self.__in_j__[-1][__i__])
-            self.__error_k__[__i__] = 0.0
-
-            # Update gradient values. The '-1' is for the skipping the bias neuron since it does not have an official
-            # output
-            for __j__ in range(len(self.__grad__[-1]) - 1):
-                self.__grad__[-1][__j__][__i__] += self.__delta__[-1][__i__] * self.__out_j__[-2][__j__] / self.__N__
+        __views__ = []
+        __offset__ = 0
 
-                # Clear output
-                # self.__out_j__[-2][__j__] = 0.0
+        for __shape__ in self.__shapes__:
+            __size__ = __shape__[0] * __shape__[1]
+            __views__.append(__buffer__[__offset__: __offset__ + __size__].reshape(__shape__))
+            __offset__ += __size__
 
-            # Update bias gradient value
-            self.__grad__[-1][-1][__i__] += self.__delta__[-1][__i__] / self.__N__
+        return __views__
 
-            # Clear input
-            # self.__in_j__[-1][__i__] = 0.0
-
-        # Hidden layers
-        for __i__ in range(len(self.__delta__) - 2, -1, -1):
-            for __j__ in range(len(self.__delta__[__i__])):
-                __sum__ = 0
-
-                # Determine the summation of the weights and their deltas for the current neuron
-                for __k__ in range(len(self.__weights_array__[__i__ + 1][__j__])):
-                    __sum__ += self.__weights_array__[__i__ + 1][__j__][__k__] * self.__delta__[__i__ + 1][__k__]
-
-                # Update current neuron's delta value
-                self.__delta__[__i__][__j__] = self._activation_derivative(self.__in_j__[__i__][__j__]) * __sum__
-
-                # Clear input
-                # self.__in_j__[__i__][__j__] = 0.0
-
-                # Conditioned only for the hidden layers as there is no out_j_i from the input layer
-                if __i__ > 0:
-                    # Update the gradients involved with the current delta value
-                    for __k__ in range(len(self.__grad__[__i__]) - 1):
-                        self.__grad__[__i__][__k__][__j__] += self.__delta__[__i__][__j__] * \
-                                                              self.__out_j__[__i__ - 1][__k__] / self.__N__
-                        # Clear output
-                        # self.__out_j__[__i__ - 1][__k__] = 0.0
-
-                    # Update bias gradient for delta n
-                    self.__grad__[__i__][-1][__j__] += self.__delta__[__i__][__j__] / self.__N__
-
-                # Conditioned when in the first hidden layer, the conditioned input layer
-                else:
-                    self.__grad__[0][__j__][0] += self.__delta__[__i__][__j__] / self.__N__
-
-    def _update_mean_variance(self):
+    def _to_arrays(self, __data__):
         """
         Description:
         ------------
-        Updates the two moments of the ADAM algorithm. This is the last function called before the weights of the
-        neural network are updated. The optimized variant of the ADAM algorithm is adopted for the whole process of
-        optimizing the weights of the neural network.
+        Converts data points, in the form of [input, target], into an input matrix and a target matrix.
 
         Parameters:
         -----------
-        None.
+        __data__:                   list
+                                    A list of data points, where each data point is comprised of the input vector and
+                                    the output vector.
 
         Returns:
         --------
-        None.
+        Returns the input matrix and the target matrix, of the floating point type of the neural network, where each
+        row is a data point.
 
         Notes:
         ------
         None.
         """
 
-        # Layer
-        for __i__ in range(len(self.__grad__)):
-
-            # Gradient array
-            for __j__ in range(len(self.__grad__[__i__])):
+        return np.asarray([__i__[0] for __i__ in __data__], dtype=self.__dtype__), \
+            np.asarray([__i__[1] for __i__ in __data__], dtype=self.__dtype__)
 
-                # Gradient element corresponding to weight element
-                for __k__ in range(len(self.__grad__[__i__][__j__])):
+    def _forward(self, __input__):
+        """
+        Description:
+        ------------
+        Feeds a batch of inputs through the neural network, one matrix product per layer. None of the attributes of
+        the class are changed.
+
+        Parameters:
+        -----------
+        __input__:                  ndarray
+                                    A 2D array with one row per sample and one column per input channel.
+
+        Returns:
+        --------
+        Returns a list with the outputs of every layer, each a 2D array with one row per sample, where the last
+        element is the output layer.
+
+        Notes:
+        ------
+        None.
+        """
+
+        # Keep the computations in the floating point type of the neural network
+        __input__ = np.asarray(__input__, dtype=self.__dtype__)
+
+        # Feed the inputs, conditioned with the activation function and bias, which will be used as initial values.
+        # Remember, the bias output value is 1.0, thus only the weight of the bias is considered
+        __activations__ = [self._activation(__input__=__input__ + self.__weights_array__[0][:, 0])]
+
+        # Perform actual feed-forward process, one matrix product per layer
+        for __i__ in range(1, len(self.__weights_array__)):
+            __activations__.append(self._activation(
+                __input__=self._summation(__layer_index__=__i__, __input__=__activations__[-1])))
+
+        return __activations__
+
+    def _summation(self, __layer_index__, __input__):
+        """
+        Description:
+        ------------
+        Performs the dot product operation for all the neurons in a layer given the layer index.
+
+        Parameters:
+        -----------
+        __layer_index__:            int
+                                    Used for pointing to the indexed layer of the neural network.
+        __input__:                  ndarray
+                                    The outputs of the previous layer, a 2D array with one row per sample.
+
+        Returns:
+        --------
+        Returns the result after the dot product operation, a 2D array with one row per sample and a column per neuron
+        of the layer.
+
+        Notes:
+        ------
+        None.
+        """
+
+        # The last row of the weight matrix holds the bias weights, which is added after the matrix product
+        return __input__ @ self.__weights_array__[__layer_index__][:-1] + self.__weights_array__[__layer_index__][-1]
+
+    def _activation(self, __input__):
+        """
+        Description:
+        ------------
+        Performs an activation operation given the input (__input__).
+
+        Parameters:
+        -----------
+        __input__:                  ndarray
+                                    The value(s) to perform the activation function on.
+
+        Returns:
+        --------
+        Returns the result of the activation function operation.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return 1 / (1 + np.exp(-1 * __input__))
+
+    def _activation_derivative(self, __output__):
+        """
+        Description:
+        ------------
+        Performs the derivative activation operation given the output of the activation function (__output__).
+
+        Parameters:
+        -----------
+        __output__:                 ndarray
+                                    The value(s) that the activation function returned.
+
+        Returns:
+        --------
+        Returns the result of the derivative activation function operation.
+
+        Notes:
+        ------
+        The derivative of the sigmoid function is f'(x) = f(x) * (1 - f(x)), thus the activation outputs that were
+        kept from the feedforward process are reused.
+        """
+
+        return __output__ * (1 - __output__)
+
+    # Update errors
+    def _update_loss(self, __output__, __target__):
+        """
+        Description:
+        ------------
+        Determines the normalized root-mean-square-error of the neural network per sample.
+
+        Parameters:
+        -----------
+        __output__:                 ndarray
+                                    A 2D array with the output layer values, one row per sample.
+        __target__:                 ndarray
+                                    A 2D array that has the actual output values that the neural network should match
+                                    with, one row per sample.
+
+        Returns:
+        --------
+        Returns a 1D array with the loss per sample.
+
+        Notes:
+        ------
+        None.
+        """
+
+        return np.sum(np.abs(__target__ - __output__), axis=1) / (__target__.max(axis=1) - __target__.min(axis=1))
+
+    def _export(self, __directory__, __arrays__):
+        """
+        Description:
+        ------------
+        Writes the archive of the weights, in the floating point type of the neural network, and any extra arrays, after
+        which the loader is copied next to it.
+
+        Parameters:
+        -----------
+        __directory__:              str
+                                    The directory under the 'Predictor' directory, or None.
+        __arrays__:                 dict
+                                    Extra arrays to write into the archive, keyed by their names.
+
+        Returns:
+        --------
+        Returns 0 when the predictor was written, else -1 is returned.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__filing__ is None:
+            raise Exception('<CoarseModel: Export: Filing is of None type, it must be of Filing type>')
+
+        if __directory__ is None:
+            __directory__ = '\\Predictor\\'
+        else:
+            __directory__ = '\\Predictor\\' + __directory__ + '\\'
+        self.__filing__.CreateDirectories(Directories=[__directory__])
+
+        __archive__ = {'version': np.array(1), 'layer_sizes': np.asarray(self.__layer_sizes__),
+                       'weights': self.__weights_vector__}
+        __archive__.update(__arrays__)
+
+        if self.__filing__.SaveArrays(Filename=__directory__ + 'Predictor.npz', Arrays=__archive__) == -1:
+            return -1
+
+        return self.__filing__.SaveText(Filename=__directory__ + 'predictor.py',
+                                        Text=(pkg_resources.files('AntennaDesign') / 'predictor.py').read_text())
+
+    def _checkpoint(self):
+        """
+        Description:
+        ------------
+        Writes the weights of the neural network to the binary checkpoint file, 'Weights.npy', and the ADAM state, in
+        the form of [time step, first moments, second moments], to 'Optimizer.npy'. Each file replaces the previous
+        checkpoint atomically.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if self.__filing__ is not None:
+            with self.__profiler__.Phase(Name='checkpoint'):
+                self.__filing__.SaveArray(Filename=self.__files__[2], Array=self.__weights_vector__)
+                self.__filing__.SaveArray(Filename=self.__files__[3],
+                                          Array=np.concatenate(([self.__time_step__], self.__mean_vector__,
+                                                                self.__variance_vector__)))
+
+        self.__checkpoint_time__ = time.time()
+
+    def _update_replay(self, __input__, __target__, __size__):
+        """
+        Description:
+        ------------
+        Adds samples to the replay buffer, after which the replay buffer is written to 'Replay.npy'. Once the replay
+        buffer is full, reservoir sampling is used, so that every sample that was ever added has the same chance of
+        being kept.
+
+        Parameters:
+        -----------
+        __input__:                  ndarray
+                                    A 2D array with the input values, one row per sample.
+        __target__:                 ndarray
+                                    A 2D array with the target values, one row per sample.
+        __size__:                   int
+                                    The maximum number of samples in the replay buffer.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        The number of samples ever added is kept along with the replay buffer, as the first row of 'Replay.npy', since
+        it can not be determined from the samples that were kept.
+        """
+
+        __seen__ = self.__replay_seen__
+        __rows__ = np.column_stack((np.arange(__seen__, __seen__ + len(__input__)), __input__, __target__))
+        __rows__ = __rows__.astype(np.float64)
+
+        # Fill the replay buffer, should there be room
+        __room__ = max(0, __size__ - len(self.__replay__))
+        __buffer__ = np.concatenate((self.__replay__[:__size__], __rows__[:__room__]))
+
+        # Sample number n replaces a random sample of the full replay buffer with a probability of size / (n + 1)
+        __rows__ = __rows__[__room__:]
+        if len(__rows__) > 0:
+            __index__ = (np.random.random(len(__rows__)) * (__rows__[:, 0] + 1)).astype(int)
+            __keep__ = __index__ < __size__
+            __buffer__[__index__[__keep__]] = __rows__[__keep__]
+
+        self.__replay__ = __buffer__
+        self.__replay_seen__ = __seen__ + len(__input__)
+
+        if self.__filing__ is not None:
+            __header__ = np.zeros((1, self.__replay__.shape[1]))
+            __header__[0, :2] = [-1, self.__replay_seen__]
+            self.__filing__.SaveArray(Filename=self.__files__[4], Array=np.concatenate((__header__, self.__replay__)))
+
+    def _sample(self, __model__, __parameters__, __number__, __rounding__):
+        """
+        Description:
+        ------------
+        Draws __number__ samples for BuildDataset. Batches of LHS candidates, rounded to __rounding__ decimals, are
+        checked against the explore space at once, and only feasible candidates that have not been drawn before are
+        kept. The samples are then selected from the feasible candidates for maximin space-filling.
+
+        Parameters:
+        -----------
+        __model__:                  ModelGeometry
+                                    The antenna model, of which the explore space is checked.
+        __parameters__:             list
+                                    A list of parameter ranges in the form of [[lower bound, upper bound], ...].
+        __number__:                 int
+                                    The number of samples.
+        __rounding__:               int
+                                    The rounding for the float value(s) of the parameter(s).
+
+        Returns:
+        --------
+        Returns a list of __number__ samples, each a list of parameter values.
+
+        Notes:
+        ------
+        Up to ten times __number__ feasible candidates are collected, from at most 100 batches of ten times __number__
+        LHS candidates each, after which an exception is raised if fewer than __number__ feasible candidates were
+        found. The selection is greedy, where the next sample is the candidate that is farthest from the samples
+        selected so far (in the parameter space scaled to the unit hypercube), starting at the candidate closest to
+        the centre. Models without a CheckBoundaries method are checked one candidate at a time with CheckBoundary.
+        """
+
+        __limits__ = np.asarray(__parameters__, dtype=np.float64)
+        __size__ = 10 * __number__
+
+        __candidates__ = []
+        __drawn__ = set()
+
+        for _ in range(100):
+            __batch__ = np.round(LHS(xlimits=__limits__)(__size__), __rounding__)
+
+            # Keep every candidate once, where the hash of the rounded values replaces a search through a list
+            __unique__ = []
+            for __i__ in range(len(__batch__)):
+                __key__ = tuple(__batch__[__i__].tolist())
+                if __key__ not in __drawn__:
+                    __drawn__.add(__key__)
+                    __unique__.append(__i__)
+            __batch__ = __batch__[__unique__]
+
+            # Check the explore space for the whole batch
+            if hasattr(__model__, 'CheckBoundaries'):
+                __feasible__ = __model__.CheckBoundaries(Parameters=__batch__, Rounding=__rounding__)
+            else:
+                __feasible__ = np.ones(len(__batch__), dtype=bool)
+                for __i__ in range(len(__batch__)):
+                    try:
+                        __model__.CheckBoundary(Parameters=__batch__[__i__].tolist(), Rounding=__rounding__)
+                    except Exception as __error__:
+                        __feasible__[__i__] = False
+                        if self.__debugging__:
+                            print(f'<CoarseModel: _sample: {__error__}>')
+
+            __candidates__.extend(__batch__[__feasible__])
+            if len(__candidates__) >= __size__:
+                break
+
+        if len(__candidates__) < __number__:
+            raise Exception(f'<CoarseModel: BuildDataset: Only {len(__candidates__)} feasible samples were found out '
+                            f'of {len(__drawn__)} candidates, whilst {__number__} samples are required>')
+
+        # Greedy maximin selection in the unit hypercube
+        __candidates__ = np.asarray(__candidates__[:__size__])
+        __scaled__ = (__candidates__ - __limits__[:, 0]) / np.where(__limits__[:, 1] > __limits__[:, 0],
+                                                                   __limits__[:, 1] - __limits__[:, 0], 1.0)
+
+        __selected__ = [int(np.argmin(np.sum((__scaled__ - 0.5) ** 2, axis=1)))]
+        __distance__ = np.sum((__scaled__ - __scaled__[__selected__[0]]) ** 2, axis=1)
+
+        while len(__selected__) < __number__:
+            __selected__.append(int(np.argmax(__distance__)))
+            __distance__ = np.minimum(__distance__, np.sum((__scaled__ - __scaled__[__selected__[-1]]) ** 2, axis=1))
+
+        return __candidates__[__selected__].tolist()
+
+    def _simulate(self, __sample__, __model__, __rounding__, __factory__, __number__, __retries__):
+        """
+        Description:
+        ------------
+        Simulates the samples, one after another with __model__ or across a pool of simulator workers should
+        __factory__ be defined, where the samples that are in the 'lhs' file already are not simulated again.
+
+        Parameters:
+        -----------
+        __sample__:                 list
+                                    The parameter values per sample.
+        __model__:                  ModelGeometry
+                                    The antenna model that simulates the samples one after another.
+        __rounding__:               int
+                                    The rounding for the float value(s) of the parameter(s).
+        __factory__:                function
+                                    The function that builds the simulator of a worker, or None.
+        __number__:                 int
+                                    The number of workers, where None is the number of processors.
+        __retries__:                int
+                                    The number of times a failed sample is simulated again by the workers.
+
+        Returns:
+        --------
+        Returns the dataset in the form of [[parameter values, simulation results], ...].
+
+        Notes:
+        ------
+        None.
+        """
+
+        if __factory__ is not None:
+            return self._simulate_pool(__sample__=__sample__, __factory__=__factory__, __number__=__number__,
+                                       __retries__=__retries__, __rounding__=__rounding__)
+
+        # Data list that keeps all samples in the form of [parameter values, simulation results]
+        __temp__ = []
+
+        for __i__ in range(len(__sample__)):
+            __start__ = time.time() / 60
+
+            # Attempt to retrieve a duplicate
+            __result__ = self.__filing__.Duplicate(Filename=self.__files__[1], List=[__sample__[__i__], []])
+
+            # No duplicate found, simulate and store data point
+            if not isinstance(__result__, list):
+                __temp__.append([__sample__[__i__], __model__.SimulateModel(Parameters=__sample__[__i__],
+                                                                            Rounding=__rounding__)])
+                if self.__filing__.Append(Filename=self.__files__[1], List=__temp__[-1]) == -1:
+                    raise Exception(f'<CoarseModel: BuildDataset: Unable to append sample {__sample__[__i__]} to '
+                                    f'{self.__files__[1]}>')
+
+            # Duplicate found
+            else:
+                __temp__.append(__result__)
+
+            print(f'\r<CoarseModel: BuildDataset: Generating dataset: {len(__sample__) - __i__} '
+                  f'samples remaining \t Time taken for simulation {__i__ + 1}: '
+                  f'{round(time.time() / 60 - __start__, 2)}', end='')
+
+        return __temp__
+
+    def _simulate_pool(self, __sample__, __factory__, __number__, __retries__, __rounding__):
+        """
+        Description:
+        ------------
+        Simulates the samples of BuildDataset across __number__ simulator workers, each a process of its own with a
+        simulator built by __factory__. The results are appended to the 'lhs' file as they finish.
+
+        Parameters:
+        -----------
+        __sample__:                 list
+                                    The parameter values per sample.
+        __factory__:                function
+                                    The function that builds the simulator of a worker.
+        __number__:                 int
+                                    The number of workers, where None is the number of processors.
+        __retries__:                int
+                                    The number of times a failed sample is simulated again.
+        __rounding__:               int
+                                    The rounding for the float value(s) of the parameter(s).
+
+        Returns:
+        --------
+        Returns the dataset in the form of [[parameter values, simulation results], ...], in the order of __sample__,
+        without the samples that failed more than __retries__ times.
+
+        Notes:
+        ------
+        Samples that already are in the 'lhs' file are not simulated again.
+        """
+
+        if __number__ is None:
+            __number__ = os.cpu_count()
+
+        __results__ = [None for _ in __sample__]
+        __attempts__ = [0 for _ in __sample__]
+        __queue__ = []
+
+        # Retrieve the duplicates, where only the remaining samples are simulated
+        for __i__ in range(len(__sample__)):
+            __result__ = self.__filing__.Duplicate(Filename=self.__files__[1], List=[__sample__[__i__], []])
+
+            if isinstance(__result__, list):
+                __results__[__i__] = __result__
+            else:
+                __queue__.append(__i__)
+
+        __remaining__ = len(__queue__)
+        __start__ = time.time() / 60
+
+        # A pool of a single process per worker, thus a crash only breaks the worker it happened in
+        __executors__ = [None for _ in range(__number__)]
+        __running__ = {}
+
+        try:
+            while len(__queue__) > 0 or len(__running__) > 0:
+
+                # Keep every worker busy
+                __busy__ = [__i__[0] for __i__ in __running__.values()]
+                for __slot__ in range(__number__):
+                    if __slot__ in __busy__ or len(__queue__) == 0:
+                        continue
+
+                    if __executors__[__slot__] is None:
+                        __executors__[__slot__] = futures.ProcessPoolExecutor(max_workers=1,
+                                                                              initializer=_attach_simulator,
+                                                                              initargs=(__factory__,))
+
+                    __i__ = __queue__.pop(0)
+                    __running__[__executors__[__slot__].submit(_simulate_sample, __sample__[__i__],
+                                                               __rounding__)] = [__slot__, __i__]
+
+                __done__, _ = futures.wait(list(__running__), return_when=futures.FIRST_COMPLETED)
+
+                for __future__ in __done__:
+                    __slot__, __i__ = __running__.pop(__future__)
+
+                    try:
+                        __results__[__i__] = [__sample__[__i__], __future__.result()]
+
+                    except Exception as __error__:
+                        # The worker crashed, thus a new worker (and simulator) is started for the slot
+                        if isinstance(__error__, futures.BrokenExecutor):
+                            __executors__[__slot__].shutdown(wait=False)
+                            __executors__[__slot__] = None
+
+                        __attempts__[__i__] += 1
+                        if __attempts__[__i__] <= __retries__:
+                            __queue__.append(__i__)
+                        else:
+                            __remaining__ -= 1
+                            print(f'\n<CoarseModel: BuildDataset: Sample {__sample__[__i__]} is left out after '
+                                  f'{__attempts__[__i__]} failed simulations: {__error__}>')
+
+                        if self.__debugging__:
+                            print(f'<CoarseModel: _simulate_pool: {__error__}>')
+
+                        continue
+
+                    # Keep the finished sample, should the remaining samples not finish
+                    if self.__filing__.Append(Filename=self.__files__[1], List=__results__[__i__]) == -1:
+                        raise Exception(f'<CoarseModel: BuildDataset: Unable to append sample {__sample__[__i__]} '
+                                        f'to {self.__files__[1]}>')
+
+                    __remaining__ -= 1
+                    print(f'\r<CoarseModel: BuildDataset: Generating dataset: {__remaining__} samples remaining \t '
+                          f'Time elapsed: {round(time.time() / 60 - __start__, 2)}', end='')
+
+        finally:
+            for __i__ in __executors__:
+                if __i__ is not None:
+                    __i__.shutdown(wait=True, cancel_futures=True)
+
+        print()
+
+        return [__i__ for __i__ in __results__ if __i__ is not None]
+
+    def _start_workers(self, __number__, __input__, __target__):
+        """
+        Description:
+        ------------
+        Copies the weights and the training data to shared memory, along with a row of gradients per worker, and starts
+        a pool of __number__ processes that are attached to the shared memory.
+
+        Parameters:
+        -----------
+        __number__:                 int
+                                    The number of worker processes.
+        __input__:                  ndarray
+                                    The training input matrix, one row per sample.
+        __target__:                 ndarray
+                                    The training target matrix, one row per sample.
+
+        Returns:
+        --------
+        Returns a list in the form of [pool of processes, shared memory blocks, shared weights, shared gradients].
+
+        Notes:
+        ------
+        The shared memory blocks are released with _stop_workers.
+        """
+
+        __memories__ = []
+        __arrays__ = {}
+        __configuration__ = {'Shapes': self.__shapes__, 'DataType': self.__dtype__.str}
+
+        try:
+            for __key__, __array__ in [['Weights', self.__weights_vector__], ['Input', __input__],
+                                       ['Target', __target__],
+                                       ['Gradients', np.zeros((__number__, len(self.__weights_vector__)),
+                                                              dtype=self.__dtype__)]]:
+                __memories__.append(shared_memory.SharedMemory(create=True, size=max(__array__.nbytes, 1)))
+                __arrays__[__key__] = np.ndarray(__array__.shape, dtype=self.__dtype__, buffer=__memories__[-1].buf)
+                __arrays__[__key__][:] = __array__
+                __configuration__[__key__] = [__memories__[-1].name, __array__.shape]
+
+            __executor__ = futures.ProcessPoolExecutor(max_workers=__number__, initializer=_attach_worker,
+                                                       initargs=(__configuration__,))
+
+        except Exception as __error__:
+            __arrays__.clear()
+            for __i__ in __memories__:
+                __i__.close()
+                __i__.unlink()
+
+            raise Exception(f'<CoarseModel: _start_workers: {__error__}>')
+
+        return [__executor__, __memories__, __arrays__['Weights'], __arrays__['Gradients']]
+
+    def _parallel_gradients(self, __workers__, __batch__):
+        """
+        Description:
+        ------------
+        Splits a batch into a shard per worker and adds the gradients of the shards, determined across the pool of
+        processes, to the gradients of the neural network.
+
+        Parameters:
+        -----------
+        __workers__:                list
+                                    The pool of processes and its shared memory, as returned by _start_workers.
+        __batch__:                  ndarray
+                                    The indices of the training samples of the batch.
+
+        Returns:
+        --------
+        Returns a 1D array with the loss per sample of the batch.
+
+        Notes:
+        ------
+        The shared weights are first synchronized with the weights of the neural network.
+        """
+
+        __workers__[2][:] = self.__weights_vector__
+
+        __shards__ = [__i__ for __i__ in np.array_split(__batch__, len(__workers__[3])) if len(__i__) > 0]
+        __pending__ = [__workers__[0].submit(_shard_gradients, __shards__[__i__], __i__, len(__batch__))
+                       for __i__ in range(len(__shards__))]
+        __loss__ = np.concatenate([__i__.result() for __i__ in __pending__])
+
+        self.__grad_vector__ += __workers__[3][:len(__shards__)].sum(axis=0)
+
+        return __loss__
+
+    def _stop_workers(self, __workers__):
+        """
+        Description:
+        ------------
+        Shuts the pool of processes down and releases the shared memory blocks.
+
+        Parameters:
+        -----------
+        __workers__:                list
+                                    The pool of processes and its shared memory, as returned by _start_workers.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __workers__[0].shutdown(wait=True, cancel_futures=True)
+
+        # The arrays on top of the shared memory must be released before the shared memory is closed
+        __workers__[2] = None
+        __workers__[3] = None
+        for __i__ in __workers__[1]:
+            __i__.close()
+            __i__.unlink()
+
+    def _update_weights(self):
+        """
+        Description:
+        ------------
+        Updates the weights of the neural network given that training mode is enabled. The gradients are first updated,
+        after which the two moments are updated, before the weights are updated.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        self.__time_step__ += 1
+
+        # Update mean and variance
+        with self.__profiler__.Phase(Name='mean_variance'):
+            self._update_mean_variance()
+
+        # Perform the weight updates in-place so that the per layer views remain valid
+        with self.__profiler__.Phase(Name='weights'):
+            self.__weights_vector__ -= \
+                (self.__alpha__ * (1 - self.__beta_2__ ** self.__time_step__) ** 0.5 /
+                 (1 - self.__beta_1__ ** self.__time_step__)) * \
+                (self.__mean_vector__ / (self.__variance_vector__ ** 0.5 + self.__epsilon__))
+
+        # Checkpoint the weights at the defined interval
+        if (self.__checkpoint_steps__ is not None and self.__time_step__ % self.__checkpoint_steps__ == 0) or \
+                (self.__checkpoint_seconds__ is not None and
+                 time.time() - self.__checkpoint_time__ >= self.__checkpoint_seconds__):
+            self._checkpoint()
+
+    # Loss used is the mean-square-error derivative
+    def _update_gradients(self, __activations__, __target__, __batch_size__):
+        """
+        Description:
+        ------------
+        Updates the gradients of the weights for a batch of samples, averaged over __batch_size__. The deltas are
+        determined before the gradients are updated.
+
+        Parameters:
+        -----------
+        __activations__:            list
+                                    The outputs of every layer from the _forward method for the batch.
+        __target__:                 ndarray
+                                    A 2D array with the actual output values, one row per sample.
+        __batch_size__:             int
+                                    The number of samples the gradients are averaged over.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        The gradients are accumulated, thus a batch may be split over more than one call before the weights are
+        updated.
+        """
+
+        # The derivative of the L2 loss function is dL2/d(predicted) = -2 * (target - predicted), where
+        # L2 = (target - predicted) ** 2
+        __delta__ = -2 * (__target__ - __activations__[-1]) / __batch_size__ * \
+            self._activation_derivative(__output__=__activations__[-1])
+
+        # Output layer and hidden layers
+        for __i__ in range(len(__activations__) - 1, 0, -1):
+
+            # Update gradient values. The bias neuron, which does not have an official output, is kept in the last row
+            self.__grad__[__i__][:-1] += __activations__[__i__ - 1].T @ __delta__
+            self.__grad__[__i__][-1] += __delta__.sum(axis=0)
+
+            # Update the previous layer's delta values given the weights and the deltas of the current layer
+            __delta__ = (__delta__ @ self.__weights_array__[__i__][:-1].T) * \
+                self._activation_derivative(__output__=__activations__[__i__ - 1])
+
+        # The conditioned input layer only has bias weights
+        self.__grad__[0][:, 0] += __delta__.sum(axis=0)
+
+    def _update_mean_variance(self):
+        """
+        Description:
+        ------------
+        Updates the two moments of the ADAM algorithm. This is the last function called before the weights of the
+        neural network are updated. The optimized variant of the ADAM algorithm is adopted for the whole process of
+        optimizing the weights of the neural network.
+
+        Parameters:
+        -----------
+        None.
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
 
-                    # Update average of mean
-                    self.__mean__[__i__][__j__][__k__] = \
-                        self.__mean__[__i__][__j__][__k__] * self.__beta_1__ + \
-                        (1 - self.__beta_1__) * self.__grad__[__i__][__j__][__k__]
+        # Update average of mean
+        self.__mean_vector__ *= self.__beta_1__
+        self.__mean_vector__ += (1 - self.__beta_1__) * self.__grad_vector__
 
-                    # Update average of variance
-                    self.__variance__[__i__][__j__][__k__] = \
-                        self.__variance__[__i__][__j__][__k__] * self.__beta_2__ + \
-                        (1 - self.__beta_2__) * self.__grad__[__i__][__j__][__k__] ** 2
+        # Update average of variance
+        self.__variance_vector__ *= self.__beta_2__
+        self.__variance_vector__ += (1 - self.__beta_2__) * self.__grad_vector__ ** 2
 
-                    # Clear gradient n
-                    self.__grad__[__i__][__j__][__k__] = 0.0
+        # Clear gradients
+        self.__grad_vector__[:] = 0.0
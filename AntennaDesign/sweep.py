@@ -0,0 +1,355 @@
+# The initialization module for the package AntennaDesign, which will be a list of common public libraries,
+# see AntennaDesign.__init__ for more information
+from AntennaDesign.__init__ import *
+from AntennaDesign.filing import Filing
+from AntennaDesign.surrogate import CoarseModel
+
+# The hyperparameters that are arguments of the CoarseModel constructor, where the remaining hyperparameters are
+# arguments of CoarseModel.Train
+__model_hyperparameters__ = ('NumberOfHiddenLayers', 'ScalingFactor', 'DataType', 'Initializer')
+
+
+def _train_surrogate(__configuration__):
+    """
+    Description:
+    ------------
+    Trains a single surrogate within a worker process. The random number generators of the process are seeded first,
+    after which a CoarseModel is constructed in its own directory and trained.
+
+    Parameters:
+    -----------
+    __configuration__:              dict
+                                    A dictionary with the keys 'Model' and 'Train', the keyword arguments for the
+                                    CoarseModel constructor and CoarseModel.Train respectively, along with 'Seed',
+                                    'Directory', and 'Debugging'.
+
+    Returns:
+    --------
+    Returns a list in the form of [number of epochs, best validation loss, average testing loss, training time in
+    minutes, trained weights, error], where the error is None if training was successful.
+
+    Notes:
+    ------
+    None.
+    """
+
+    # Seed the random number generators of the worker process
+    np.random.seed(__configuration__['Seed'])
+    random.seed(__configuration__['Seed'])
+
+    __filing__ = Filing(Debugging=__configuration__['Debugging'])
+    __directory__ = '\\Surrogate\\' + __configuration__['Directory'] + '\\'
+
+    # Start from a new neural network rather than the checkpoint of a previous run
+    __filing__.DeleteFile(Filename=__directory__ + 'Weights.npy')
+    __filing__.DeleteFile(Filename=__directory__ + 'Weights')
+    __filing__.DeleteFile(Filename=__directory__ + 'Optimizer.npy')
+    __filing__.DeleteFile(Filename=__directory__ + 'Replay.npy')
+
+    __start__ = time.time() / 60
+
+    try:
+        __model__ = CoarseModel(Filing=__filing__, Directory=__configuration__['Directory'],
+                                Debugging=__configuration__['Debugging'], **__configuration__['Model'])
+        __loss__ = __model__.Train(Verbose=False, **__configuration__['Train'])
+
+        return [len(__loss__[0]), min(__loss__[1]), sum(__loss__[2]) / len(__loss__[2]),
+                time.time() / 60 - __start__, __model__.__weights_vector__, None]
+
+    except Exception as __error__:
+        if __configuration__['Debugging']:
+            print(f'<_train_surrogate: {__error__}>')
+
+        return [0, float('inf'), float('inf'), time.time() / 60 - __start__, None, str(__error__)]
+
+
+class HyperparameterSweep:
+    """
+    Description:
+    ------------
+    Trains a grid, or a random sample of the grid, of CoarseModel configurations across a pool of processes and ranks
+    them according to their validation and testing losses.
+
+    Attributes:
+    -----------
+    __training_data__:              list
+                                    The training data, where each data point is in the form of [input, target].
+    __validation_data__:            list
+                                    The validation data, where each data point is in the form of [input, target].
+    __testing_data__:               list
+                                    The testing data, where each data point is in the form of [input, target].
+    __search_space__:               dict
+                                    A dictionary with a list of values per hyperparameter to sweep.
+    __directory__:                  str
+                                    The directory, under the 'Surrogate' directory, where each configuration has its
+                                    own numbered directory for its checkpoints.
+    __files__:                      list
+                                    A list that contains file names to create, write, and read from. The following files
+                                    are used: 'Results'.
+    __filing__:                     Filing
+                                    Used for writing, reading, appending, deleting data for later use.
+    __debugging__:                  bool
+                                    For debugging purposes (developer mode).
+
+    Methods:
+    --------
+    __init__(TrainingData=None, ValidationData=None, TestingData=None, SearchSpace=None, Filing=None,
+                Directory=None, Debugging=False):
+                                    The constructor of the class, where the TrainingData, ValidationData, TestingData,
+                                    and Filing must be given as arguments.
+    Configurations(Search='grid', NumberOfSamples=None, Seed=0):
+                                    Returns the configurations, either the full grid or a random sample of the grid,
+                                    of the search space.
+    Run(Search='grid', NumberOfSamples=None, NumberOfWorkers=None, Seed=0, NumberOfEpochs=None,
+                TrainDurationMinutes=None, Patience=None, TrainArguments=None):
+                                    Trains the configurations across a pool of processes and returns the ranked table
+                                    of results.
+
+    Notes:
+    ------
+    The worker processes import the main module of the program again on platforms that spawn processes (Windows),
+    thus the script that calls Run must guard its entry point with if __name__ == '__main__'.
+    """
+
+    def __init__(self, TrainingData=None, ValidationData=None, TestingData=None, SearchSpace=None, Filing=None,
+                 Directory=None, Debugging=False):
+        """
+        Description:
+        ------------
+        The constructor of the HyperparameterSweep class. It expects the TrainingData, ValidationData, TestingData, and
+        Filing parameters as arguments, where the SearchSpace (optional) defines the hyperparameters to sweep.
+
+        Parameters:
+        -----------
+        TrainingData:               list
+                                    The training data, where each data point is in the form of [input, target].
+        ValidationData:             list
+                                    The validation data, where each data point is in the form of [input, target].
+        TestingData:                list
+                                    The testing data, where each data point is in the form of [input, target].
+        SearchSpace:                dict
+                                    A dictionary with a list of values per hyperparameter, where the keys are the
+                                    argument names of the CoarseModel constructor (NumberOfHiddenLayers,
+                                    ScalingFactor, and DataType) or of CoarseModel.Train (for example BatchSize and
+                                    LearningRate). A ScalingFactor of None uses the number of input channels of the
+                                    data instead.
+        Filing:                     Filing
+                                    The results that are stored using the Filing class for reading, writing, appending,
+                                    and deleting files.
+        Directory:                  str
+                                    Should the user wish to define a unique directory for the sweep, this should be
+                                    named something meaningful.
+        Debugging:                  bool
+                                    For debugging purposes (developer mode).
+
+        Returns:
+        --------
+        None.
+
+        Notes:
+        ------
+        None.
+        """
+
+        if TrainingData is None or ValidationData is None or TestingData is None or Filing is None:
+            raise Exception('<HyperparameterSweep: __init__: One or more arguments are of None type>')
+
+        self.__training_data__ = TrainingData
+        self.__validation_data__ = ValidationData
+        self.__testing_data__ = TestingData
+
+        if SearchSpace is None:
+            self.__search_space__ = {'NumberOfHiddenLayers': [2, 3, 4],
+                                     'ScalingFactor': [None],
+                                     'BatchSize': [4, 8, 16],
+                                     'LearningRate': [1e-2, 1e-3, 1e-4]}
+        else:
+            self.__search_space__ = SearchSpace
+
+        # Create directory for the sweep
+        if Directory is None:
+            self.__directory__ = 'Sweep'
+        else:
+            self.__directory__ = 'Sweep\\' + Directory
+
+        # Class objects
+        self.__filing__ = Filing
+        self.__filing__.CreateDirectories(Directories=['\\Surrogate\\' + self.__directory__ + '\\'])
+
+        # Create file absolute path(s)
+        self.__files__ = ['\\Surrogate\\' + self.__directory__ + '\\Results']
+
+        # For debugging (developer mode)
+        self.__debugging__ = Debugging
+
+    def Configurations(self, Search='grid', NumberOfSamples=None, Seed=0):
+        """
+        Description:
+        ------------
+        Generates the configurations of the search space, either as the full grid or as a random sample of the grid.
+
+        Parameters:
+        -----------
+        Search:                     str
+                                    Either 'grid' for every combination of the search space, or 'random' for a random
+                                    sample of the combinations.
+        NumberOfSamples:            int
+                                    The number of configurations to sample when Search is 'random'.
+        Seed:                       int
+                                    The seed for sampling the configurations.
+
+        Returns:
+        --------
+        Returns a list of dictionaries, one per configuration, with a value per hyperparameter.
+
+        Notes:
+        ------
+        None.
+        """
+
+        __names__ = list(self.__search_space__.keys())
+        __grid__ = [dict(zip(__names__, __i__))
+                    for __i__ in itertools.product(*[self.__search_space__[__j__] for __j__ in __names__])]
+
+        if Search == 'grid':
+            return __grid__
+
+        if Search == 'random':
+            if NumberOfSamples is None:
+                raise Exception('<HyperparameterSweep: Configurations: NumberOfSamples is of None type>')
+
+            return random.Random(Seed).sample(__grid__, min(NumberOfSamples, len(__grid__)))
+
+        raise Exception(f'<HyperparameterSweep: Configurations: Unknown search {Search}, expected grid or random>')
+
+    def Run(self, Search='grid', NumberOfSamples=None, NumberOfWorkers=None, Seed=0, NumberOfEpochs=None,
+            TrainDurationMinutes=None, Patience=None, TrainArguments=None):
+        """
+        Description:
+        ------------
+        Trains every configuration across a pool of processes, where each configuration is trained with its own seed
+        and directory. The results are ranked by the best validation loss, then by the average testing loss, and saved
+        to the 'Results' file.
+
+        Parameters:
+        -----------
+        Search:                     str
+                                    Either 'grid' or 'random', see the Configurations method.
+        NumberOfSamples:            int
+                                    The number of configurations to sample when Search is 'random'.
+        NumberOfWorkers:            int
+                                    The number of processes to train with, where None uses all the cores.
+        Seed:                       int
+                                    The seed of the first configuration, where configuration n is seeded with Seed + n.
+        NumberOfEpochs:             int
+                                    The number of epochs per configuration, see CoarseModel.Train.
+        TrainDurationMinutes:       float
+                                    The amount of time, in minutes, per configuration, see CoarseModel.Train.
+        Patience:                   int
+                                    The patience for early stopping per configuration, see CoarseModel.Train.
+        TrainArguments:             dict
+                                    Any other keyword arguments for CoarseModel.Train that are shared by every
+                                    configuration.
+
+        Returns:
+        --------
+        Returns the ranked table, where the first row is the column names and the remaining rows are the
+        configurations in the form of [hyperparameter values, seed, number of epochs, validation loss, testing loss,
+        training time in minutes, directory, error]. The losses of a configuration that failed are None, with the
+        reason kept as its error.
+
+        Notes:
+        ------
+        The row of each configuration is appended to the 'Results' file as soon as it finishes, whereafter the file is
+        replaced by the ranked table. A configuration whose worker process crashed, which breaks the pool of
+        processes and thereby fails the configurations that are still pending, is kept as failed with the exception
+        as its error, rather than losing the configurations that did finish.
+        """
+
+        if NumberOfEpochs is None and TrainDurationMinutes is None:
+            raise Exception('<HyperparameterSweep: Run: NumberOfEpochs and TrainDurationMinutes are of None type>')
+
+        __configurations__ = self.Configurations(Search=Search, NumberOfSamples=NumberOfSamples, Seed=Seed)
+        __names__ = list(self.__search_space__.keys())
+        __input_channels__ = len(self.__training_data__[0][0])
+        __output_channels__ = len(self.__training_data__[0][1])
+
+        __jobs__ = []
+        for __index__, __configuration__ in enumerate(__configurations__):
+            __model__ = {'NumberOfOutputChannels': __output_channels__}
+            __train__ = {'TrainingData': self.__training_data__, 'ValidationData': self.__validation_data__,
+                         'TestingData': self.__testing_data__, 'NumberOfEpochs': NumberOfEpochs,
+                         'TrainDurationMinutes': TrainDurationMinutes, 'Patience': Patience}
+            if TrainArguments is not None:
+                __train__.update(TrainArguments)
+
+            # Split the hyperparameters into the constructor and training arguments
+            for __key__, __value__ in __configuration__.items():
+                if __key__ in __model_hyperparameters__:
+                    __model__[__key__] = __value__
+                else:
+                    __train__[__key__] = __value__
+
+            # The scaling factor is derived from the number of input channels if it is not defined
+            if __model__.get('ScalingFactor') is None:
+                __model__.pop('ScalingFactor', None)
+                __model__['NumberOfInputChannels'] = __input_channels__
+
+            __jobs__.append({'Model': __model__, 'Train': __train__, 'Seed': Seed + __index__,
+                             'Directory': self.__directory__ + '\\' + str(__index__),
+                             'Debugging': self.__debugging__})
+
+        def __row__(__i__):
+            # The row of a configuration, where a configuration that failed has no losses
+            __result__ = __results__[__i__]
+            return ([__configurations__[__i__][__j__] for __j__ in __names__] +
+                    [__jobs__[__i__]['Seed'], __result__[0],
+                     __result__[1] if __result__[5] is None else None,
+                     __result__[2] if __result__[5] is None else None,
+                     __result__[3], __jobs__[__i__]['Directory'], __result__[5]])
+
+        __columns__ = __names__ + ['Seed', 'Epochs', 'ValidationNRMSE', 'TestNRMSE', 'TrainMinutes', 'Directory',
+                                   'Error']
+
+        # The rows are appended to the 'Results' file as the configurations finish, so that the finished
+        # configurations are kept should the sweep not finish
+        if self.__filing__.Save(Filename=self.__files__[0], Lists=[__columns__]) == -1:
+            raise Exception(f'<HyperparameterSweep: Run: Unable to save {self.__files__[0]}>')
+
+        # Train the configurations across the pool of processes
+        __results__ = [None for _ in __jobs__]
+        __start__ = time.time() / 60
+        with futures.ProcessPoolExecutor(max_workers=NumberOfWorkers) as __executor__:
+            __pending__ = {__executor__.submit(_train_surrogate, __jobs__[__i__]): __i__
+                           for __i__ in range(len(__jobs__))}
+
+            for __count__, __future__ in enumerate(futures.as_completed(__pending__)):
+                __i__ = __pending__[__future__]
+
+                # A worker that crashed, for instance by running out of memory, breaks the pool, where the
+                # configuration is kept as failed in the same way as a configuration that raised an exception
+                try:
+                    __results__[__i__] = __future__.result()
+
+                except Exception as __error__:
+                    if self.__debugging__:
+                        print(f'<HyperparameterSweep: Run: {__error__}>')
+
+                    __results__[__i__] = [0, float('inf'), float('inf'), time.time() / 60 - __start__, None,
+                                          f'{type(__error__).__name__}: {__error__}']
+
+                if self.__filing__.Append(Filename=self.__files__[0], List=__row__(__i__)) == -1:
+                    raise Exception(f'<HyperparameterSweep: Run: Unable to append configuration {__i__} to '
+                                    f'{self.__files__[0]}>')
+
+                print(f'\r<HyperparameterSweep: Run: {__count__ + 1} of {len(__jobs__)} configurations trained>',
+                      end='')
+        print()
+
+        # Rank the configurations by the validation loss, then the testing loss
+        __order__ = sorted(range(len(__jobs__)), key=lambda __i__: (__results__[__i__][1], __results__[__i__][2]))
+        __table__ = [__columns__] + [__row__(__i__) for __i__ in __order__]
+
+        self.__filing__.Save(Filename=self.__files__[0], Lists=__table__)
+
+        return __table__
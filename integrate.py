@@ -4,6 +4,7 @@ from AntennaDesign.antennaGeometry import ModelGeometry
 from AntennaDesign.simulator import FineModel
 from AntennaDesign.ga import SearchSpaceOptimizer as GA
 from AntennaDesign.surrogate import CoarseModel as surrogate
+from AntennaDesign.dataset import SurrogateDataset
 from AntennaDesign.__init__ import *
 
 # Whether to use genetic algorithm to find an optimal solution or not
@@ -125,54 +126,19 @@ if __name__ == '__main__':
         SSO.Search(SearchTimeMinutes=60 * 24 * 4)
 
     if __train__:
-        __data__ = filing.Read(Filename='\\Surrogate\\lhs0')
+        # Load the windowed and transformed dataset (cached until the file changes)
+        __dataset__ = SurrogateDataset(Filing=filing, Filename='\\Surrogate\\lhs0', FrequencyRange=__train_freq_range__,
+                                       Transforms=['linear', 'sigmoid'], Debugging=True)
 
         # Create training, validation, and testing data sub-sets
-        __s1_train__ = []
-        __s1_validate__ = []
-        __s1_test__ = []
-        __s2_train__ = []
-        __s2_validate__ = []
-        __s2_test__ = []
-        __not_full__ = True
-        while __not_full__:
-            for __i__ in __data__:
-                if len(__s1_train__) < len(__data__) * __train_validate_test_ratio__[0]:
-                    __s1_train__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][0][0])):
-                        if __train_freq_range__[0] <= __i__[1][0][0][__j__] <= __train_freq_range__[1]:
-                            __s1_train__[-1][1].append(10 ** (__i__[1][0][1][__j__] / 20))
-                    __s2_train__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][1][0])):
-                        if __train_freq_range__[0] <= __i__[1][1][0][__j__] <= __train_freq_range__[1]:
-                            __s2_train__[-1][1].append(1 / (1 + np.exp(10 ** (__i__[1][1][1][__j__] / 10))))
-                elif len(__s1_validate__) < len(__data__) * __train_validate_test_ratio__[1]:
-                    __s1_validate__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][0][0])):
-                        if __train_freq_range__[0] <= __i__[1][0][0][__j__] <= __train_freq_range__[1]:
-                            __s1_validate__[-1][1].append(10 ** (__i__[1][0][1][__j__] / 20))
-                    __s2_validate__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][1][0])):
-                        if __train_freq_range__[0] <= __i__[1][1][0][__j__] <= __train_freq_range__[1]:
-                            __s2_validate__[-1][1].append(1 / (1 + np.exp(10 ** (__i__[1][1][1][__j__] / 10))))
-                else:
-                    __s1_test__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][0][0])):
-                        if __train_freq_range__[0] <= __i__[1][0][0][__j__] <= __train_freq_range__[1]:
-                            __s1_test__[-1][1].append(10 ** (__i__[1][0][1][__j__] / 20))
-                    __s2_test__.append([copy.deepcopy(__i__[0]), []])
-                    for __j__ in range(len(__i__[1][1][0])):
-                        if __train_freq_range__[0] <= __i__[1][1][0][__j__] <= __train_freq_range__[1]:
-                            __s2_test__[-1][1].append(1 / (1 + np.exp(10 ** (__i__[1][1][1][__j__] / 10))))
-
-            if len(__data__) == (len(__s1_train__) + len(__s1_validate__) + len(__s1_test__)):
-                __not_full__ = False
+        __s1_train__, __s1_validate__, __s1_test__ = __dataset__.Split(Ratio=__train_validate_test_ratio__, Response=0)
+        __s2_train__, __s2_validate__, __s2_test__ = __dataset__.Split(Ratio=__train_validate_test_ratio__, Response=1)
 
         # Initialize the surrogates (return loss surrogate and gain surrogate)
-        __surrogate_1__ = surrogate(NumberOfHiddenLayers=3, NumberOfInputChannels=len(__data__[0][0]),
+        __surrogate_1__ = surrogate(NumberOfHiddenLayers=3, NumberOfInputChannels=len(__s1_train__[0][0]),
                                     NumberOfOutputChannels=len(__s1_train__[0][1]), Filing=filing,
                                     Directory='return loss', Debugging=True)
-        __surrogate_2__ = surrogate(NumberOfHiddenLayers=3, NumberOfInputChannels=len(__data__[0][0]),
+        __surrogate_2__ = surrogate(NumberOfHiddenLayers=3, NumberOfInputChannels=len(__s2_train__[0][0]),
                                     NumberOfOutputChannels=len(__s2_train__[0][1]), Filing=filing,
                                     Directory='gain', Debugging=True)
 
@@ -218,7 +184,7 @@ if __name__ == '__main__':
 
     if not __train__:
         # Surrogate modeling
-        __raw_data__ = filing.Read(Filename='\\SSO\\E-Shape\\Best')[0]
+        __raw_data__ = next(filing.ReadIter(Filename='\\SSO\\E-Shape\\Best'))
 
         __parameters__ = [[21.5 - 0.5, 21.5 + 0.5], [11 - 0.5, 11 + 0.5], [9 - 0.5, 9 + 0.5], [4 - 0.5, 4 + 0.5]]
         __return_loss__ = __raw_data__[1][0]
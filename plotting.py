@@ -14,13 +14,12 @@ plt.rcParams['font.style'] = 'normal'
 
 if __name__ == '__main__':
     filing = Filing(Debugging=True)
-    data = filing.Read(Filename='\\Surrogate\\lhs0')
     max_alpha = 0
     result = []
     result1 = []
     fig0, ax0 = plt.subplots(1, 2)
 
-    for __i__ in data:
+    for __i__ in filing.ReadIter(Filename='\\Surrogate\\lhs0'):
         if __use_alpha__:
             ax0[0].plot(__i__[1][0][0], [10 ** (__j__ / 20) for __j__ in __i__[1][0][1]])
             ax0[1].plot(__i__[1][1][0], [1 / (1 + np.exp(-10 ** (__j__ / 10))) for __j__ in __i__[1][1][1]])
@@ -42,7 +41,7 @@ if __name__ == '__main__':
     figManager.window.showMaximized()
     plt.show()
     refined_data = []
-    for __i__ in data:
+    for __i__ in filing.ReadIter(Filename='\\Surrogate\\lhs0'):
         refined_data.append([__i__[0], []])
         __j__ = 0
         while __j__ < len(__i__[1][0][0]):